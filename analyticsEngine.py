@@ -38,6 +38,14 @@ Instructions:
         d) Clear MatPlotLib font cache by deleting the cache file (fontlist.json, likely stored in `Users/{user}/.matplotlib`)
     4) Add a bulk upload file to the working directory
     5) Run the following command: `python analyticsEngine.py "{path to file from root directory}"`
+        a) (Optional) Add `--sections {section names}` to only load the columns of the given report sections (see `bulkUploadLoader.SECTION_COLUMNS`)
+        b) (Optional) Add `--engine pyarrow` to load the file with PyArrow (requires `pip install pyarrow`)
+        c) (Optional) Add `--processes {number}` to compute the tables and graphs with the given number of threads and processes
+        d) (Optional) Add `--map-backend pil` to draw the location maps from the cached map tiles with PIL, skipping Plotly and Kaleido
+        e) (Optional) Add `--profile` to save the time and memory of each stage as `profile.json` (renders the graphs in a single process)
+        f) (Optional) Add `--silent {function names}` to skip the given tables, graphs, and text fields, along with the tables only they read
+        g) (Optional) Add `--no-cache` to compute every table and graph, rather than reusing the unchanged ones of an earlier run
+        h) (Optional) Add `--vector` to save the graphs as vector images (SVG) rather than PNGs
     -----
     6) POTENTIAL FONT ERROR: `findfont: Font family `Roobert Medium` not found`.
         a) Navigate to the MatPlotLib font cache file (fontlist.json, likely stored in `Users/{user}/.matplotlib`)
@@ -71,7 +79,7 @@ Instructions:
 Desired Output:
     * A folder will be created with the name `data_{bulk upload file name}`, containing the directories `csvs`, `images`, and `resources`, as well as the bulk upload file.
     * Within `csvs`, a copy of all dataframes generated will be stored in CSV format.
-    * Within `images`, a copy of all graphs generated will be stored in PNG format.
+    * Within `images`, a copy of all graphs generated will be stored in PNG format (SVG with `--vector`).
     * Within `resources`, a copy of all generation data will be stored in CSV/JSON format.
 
 Still have questions? Send an email to `arman@vivery.org` with the subject line `Analytics Engine API - {question}`. 
@@ -81,84 +89,1126 @@ Still have questions? Send an email to `arman@vivery.org` with the subject line
 # PACKAGE IMPORTS
 import pandas as pd                     # Pandas, used to represent CSVs and large data sets as a DataFrame.
 import numpy as np                      # NumPy, adds Arrays to python and enables large arithmatic operations.
-import matplotlib.pyplot as plt         # MatPlotLib's PyPlot, used to graph data sets and create data visualizations.
 import argparse, os, glob, shutil       # Argparse, OS, Glob, and Shutil, used for File Manipulation and the Command Line Interface
-import plotly.graph_objects as go       # Plotly, used to create the map object using the MapBox API.
 import json                             # JSON, used to parse JSON files and convert to Dictionary data types.
 import math                             # Math, used for basic mathematical operations.
-from PIL import Image                   # Image, used to handle varius tasks with Image files like PNGs.
+import io                               # IO, used to read the cached map tiles as images.
 import datetime, calendar               # Datetime and Calendar, used to handle date related tasks and allows python to have access to real world calendar data.
+import functools, weakref               # Functools and Weakref, used to memoize the table functions against the lifetime of their input DataFrame.
+import concurrent.futures, threading    # Concurrent Futures and Threading, used to compute the report graph on pools of worker threads and processes.
+import sys                              # Sys, used to profile the stages of the Analytics Engine when run as a script.
+import inspect, ast                     # Inspect and AST, used to hash the source code and TEXT sections of each artifact of the report.
+import re                               # Regex, used to read the size of the vector graphs.
 
 # LOCAL FILE IMPORTS
+import bulkUploadLoader as bul          # BulkUploadLoader, used to load the Bulk Upload Data File with a typed and pruned schema.
+import tileCache as tc                  # TileCache, used to serve the cached map tiles drawn beneath the location maps.
+import stageProfiler as sp              # StageProfiler, used to measure the time and memory of each stage of the report.
+import artifactCache as ac              # ArtifactCache, used to reuse the tables, graphs, and text fields of a report across runs.
+import filterMatrix as fm               # FilterMatrix, used to parse the sub-filter columns once into a sparse matrix of locations by sub-filters.
+import resourceRegistry as rr           # ResourceRegistry, used to defer the plotting imports and to share the resource files with the pdfWizard.
+
+# LAZY PACKAGE IMPORTS (imported on first use, so table-only runs never import them)
+plt = rr.LazyImport("matplotlib.pyplot")                                                                       # MatPlotLib's PyPlot, used to graph data sets and create data visualizations.
+go = rr.LazyImport("plotly.graph_objects")                                                                     # Plotly, used to create the map object using the MapBox API.
+Image = rr.LazyImport("PIL.Image")                                                                             # Image, used to handle varius tasks with Image files like PNGs.
+ImageDraw = rr.LazyImport("PIL.ImageDraw")                                                                     # ImageDraw, used to draw the static maps.
 
 
 # IMPORT CONSTANTS
-from keys import PK, SK                                                                                         # PK and SK, used for the MapBoxAPI; stored in the API Key File 'keys'.
+TILE_PROVIDER = tc.TileProvider("mapbox", tc.TILE_PROVIDERS["mapbox"], token=functools.partial(rr.get_api_key, "PK"))    # TILE_PROVIDER, used to fetch and cache the map tiles; cached in the folder, 'resources/tiles/mapbox'; PK is read from the API Key File 'keys' when a tile is first fetched.
 TEXT_SAVE_NAME = "resources/text.json"                                                                          # Path to TEXT save file (JSON).
-with open(TEXT_SAVE_NAME) as file: TEXT = json.load(file)                                                       # TEXT, used for all of the text in the PDF report; stored in the file, 'resources/text.json'.
+TEXT = rr.copy_resource(TEXT_SAVE_NAME)                                                                         # TEXT, used for all of the text in the PDF report; stored in the file, 'resources/text.json'.
 WEIGHTS_SAVE_NAME = "resources/weights.json"                                                                    # Path to WEIGHTS save file (JSON).
-with open(WEIGHTS_SAVE_NAME) as file: WEIGHTS = json.load(file)                                                 # WEIGHTS, used for the weightage of each column in the profile completion grades; stored in the file, 'resources/weights.json'.
+WEIGHTS = rr.get_resource(WEIGHTS_SAVE_NAME)                                                                    # WEIGHTS, used for the weightage of each column in the profile completion grades; stored in the file, 'resources/weights.json'.
 RECOMMENDED_FILTERS_SAVE_NAME = 'resources/recommended_filters.csv'                                             # Path to Recommended Filters (CSV).
-RECOMMENDED_FILTERS = pd.read_csv(RECOMMENDED_FILTERS_SAVE_NAME)                                                # RECOMMENDED_FILTERS, used to store the recommended filters for locations and programs, stored in the file, 'resources/recommended_filters.csv'
+RECOMMENDED_FILTERS = rr.get_resource(RECOMMENDED_FILTERS_SAVE_NAME)                                            # RECOMMENDED_FILTERS, used to store the recommended filters for locations and programs, stored in the file, 'resources/recommended_filters.csv'
 PROFILE_COMPLETION_TIERS_SAVE_NAME = 'resources/profile_completion_tiers.csv'                                   # Path to Profile Completion Tiers (CSV).
-PROFILE_COMPLETION_TIERS = pd.read_csv(PROFILE_COMPLETION_TIERS_SAVE_NAME)                                      # PROFILE_COMPLETION_TIERS, used to store the profile completion tiers for locations, stored in the file, 'resources/profile_completion_tiers.csv'
+PROFILE_COMPLETION_TIERS = rr.get_resource(PROFILE_COMPLETION_TIERS_SAVE_NAME)                                  # PROFILE_COMPLETION_TIERS, used to store the profile completion tiers for locations, stored in the file, 'resources/profile_completion_tiers.csv'
+
+# MISC CONSTANTS
+HOURS_COLUMNS = ['Hours Entity Type', 'Day of Week', 'Hours Open 1', 'Hours Closed 1', 'Hours Open 2', 'Hours Closed 2', 'Hours Open 3', 'Hours Closed 3', 'Hours Note',
+                 'Week of Month', 'Day of Month', 'Frequency', 'Specific Date', 'Specific Date Closed Indicator', 'Specific Date Reason']    # The hours columns of the bulk upload, stored in the hours table of the entity store.
+ENTITY_KEYS = {"organizations": "Organization Key", "locations": "Location Key", "programs": "Program Key"}     # A dictionary, used to map each entity table of the entity store to its surrogate key.
+MAP_SIZE = (624, 403)                                                                                           # The width and height of the location maps in pixels.
+TILE_SIZE = 256                                                                                                 # The width and height of a map tile in pixels.
+MARKER_SIZE = 8                                                                                                 # The diameter of the location markers in pixels.
+VECTOR_FORMAT = "svg"                                                                                           # The format of the graphs saved as vector images.
+SVG_SIZE_PATTERN = re.compile(rb'<svg[^>]*?\swidth="([\d.]+)[a-z]*"[^>]*?\sheight="([\d.]+)[a-z]*"')        # A pattern, used to read the width and height of a vector graph from its root element.
+MAP_SCOPE_KEY = {0: 12, 0.1: 10, 0.2: 9, 0.4: 8, 1.5: 7, 4.5: 6, 6: 5, 7: 4, 25: 3, 32: 2, 70: 1}               # A dictionary, used to map the difference between the max/min lon/lat values to map scopes.
+
+# COLOURS
+VIVERY_GREEN = '#00483D'                                                                                        # A colour in the Vivery colour scheme.
+VIRIDIAN = '#5F9575'                                                                                            # A colour in the Vivery colour scheme.
+SAGE = '#A2C3A8'                                                                                                # A colour in the Vivery colour scheme.
+SALMON = '#D4A392'                                                                                              # A colour in the Vivery colour scheme.
+WARM_WHITE = '#FAF9F6'                                                                                          # A colour in the Vivery colour scheme.
+NEON_LIME = '#BBD98D'                                                                                           # A colour in the Vivery colour scheme.
+NEON_BLUE = '#8CCFB6'                                                                                           # A colour in the Vivery colour scheme.
+
+# STYLES
+AXES_LABEL_FONT_DICT = {'family': 'Roobert Medium', 'color':  VIVERY_GREEN, 'weight': 'bold', 'size': 16}       # A Dictionary used to style the pyplot axes text.
+PIE_SLICE_FONT_DICT = {'family': 'Roobert Medium', 'color':  VIVERY_GREEN, 'weight': 'bold', 'size': 16}        # A Dictionary used to style the pyplot axes text.
+
+# REPORT GRAPH
+REPORT_GRAPH = {
+    "build_entity_store": [],
+    "parse_hours": ["build_entity_store"],
+    "create_sub_filter_matrix": ["build_entity_store"],
+    "create_network_overview_table": ["build_entity_store"],
+    "create_program_profile_completion_table": ["build_entity_store"],
+    "create_highest_graded_profiles_table": ["create_program_profile_completion_table"],
+    "create_lowest_graded_profiles_table": ["create_program_profile_completion_table"],
+    "create_high_low_graded_profiles_table": ["create_highest_graded_profiles_table", "create_lowest_graded_profiles_table"],
+    "create_recommended_filters_slice": [],
+    "create_recommended_program_filters_table": [],
+    "create_profile_completion_tiers_table": [],
+    "create_program_category_field_weights": [],
+    "create_hour_type_usage_table": ["build_entity_store"],
+    "create_organization_table": ["build_entity_store"],
+    "create_location_table": ["build_entity_store"],
+    "create_program_table": ["build_entity_store"],
+    "create_organization_contact_information_table": ["build_entity_store"],
+    "create_location_contact_information_table": ["build_entity_store"],
+    "create_program_contact_information_table": ["build_entity_store"],
+    "create_program_by_program_type_table": ["build_entity_store"],
+    "create_program_by_program_audience_table": ["build_entity_store"],
+    "create_program_by_program_languages_spoken_table": ["build_entity_store"],
+    "create_program_by_program_features_table": ["build_entity_store"],
+    "create_program_by_program_items_offered_table": ["build_entity_store"],
+    "create_program_by_program_dietary_options_table": ["build_entity_store"],
+    "create_location_hours_table": ["build_entity_store"],
+    "create_program_hours_table": ["build_entity_store"],
+    "create_program_by_program_qualifications_table": ["build_entity_store"],
+    "create_program_by_program_service_area_table": ["build_entity_store"],
+    "create_program_sub_filter_usage_table": ["create_sub_filter_matrix"],
+    "create_program_sub_filter_usage_table_group_a": ["create_program_sub_filter_usage_table"],
+    "create_program_sub_filter_usage_table_group_b": ["create_program_sub_filter_usage_table"],
+    "create_program_sub_filter_usage_table_group_c": ["create_program_sub_filter_usage_table"],
+    "create_program_sub_filter_usage_table_group_d": ["create_program_sub_filter_usage_table"],
+    "create_program_sub_filter_usage_table_group_e": ["create_program_sub_filter_usage_table"],
+    "create_most_used_sub_filter_table": ["create_sub_filter_matrix"],
+    "create_map": [],
+    "create_zoomed_map": [],
+    "graph_profile_grade": ["create_program_profile_completion_table"],
+    "graph_missing_organization_contact_info": ["create_organization_contact_information_table"],
+    "graph_missing_location_contact_info": ["create_location_contact_information_table"],
+    "graph_missing_program_contact_info": ["create_program_contact_information_table"],
+    "graph_program_type": ["create_program_by_program_type_table"],
+    "graph_food_program_breakdown": ["create_program_by_program_type_table"],
+    "graph_program_filter_usage": [],
+    "graph_network_hours_overview": ["create_location_hours_table", "create_program_hours_table"],
+    "graph_sample_location_hours_current_month": ["parse_hours"],
+    "graph_sample_location_hours_next_month": ["parse_hours"],
+    "graph_sample_program_hours_current_month": ["parse_hours"],
+    "graph_sample_program_hours_next_month": ["parse_hours"],
+    "graph_program_qualifications": ["create_program_by_program_qualifications_table", "create_program_table"],
+    "graph_program_service_areas": ["create_program_by_program_service_area_table", "create_program_table"],
+    "calculate_percent_locations_inactive": ["create_network_overview_table"],
+    "calculate_locations_programs_without_contact": ["create_location_contact_information_table", "create_program_contact_information_table"],
+    "calculate_food_distribution_program_percent": ["create_program_by_program_type_table"],
+    "calculate_least_used_programs": [],
+    "calculate_current_next_month": []
+}                                                                                                               # A dictionary, used to map each node of the report (a table, graph, or text field) to the nodes it reads.
+REPORT_TEXT_FIELDS = {
+    "calculate_percent_locations_inactive": ("NETWORK OVERVIEW", "paragraph"),
+    "calculate_locations_programs_without_contact": ("PUBLIC CONTACT INFORMATION", "paragraph"),
+    "calculate_food_distribution_program_percent": ("PROGRAM TYPES", "paragraph two"),
+    "calculate_least_used_programs": ("PROGRAM FILTER FIELDS", "paragraph"),
+    "calculate_current_next_month": ("LOCATION HOURS PREVIEW", "paragraph")
+}                                                                                                               # A dictionary, used to map each text field node of the report to the section and field of TEXT it fills.
+REPORT_MONTHLY_NODES = ["graph_sample_location_hours_current_month", "graph_sample_location_hours_next_month", "graph_sample_program_hours_current_month",
+                        "graph_sample_program_hours_next_month", "calculate_current_next_month"]                # The nodes of the report that depend on the current month, cached for one month at a time.
+REPORT_CONTENT_NODES = ["create_highest_graded_profiles_table", "create_lowest_graded_profiles_table", "create_high_low_graded_profiles_table", "create_program_sub_filter_usage_table_group_a",
+                        "create_program_sub_filter_usage_table_group_b", "create_program_sub_filter_usage_table_group_c", "create_program_sub_filter_usage_table_group_d",
+                        "create_program_sub_filter_usage_table_group_e", "graph_profile_grade", "graph_missing_organization_contact_info", "graph_missing_location_contact_info",
+                        "graph_missing_program_contact_info", "graph_program_type", "graph_food_program_breakdown", "graph_network_hours_overview", "graph_sample_location_hours_current_month",
+                        "graph_sample_location_hours_next_month", "graph_sample_program_hours_current_month", "graph_sample_program_hours_next_month", "graph_program_qualifications",
+                        "graph_program_service_areas", "calculate_percent_locations_inactive", "calculate_locations_programs_without_contact",
+                        "calculate_food_distribution_program_percent"]                                          # The nodes of the report that read the bulk upload only through the nodes they depend on, also cached on the results of those nodes.
+REPORT_DIRECTORY_PLACEHOLDER = "{directory}"                                                                    # Stands in for the report directory in the cached paths of the graphs.
+
+# CACHES
+TABLE_CACHE = {}                                                                                                # A dictionary, used to memoize the create_* tables; keyed on the id of the input DataFrame.
+RENDER_STATE = {}                                                                                               # A dictionary, used to hold the DataFrame and directory shared by the graphs rendered in a worker process.
+TABLE_CACHE_LOCK = threading.Lock()                                                                             # A lock, used to create the TABLE_CACHE entry of a DataFrame once when its tables are computed on many threads.
+FIGURE_STORE = {}                                                                                               # A dictionary, used to hold the rendered graphs and maps in memory as image bytes; keyed on the path to each graph.
+FIGURE_WRITER = concurrent.futures.ThreadPoolExecutor(max_workers=1)                                            # A worker thread, used to write the rendered graphs into the report directory without holding up the report.
+FIGURE_WRITES = []                                                                                              # A list, used to hold the pending writes of FIGURE_WRITER until they are waited on.
+
+
+
+
+# HELPERS
+def memoize_table(function):
+    """
+    Memoizes a table function so that each table is computed at most once per input DataFrame.
+
+    Args:
+        `function` (function): The table function to be memoized. It must accept a DataFrame as its only argument and return a DataFrame.
+
+    Returns:
+        `function`: A wrapped version of `function` that caches its result in `TABLE_CACHE`.
+
+    Preconditions:
+        - The wrapped function must not modify its input DataFrame.
+
+    Raises:
+        None.
+
+    Example:
+        >>> @memoize_table
+        ... def create_example_table(df: pd.DataFrame) -> pd.DataFrame:
+        ...     return df.drop_duplicates()
+        >>> create_example_table(data)      # Computed
+        >>> create_example_table(data)      # Served from TABLE_CACHE
+
+    Additional Information:
+        - Entries are keyed on the identity of the input DataFrame, and validated against a fingerprint of its shape and column headers.
+        - A weak reference to the input DataFrame is held, so the entries are dropped as soon as the DataFrame is garbage collected.
+        - A copy of the cached table is returned on every call, so callers are free to modify the result.
+        - Arguments which are not DataFrames (such as the `_` placeholder used by the resource tables) bypass the cache.
+        - The cache does not detect in-place edits to the values of a DataFrame; call `clear_table_cache` after modifying a DataFrame in place.
+    """
+    @functools.wraps(function)
+    def memoized_function(df, *args, **kwargs):
+        if not isinstance(df, pd.DataFrame) or args or kwargs:
+            return function(df, *args, **kwargs)
+        frame_entry = get_table_cache_entry(df)
+        if function.__name__ not in frame_entry["tables"]:
+            frame_entry["tables"][function.__name__] = function(df)
+        return frame_entry["tables"][function.__name__].copy()
+    return memoized_function
+
+
+def get_table_cache_entry(df: pd.DataFrame) -> dict:
+    """
+    Returns the `TABLE_CACHE` entry of a DataFrame, creating it if the DataFrame has no valid entry.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame whose tables are memoized.
+
+    Returns:
+        `dict`: A dictionary containing a weak reference to the DataFrame (`ref`), its fingerprint (`fingerprint`), and its memoized tables (`tables`), keyed on the name of each table function.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_table_cache_entry(data)["tables"].keys()
+        dict_keys(['build_entity_store', 'create_location_table'])
+
+    Additional Information:
+        - The entry is created under `TABLE_CACHE_LOCK`, so tables computed on many threads share one entry.
+    """
+    frame_key = id(df)
+    fingerprint = (df.shape, tuple(df.columns))
+    with TABLE_CACHE_LOCK:
+        frame_entry = TABLE_CACHE.get(frame_key)
+        if frame_entry is None or frame_entry["ref"]() is not df or frame_entry["fingerprint"] != fingerprint:
+            def release(ref, key=frame_key):
+                if key in TABLE_CACHE and TABLE_CACHE[key]["ref"] is ref:
+                    del TABLE_CACHE[key]
+            frame_entry = {"ref": weakref.ref(df, release), "fingerprint": fingerprint, "tables": {}}
+            TABLE_CACHE[frame_key] = frame_entry
+    return frame_entry
+
+
+def clear_table_cache(df: pd.DataFrame=None) -> None:
+    """
+    Invalidates the memoized tables held in `TABLE_CACHE`.
+
+    Args:
+        `df` (pd.DataFrame) [kwargg]: The DataFrame whose tables should be invalidated, defaulted to None (invalidate every DataFrame).
+
+    Returns:
+        None.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> create_location_table(data)
+        >>> data.loc[0, 'Location Name'] = 'Greendale Library'
+        >>> clear_table_cache(data)
+        >>> create_location_table(data)     # Recomputed with the new Location Name
+
+    Additional Information:
+        - Must be called after a DataFrame is modified in place, as the cache fingerprint only covers the shape and column headers.
+        - Called at the end of a report to release the cached tables.
+    """
+    if df is None:
+        TABLE_CACHE.clear()
+    else:
+        TABLE_CACHE.pop(id(df), None)
+    return
+
+
+@memoize_table
+def build_entity_store(df: pd.DataFrame) -> dict:
+    """
+    Splits a bulk upload into deduplicated organization, location, and program tables and an hours table, linked by integer surrogate keys.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame containing the bulk upload data.
+
+    Returns:
+        `dict`: A dictionary of DataFrames, keyed by `organizations`, `locations`, `programs`, and `hours`.
+
+    Preconditions:
+        - The DataFrame `df` must be a bulk upload, with one row per organization, location, program, and hours record.
+
+    Raises:
+        None.
+
+    Example:
+        >>> store = build_entity_store(data)
+        >>> store["locations"][["Location Key", "Organization Key", "Location External ID", "Location Name"]]
+            Location Key    Organization Key    Location External ID    Location Name
+        0       0               0                   1992                    Greendale South Cafeteria
+        1       1               0                   1993                    Greendale North Cafeteria
+
+    Additional Information:
+        - Each distinct set of `Organization X`, `Location X`, and `Program X` values is stored once, and keyed in order of first appearance (the key is the row position).
+        - The location and program tables also hold the keys of the organization (and location) they first appear with.
+        - The hours table holds one row per bulk upload row (keeping the index of `df`), with the keys of its organization, location, and program.
+        - The columns in `HOURS_COLUMNS` are stored in the hours table, and any other columns (such as the `sub-filter` columns) in the program table.
+        - The tables are shared between callers through `memoize_table`, so they must not be modified in place.
+    """
+    hours_columns = [column for column in df.columns if column in HOURS_COLUMNS]
+    organization_columns = [column for column in df.columns if column.startswith("Organization ")]
+    location_columns = [column for column in df.columns if column.startswith("Location ")]
+    program_columns = [column for column in df.columns if column not in hours_columns + organization_columns + location_columns]
+    keys = pd.DataFrame(index=df.index)
+    for key, columns in [("Organization Key", organization_columns), ("Location Key", location_columns), ("Program Key", program_columns)]:
+        keys[key] = df.groupby(columns, sort=False, dropna=False, observed=True).ngroup() if columns else 0
+    store = {
+        "organizations": pd.concat([keys[["Organization Key"]], df[organization_columns]], axis=1).loc[~keys["Organization Key"].duplicated()].reset_index(drop=True),
+        "locations": pd.concat([keys[["Location Key", "Organization Key"]], df[location_columns]], axis=1).loc[~keys["Location Key"].duplicated()].reset_index(drop=True),
+        "programs": pd.concat([keys[["Program Key", "Location Key", "Organization Key"]], df[program_columns]], axis=1).loc[~keys["Program Key"].duplicated()].reset_index(drop=True),
+        "hours": pd.concat([keys[["Organization Key", "Location Key", "Program Key"]], df[hours_columns]], axis=1)
+    }
+    return store
+
+
+def get_entity_rows(df: pd.DataFrame, entities: list, columns: list=None) -> pd.DataFrame:
+    """
+    Joins the tables of the entity store, returning each distinct combination of the entities found in the bulk upload.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame containing the bulk upload data.
+        `entities` (list): A list of entity tables to join, from `hours`, `programs`, `locations`, and `organizations`.
+        `columns` (list) [kwargg]: A list of the columns to join, defaulted to None (every column of the entities).
+
+    Returns:
+        `pd.DataFrame`: A DataFrame with one row per distinct combination of the entities (or per bulk upload row if `hours` is joined), holding the keys and columns of each entity.
+
+    Preconditions:
+        - The DataFrame `df` must be a bulk upload, with one row per organization, location, program, and hours record.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_entity_rows(data, ["programs", "locations"], columns=["Program External ID", "Location External ID"])
+            Location Key    Program Key     Program External ID     Location External ID
+        0       0               0               PANTRY03                1992
+        1       1               1               PANTRY04                1993
+        ...
+
+    Additional Information:
+        - The rows are in order of first appearance in the bulk upload.
+        - The entity columns are gathered by key (the key is the row position of each entity table) rather than merged.
+        - Used in place of the full bulk upload when a table reads the columns of more than one entity on the same row.
+    """
+    store = build_entity_store(df)
+    keys = [ENTITY_KEYS[entity] for entity in entities if entity != "hours"]
+    if "hours" in entities:
+        new_df = store["hours"][list(ENTITY_KEYS.values()) + [column for column in store["hours"].columns if column not in ENTITY_KEYS.values() and (columns is None or column in columns)]].copy()
+    else:
+        new_df = store["hours"][keys].drop_duplicates().reset_index(drop=True)
+    for entity in entities:
+        if entity == "hours":
+            continue
+        for column in store[entity].columns:
+            if column not in ENTITY_KEYS.values() and (columns is None or column in columns):
+                new_df[column] = store[entity][column].values[new_df[ENTITY_KEYS[entity]].values]
+    return new_df
+
+
+def save_graph(file_name: str, directory: str, dpi: int, vector: bool=False) -> str:
+    """
+    Saves the active PyPlot as an image in `FIGURE_STORE`.
+
+    Args:
+        `file_name` (str): The name for the file to be saved as.
+        `directory` (str): The name of the directory for the file to be saved in.
+        `dpi` (int): The DPI (resolution) to save the image in.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG), defaulted to False.
+
+    Returns:
+        `str`: A string containing the path the graph is stored under, from the root directory.
+
+    Preconditions:
+        - A PyPlot must be active.
+
+    Raises:
+        None.
+
+    Example:
+        >>> save_graph('plot.png', 'output', dpi=300)
+        'output/images/plot.png'
+        >>> save_graph('plot.png', 'output', dpi=300, vector=True)
+        'output/images/plot.svg'
+
+    Additional Information:
+        - The file's format is specified by the extension of the `file_name` argument, replaced by `.svg` for a vector graph.
+        - The file's size is specified by the `dpi` argument; a vector graph is drawn at any size, and only its raster elements use the `dpi`.
+        - A graph holding raster images (such as `imshow`) is saved as a PNG even if `vector`, as the pdfConstructor cannot embed the images of an SVG.
+        - The SVG is saved without a date and with ids salted on the file name, so a graph drawn twice is saved byte for byte the same.
+        - The graph is rendered into memory rather than onto disk; it is written into the directory by `save_figure`.
+    """
+    figure = plt.gcf()
+    if vector and not figure.images and not any(axes.images for axes in figure.axes):
+        file_name = os.path.splitext(file_name)[0] + "." + VECTOR_FORMAT
+    image_format = os.path.splitext(file_name)[1][1:]
+    image = io.BytesIO()
+    with plt.rc_context({"svg.hashsalt": file_name}):
+        plt.savefig(image, format=image_format, dpi=dpi, bbox_inches='tight', **({"metadata": {"Date": None}} if image_format == VECTOR_FORMAT else {}))
+    plt.close()
+    return store_figure(directory + "/images/" + file_name, image.getvalue())
+
+
+def store_figure(filepath: str, image: bytes) -> str:
+    """
+    Holds a rendered graph in `FIGURE_STORE`.
+
+    Args:
+        `filepath` (str): The path of the graph, from the root directory.
+        `image` (bytes): The image of the graph, or None for a graph that is not rendered (such as a resource image).
+
+    Returns:
+        `str`: The path of the graph.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> store_figure("data_sample_dataset/images/map.png", image)
+        'data_sample_dataset/images/map.png'
+
+    Additional Information:
+        - Any graph previously stored under the path is replaced.
+    """
+    if image is not None:
+        FIGURE_STORE[filepath] = image
+    return filepath
+
+
+def get_figure(filepath: str) -> io.BytesIO:
+    """
+    Returns a rendered graph, from `FIGURE_STORE` or, failing that, from disk.
+
+    Args:
+        `filepath` (str): The path of the graph, from the root directory.
+
+    Returns:
+        `io.BytesIO`: A file-like object holding the image of the graph.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `FileNotFoundError`: If the graph is neither stored nor saved on disk.
+
+    Example:
+        >>> Image.open(get_figure("data_sample_dataset/images/map.png")).size
+        (624, 403)
+
+    Additional Information:
+        - The images that are not rendered by the Analytics Engine (such as `resources/images/null_graph.png`) are read from disk.
+    """
+    if filepath in FIGURE_STORE:
+        return io.BytesIO(FIGURE_STORE[filepath])
+    with open(filepath, "rb") as file:
+        return io.BytesIO(file.read())
+
+
+def get_figure_size(image: io.BytesIO) -> tuple:
+    """
+    Returns the width and height of a graph.
+
+    Args:
+        `image` (io.BytesIO): The image of the graph, as returned by `get_figure`.
+
+    Returns:
+        `tuple`: A tuple of the width and height of the graph; in pixels for a raster graph, and in points for a vector graph.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `PIL.UnidentifiedImageError`: If the image is neither an SVG nor an image PIL can read.
+
+    Example:
+        >>> get_figure_size(get_figure("data_sample_dataset/images/map.png"))
+        (624, 403)
+
+    Additional Information:
+        - The size of an SVG is read from its root element, so the SVG is not parsed; only the ratio of the width and height is used to place the graph.
+        - The image is rewound, so it can be read again.
+    """
+    header = image.getvalue()[:2048]
+    match = SVG_SIZE_PATTERN.search(header) if header.startswith(b"<") else None
+    if match:
+        return float(match.group(1)), float(match.group(2))
+    size = Image.open(image).size
+    image.seek(0)
+    return size
+
+
+def write_figure(filepath: str, image: bytes) -> None:
+    """
+    Writes the image of a graph to disk.
+
+    Args:
+        `filepath` (str): The path of the graph, from the root directory.
+        `image` (bytes): The image of the graph.
+
+    Returns:
+        None.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `OSError`: If the file cannot be written.
+
+    Example:
+        >>> write_figure("data_sample_dataset/images/map.png", image)
+
+    Additional Information:
+        - The image is written to a temporary file and moved into place, so a report never reads a half-written graph.
+    """
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    with open(filepath + ".tmp", "wb") as file:
+        file.write(image)
+    os.replace(filepath + ".tmp", filepath)
+    return
+
+
+def save_figure(filepath: str) -> None:
+    """
+    Writes a graph of `FIGURE_STORE` to disk on the `FIGURE_WRITER` thread.
+
+    Args:
+        `filepath` (str): The path of the graph, from the root directory.
+
+    Returns:
+        None.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> save_figure("data_sample_dataset/images/map.png")
+
+    Additional Information:
+        - Returns as soon as the write is queued; call `wait_for_figures` before reading the directory.
+        - Paths not held in `FIGURE_STORE` (such as `resources/images/null_graph.png`) are already on disk, and are skipped.
+    """
+    if filepath in FIGURE_STORE:
+        FIGURE_WRITES.append(FIGURE_WRITER.submit(write_figure, filepath, FIGURE_STORE[filepath]))
+    return
+
+
+def wait_for_figures() -> None:
+    """
+    Waits for the graphs queued by `save_figure` to be written to disk.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `OSError`: If a graph could not be written.
+
+    Example:
+        >>> wait_for_figures()
+    """
+    while FIGURE_WRITES:
+        FIGURE_WRITES.pop(0).result()
+    return
+
+
+def clear_figures(directory: str=None) -> None:
+    """
+    Drops the graphs of a report directory from `FIGURE_STORE`.
+
+    Args:
+        `directory` (str) [kwargg]: The name of the directory of the report, defaulted to None (every report).
+
+    Returns:
+        None.
+
+    Preconditions:
+        - The queued writes of the graphs must be waited on first (see `wait_for_figures`).
+
+    Raises:
+        None.
+
+    Example:
+        >>> clear_figures("data_sample_dataset")
+    """
+    for filepath in [filepath for filepath in FIGURE_STORE if directory is None or filepath.startswith(directory + "/")]:
+        del FIGURE_STORE[filepath]
+    return
+
+
+def initialize_render_worker(df: pd.DataFrame, directory: str) -> None:
+    """
+    Prepares a worker process of the graph rendering pool.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame shared by every graph rendered in the worker process.
+        `directory` (str): The name of the directory for the graphs to be saved in.
+
+    Returns:
+        None.
+
+    Preconditions:
+        - Must be called once in each worker process, before `render_graph`.
+
+    Raises:
+        None.
+
+    Example:
+        >>> initialize_render_worker(data, "data_sample_dataset")
+
+    Additional Information:
+        - Switches PyPlot to the non-interactive Agg backend, as the worker processes never display a window.
+        - The DataFrame is sent to each worker process once, rather than once per graph.
+    """
+    plt.switch_backend("Agg")
+    RENDER_STATE["df"] = df
+    RENDER_STATE["directory"] = directory
+    return
+
+
+def render_graph(graph: callable) -> tuple:
+    """
+    Renders a single graph in a worker process of the graph rendering pool.
+
+    Args:
+        `graph` (callable): A graphing function, taking a DataFrame and a directory and returning the path to the saved graph.
+
+    Returns:
+        `tuple`: A tuple of the path to the graph, from the root directory, and the image of the graph (None if the graph was not rendered).
+
+    Preconditions:
+        - The worker process must be initialized by `initialize_render_worker`.
+
+    Raises:
+        None.
+
+    Example:
+        >>> render_graph(graph_profile_grade)
+        ('data_sample_dataset/images/profile_completeness_graph.png', b'\\x89PNG...')
+
+    Additional Information:
+        - The image is sent back to the parent process, to be placed in its `FIGURE_STORE` by `store_figure`.
+    """
+    path = graph(RENDER_STATE["df"], RENDER_STATE["directory"])
+    return path, FIGURE_STORE.pop(path, None)
+
+
+def render_graphs(df: pd.DataFrame, directory: str, graphing_functions: list, processes: int=None) -> list:
+    """
+    Renders a list of graphs on a pool of worker processes.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame to graph.
+        `directory` (str): The name of the directory for the graphs to be saved in.
+        `graphing_functions` (list): A list of graphing functions, each taking a DataFrame and a directory and returning the path to the saved graph.
+        `processes` (int) [kwargg]: The number of worker processes, defaulted to None (one per CPU, up to one per graph).
+
+    Returns:
+        `list`: A list of the paths to the graphs, in the order of `graphing_functions`.
+
+    Preconditions:
+        - The graphing functions must be defined at the top level of a module, so they can be sent to the worker processes.
+        - The graphing functions must save their graphs under distinct file names.
+        - When called from a script, the call must be guarded by `if __name__ == "__main__":`.
+
+    Raises:
+        None.
+
+    Example:
+        >>> render_graphs(data, "data_sample_dataset", [graph_profile_grade, graph_program_type])
+        ['data_sample_dataset/images/profile_completeness_graph.png', 'data_sample_dataset/images/program_by_program_type.png']
+
+    Additional Information:
+        - Each graph is independent once its tables exist, so the graphs are rendered concurrently, each worker building the tables it needs.
+        - With a single process or a single graph, the graphs are rendered in the current process instead.
+        - Changes made to `TEXT` by the graphing functions stay in the worker processes.
+        - PyPlot is imported before the worker processes start, so forked workers inherit it rather than each importing it.
+        - The graphs are held in `FIGURE_STORE` and queued to be written into the directory (see `save_figure`).
+    """
+    if processes is None:
+        processes = min(len(graphing_functions), os.cpu_count() or 1)
+    if processes <= 1 or len(graphing_functions) <= 1:
+        paths = [graph(df, directory) for graph in graphing_functions]
+    else:
+        plt.resolve()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes, initializer=initialize_render_worker, initargs=(df, directory)) as executor:
+            paths = [store_figure(*rendered) for rendered in executor.map(render_graph, graphing_functions)]
+    for path in paths:
+        save_figure(path)
+    return paths
+
+
+def get_node_kind(name: str) -> str:
+    """
+    Returns the kind of a node of the report graph.
+
+    Args:
+        `name` (str): The name of the node, a key of `REPORT_GRAPH`.
+
+    Returns:
+        `str`: `graph` for the maps and graphs, `text` for the text fields, or `table` for the tables.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_node_kind("graph_network_hours_overview")
+        'graph'
+    """
+    if name in ["create_map", "create_zoomed_map"] or name.startswith("graph_"):
+        return "graph"
+    if name.startswith("calculate_"):
+        return "text"
+    return "table"
+
+
+def resolve_report_nodes(outputs: list, silenced: list=None) -> list:
+    """
+    Resolves the nodes of the report graph needed to compute a list of outputs, in dependency order.
+
+    Args:
+        `outputs` (list): A list of the names of the requested nodes, keys of `REPORT_GRAPH`.
+        `silenced` (list) [kwargg]: A list of the names of the nodes not to compute, defaulted to None.
+
+    Returns:
+        `list`: A list of the names of the requested nodes and the nodes they read, each listed after the nodes it reads.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `KeyError`: If a requested node is not a node of `REPORT_GRAPH`.
+        `ValueError`: If the nodes of `REPORT_GRAPH` depend on each other in a cycle.
+
+    Example:
+        >>> resolve_report_nodes(["graph_network_hours_overview"])
+        ['build_entity_store', 'create_location_hours_table', 'create_program_hours_table', 'graph_network_hours_overview']
+
+    Additional Information:
+        - A silenced output is dropped along with the nodes only it reads, while nodes shared with other outputs are still computed.
+    """
+    silenced = silenced if silenced else []
+    nodes = []
+    visiting = set()
+    def visit(name):
+        if name not in REPORT_GRAPH:
+            raise KeyError(f"The node '{name}' is not a node of the report graph.")
+        if name in nodes:
+            return
+        if name in visiting:
+            raise ValueError(f"The node '{name}' of the report graph depends on itself.")
+        visiting.add(name)
+        for dependency in REPORT_GRAPH[name]:
+            visit(dependency)
+        visiting.remove(name)
+        nodes.append(name)
+    for name in outputs:
+        if name not in silenced:
+            visit(name)
+    return nodes
+
+
+def render_scheduled_graph(graph: callable, tables: dict) -> tuple:
+    """
+    Renders a single graph of the report graph in a worker process, from the tables computed by the scheduler.
+
+    Args:
+        `graph` (callable): A graphing function, taking a DataFrame and a directory and returning the path to the saved graph.
+        `tables` (dict): A dictionary of the tables read by the graph, keyed on the name of each table function.
+
+    Returns:
+        `tuple`: A tuple of the path to the graph, from the root directory, and the image of the graph (None if the graph was not rendered).
+
+    Preconditions:
+        - The worker process must be initialized by `initialize_render_worker`.
+
+    Raises:
+        None.
 
-# MISC CONSTANTS
-MAP_SCOPE_KEY = {0: 12, 0.1: 10, 0.2: 9, 0.4: 8, 1.5: 7, 4.5: 6, 6: 5, 7: 4, 25: 3, 32: 2, 70: 1}               # A dictionary, used to map the difference between the max/min lon/lat values to map scopes.
+    Example:
+        >>> render_scheduled_graph(graph_network_hours_overview, {"create_location_hours_table": location_hours, "create_program_hours_table": program_hours})
+        ('data_sample_dataset/images/network_hours_overview.png', b'\\x89PNG...')
 
-# COLOURS
-VIVERY_GREEN = '#00483D'                                                                                        # A colour in the Vivery colour scheme.
-VIRIDIAN = '#5F9575'                                                                                            # A colour in the Vivery colour scheme.
-SAGE = '#A2C3A8'                                                                                                # A colour in the Vivery colour scheme.
-SALMON = '#D4A392'                                                                                              # A colour in the Vivery colour scheme.
-WARM_WHITE = '#FAF9F6'                                                                                          # A colour in the Vivery colour scheme.
-NEON_LIME = '#BBD98D'                                                                                           # A colour in the Vivery colour scheme.
-NEON_BLUE = '#8CCFB6'                                                                                           # A colour in the Vivery colour scheme.
+    Additional Information:
+        - The tables are placed in the worker's `TABLE_CACHE`, so the graph reads them rather than computing them again.
+    """
+    get_table_cache_entry(RENDER_STATE["df"])["tables"].update(tables)
+    return render_graph(graph)
 
-# STYLES
-AXES_LABEL_FONT_DICT = {'family': 'Roobert Medium', 'color':  VIVERY_GREEN, 'weight': 'bold', 'size': 16}       # A Dictionary used to style the pyplot axes text.
-PIE_SLICE_FONT_DICT = {'family': 'Roobert Medium', 'color':  VIVERY_GREEN, 'weight': 'bold', 'size': 16}        # A Dictionary used to style the pyplot axes text.
 
+@functools.lru_cache(maxsize=None)
+def parse_function(name: str) -> tuple:
+    """
+    Returns the source code of a function of this file, along with the functions of this file and the strings it names.
 
+    Args:
+        `name` (str): The name of the function.
 
+    Returns:
+        `tuple`: A tuple containing the source code of the function, a tuple of the names of the functions of this file it names (in order of appearance), and a frozenset of its string constants.
 
-# HELPERS
-def save_graph(file_name: str, directory: str, dpi: int) -> None:
+    Preconditions:
+        None.
+
+    Raises:
+        `AttributeError`: If the function is not a function of this file.
+
+    Example:
+        >>> parse_function("graph_profile_grade")[1]
+        ('create_program_profile_completion_table', 'plot_bar_graph', 'save_graph')
+
+    Additional Information:
+        - Memoized, as the source code of the file does not change while it runs.
     """
-    Saves the active PyPlot as a file.
+    module = sys.modules[__name__]
+    source = inspect.getsource(getattr(module, name))
+    functions = []
+    strings = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Name) and node.id != name and node.id not in functions and inspect.isfunction(getattr(module, node.id, None)) and getattr(module, node.id).__module__ == module.__name__:
+            functions.append(node.id)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            strings.add(node.value)
+    return source, tuple(functions), frozenset(strings)
+
+
+@functools.lru_cache(maxsize=None)
+def get_code_hash() -> str:
+    """
+    Returns the hash of the code the artifacts of the report are computed with.
 
     Args:
-        `file_name` (str): The name for the file to be saved as.
-        `directory` (str): The name of the directory for the file to be saved in.
-        `dpi` (int): The DPI (resolution) to save the image in.
+        None.
 
     Returns:
+        `str`: The hexadecimal hash of this file, the local files it computes the report with, and the versions of their packages (see `ac.hash_code`).
+
+    Preconditions:
+        None.
+
+    Raises:
         None.
 
+    Example:
+        >>> get_code_hash()
+        '41c7d2...'
+
+    Additional Information:
+        - Memoized, as the code does not change while it runs.
+        - Covers this file, `bulkUploadLoader.py`, `filterMatrix.py`, `tileCache.py`, `resourceRegistry.py`, and `artifactCache.py`.
+    """
+    return ac.hash_code([sys.modules[__name__], bul, fm, tc, rr, ac])
+
+
+def get_artifact_key(name: str, cache: ac.ArtifactCache, text: dict=None, keywords: dict=None, input_hash: str=None) -> str:
+    """
+    Returns the hash of a node of the report graph, under which its artifact is cached.
+
+    Args:
+        `name` (str): The name of the node, a key of `REPORT_GRAPH`.
+        `cache` (ac.ArtifactCache): The artifact cache of the bulk upload file.
+        `text` (dict) [kwargg]: The text read by the node, defaulted to None (`TEXT`).
+        `keywords` (dict) [kwargg]: The keyword arguments of the node, defaulted to None.
+        `input_hash` (str) [kwargg]: The hash of the data read by the node, defaulted to None (the hash of the bulk upload file, `cache.input_hash`).
+
+    Returns:
+        `str`: The hexadecimal hash of the node.
+
     Preconditions:
-        - A PyPlot must be active.
-        - The directory must be a local path.
+        - Must be called before the text fields of `text` are filled, so the hash covers the unformatted text.
 
     Raises:
-        `OSError`: If the file cannot be moved to the specified directory.
+        `KeyError`: If the node is not a node of `REPORT_GRAPH`.
 
     Example:
-        >>> save_graph('plot.png', 'output/', dpi=300)
+        >>> get_artifact_key("graph_network_hours_overview", cache)
+        '5c04be...'
 
     Additional Information:
-        - The file's extension is specified within the `file_name` argument.
-        - The file's location is specified by the `directory` argument.
-        - The file's size is specified by the `dpi` argument.
-        - If the file cannot be moved to the specified directory, an `OSError` is raised.
+        - The hash covers the bulk upload file, the code of the report (see `get_code_hash`), the sections of `text` named by the node, the nodes it reads, and the helpers they call, the weights, recommended filters, and profile completion tiers, and the keyword arguments of the node.
+        - The nodes of `REPORT_MONTHLY_NODES`, and the nodes reading them, are also hashed on the current month.
+        - A change to one section of `text` only invalidates the nodes naming that section.
+        - Any change to the code of the report, or an upgrade of its packages, invalidates every artifact.
     """
-    plt.savefig(file_name, dpi=dpi, bbox_inches='tight')
-    try:
-        shutil.move(file_name, directory + "/images")
-    except OSError:
-        os.remove(directory + "/images"+ '/' + file_name)
-        shutil.move(file_name, directory + "/images")
-    plt.close()
-    return directory + "/images/" + file_name
+    text = TEXT if text is None else text
+    nodes = resolve_report_nodes([name])
+    functions = list(nodes)
+    for function in functions:
+        functions += [called for called in parse_function(function)[1] if called not in functions]
+    sections = {REPORT_TEXT_FIELDS[name][0]} if name in REPORT_TEXT_FIELDS else set()
+    for function in functions:
+        sections.update(string for string in parse_function(function)[2] if string in text)
+    month = datetime.date.today().strftime("%Y-%m") if any(node in REPORT_MONTHLY_NODES for node in nodes) else ""
+    return ac.hash_values(
+        get_code_hash(),
+        cache.input_hash if input_hash is None else input_hash,
+        name,
+        [(section, json.dumps(text[section], sort_keys=True)) for section in sorted(sections)],
+        json.dumps(WEIGHTS, sort_keys=True),
+        RECOMMENDED_FILTERS.to_csv(),
+        PROFILE_COMPLETION_TIERS.to_csv(),
+        month,
+        sorted((keywords if keywords else {}).items())
+    )
+
+
+def get_content_key(name: str, base_key: str, results: dict) -> str:
+    """
+    Returns the hash of a node of `REPORT_CONTENT_NODES` on the results of the nodes it reads, under which its artifact is also cached.
+
+    Args:
+        `name` (str): The name of the node, a key of `REPORT_GRAPH`.
+        `base_key` (str): The hash of the node without its input, as returned by `get_artifact_key` with `input_hash=""`.
+        `results` (dict): A dictionary of the computed nodes of the report, holding the results of every node read by the node.
+
+    Returns:
+        `str`: The hexadecimal hash of the node.
+
+    Preconditions:
+        - The node must read the bulk upload only through the nodes it depends on in `REPORT_GRAPH`.
+
+    Raises:
+        `KeyError`: If a node read by the node is not computed.
+
+    Example:
+        >>> get_content_key("graph_program_type", base_key, {"create_program_by_program_type_table": program_types})
+        'a71c3e...'
+
+    Additional Information:
+        - Unlike the hash of `get_artifact_key`, the hash does not cover the bulk upload file, so a new bulk upload of a network reuses each graph and text field whose tables are unchanged.
+    """
+    return ac.hash_values(base_key, [ac.hash_table(results[dependency]) for dependency in REPORT_GRAPH[name]])
+
+
+def load_artifact(name: str, key: str, cache: ac.ArtifactCache, df: pd.DataFrame, directory: str, text: dict) -> any:
+    """
+    Restores a cached node of the report graph, as if it had been computed.
+
+    Args:
+        `name` (str): The name of the node, a key of `REPORT_GRAPH`.
+        `key` (str): The hash of the node, as returned by `get_artifact_key`.
+        `cache` (ac.ArtifactCache): The artifact cache of the bulk upload file.
+        `df` (pd.DataFrame): The DataFrame of the report.
+        `directory` (str): The name of the directory of the report.
+        `text` (dict): The text filled by the text field nodes.
+
+    Returns:
+        `any`: The result of the node; a table for the tables, the path to the saved graph for the graphs, and the filled text for the text fields.
+
+    Preconditions:
+        - The node must be cached under `key`.
+
+    Raises:
+        `FileNotFoundError`: If the node is not cached.
+
+    Example:
+        >>> load_artifact("graph_program_type", key, cache, data, "data_sample_dataset", TEXT)
+        'data_sample_dataset/images/program_by_program_type.png'
+
+    Additional Information:
+        - The files of a graph are placed back in `FIGURE_STORE`, rather than written into the report directory (see `save_figure`).
+        - A table is placed in `TABLE_CACHE`, so later calls to its table function read it rather than computing it.
+        - A text field is written back into `text`.
+    """
+    value, files = cache.load(key)
+    for filename, contents in files.items():
+        store_figure(directory + "/" + filename, contents)
+    kind = get_node_kind(name)
+    if kind == "graph":
+        return directory + value.removeprefix(REPORT_DIRECTORY_PLACEHOLDER) if value.startswith(REPORT_DIRECTORY_PLACEHOLDER) else value
+    if kind == "text":
+        section, field = REPORT_TEXT_FIELDS[name]
+        text[section][field] = value
+        return value
+    get_table_cache_entry(df)["tables"][name] = value
+    return value.copy()
+
+
+def save_artifact(name: str, key: str, cache: ac.ArtifactCache, result: any, directory: str) -> None:
+    """
+    Caches a computed node of the report graph.
+
+    Args:
+        `name` (str): The name of the node, a key of `REPORT_GRAPH`.
+        `key` (str): The hash of the node, as returned by `get_artifact_key`.
+        `cache` (ac.ArtifactCache): The artifact cache of the bulk upload file.
+        `result` (any): The result of the node.
+        `directory` (str): The name of the directory of the report.
+
+    Returns:
+        None.
+
+    Preconditions:
+        - The graphs of the node must be held in `FIGURE_STORE` or saved in the report directory.
+
+    Raises:
+        None.
+
+    Example:
+        >>> save_artifact("graph_program_type", key, cache, "data_sample_dataset/images/program_by_program_type.png", "data_sample_dataset")
+
+    Additional Information:
+        - The path to a graph is cached relative to the report directory, so the graph is reused by a report saved in another directory.
+    """
+    if get_node_kind(name) == "graph" and result.startswith(directory + "/"):
+        filename = result.removeprefix(directory + "/")
+        cache.save(key, REPORT_DIRECTORY_PLACEHOLDER + "/" + filename, {filename: get_figure(result).getvalue()})
+    else:
+        cache.save(key, result)
+    return
+
+
+def run_report_graph(df: pd.DataFrame, directory: str, outputs: list, text: dict=None, keywords: dict=None, silenced: list=None, processes: int=None, cache: ac.ArtifactCache=None, save_figures: bool=True) -> dict:
+    """
+    Computes the requested nodes of the report graph, computing each node once and independent nodes concurrently.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame to analyze.
+        `directory` (str): The name of the directory for the graphs to be saved in.
+        `outputs` (list): A list of the names of the requested nodes, keys of `REPORT_GRAPH`.
+        `text` (dict) [kwargg]: The text filled by the text field nodes, defaulted to None (`TEXT`).
+        `keywords` (dict) [kwargg]: A dictionary of the keyword arguments of the graph nodes, keyed on the name of each node, defaulted to None.
+        `silenced` (list) [kwargg]: A list of the names of the nodes not to compute, defaulted to None.
+        `processes` (int) [kwargg]: The number of worker threads and processes, defaulted to None (one per CPU).
+        `cache` (ac.ArtifactCache) [kwargg]: The artifact cache of the bulk upload file, defaulted to None (compute every node).
+        `save_figures` (bool) [kwargg]: Whether to write the graphs into the `images` folder of the directory, defaulted to True.
+
+    Returns:
+        `dict`: A dictionary of the results of the requested nodes that are not silenced, keyed on the name of each node; a table for the tables, the path to the graph (held in `FIGURE_STORE`) for the graphs, and the filled text for the text fields.
+
+    Preconditions:
+        - When called from a script, the call must be guarded by `if __name__ == "__main__":`.
+
+    Raises:
+        `KeyError`: If a requested node is not a node of `REPORT_GRAPH`.
+
+    Example:
+        >>> run_report_graph(data, "data_sample_dataset", ["graph_network_hours_overview", "calculate_current_next_month"])
+        {'graph_network_hours_overview': 'data_sample_dataset/images/network_hours_overview.png', 'calculate_current_next_month': 'Below is a preview of the hours for July and August...'}
+
+    Additional Information:
+        - A node is started as soon as the nodes it reads are computed, so the report is computed in dependency order rather than in the order of `outputs`.
+        - The tables and text fields are computed on a pool of worker threads, so the tables land in `TABLE_CACHE` and the pdfConstructor reads them without computing them again.
+        - The graphs are rendered on a pool of worker processes, as PyPlot is not thread safe; each graph is sent the tables it reads.
+        - With a single process, the nodes are computed one at a time in the current thread.
+        - Changes made to `TEXT` by the graphing functions stay in the worker processes.
+        - PyPlot is imported before the worker processes start if any graph is rendered, so forked workers inherit it rather than each importing it.
+        - With an artifact cache, the requested nodes whose hash is cached are restored rather than computed, and the nodes only they read are skipped; each computed output is cached as soon as it finishes, so a report re-run after a crash resumes where it stopped.
+        - The requested nodes of `REPORT_CONTENT_NODES` are also cached on the results of the nodes they read (see `get_content_key`), so on a new bulk upload only the graphs and text fields whose tables changed are rendered again.
+        - The graphs are rendered into `FIGURE_STORE` rather than onto disk; with `save_figures`, each graph is queued to be written into the directory as soon as it finishes, and `wait_for_figures` waits for the writes.
+    """
+    text = TEXT if text is None else text
+    keywords = keywords if keywords else {}
+    silenced = silenced if silenced else []
+    processes = (os.cpu_count() or 1) if processes is None else processes
+    requested = [name for name in outputs if name not in silenced]
+    keys = {name: get_artifact_key(name, cache, text, keywords.get(name)) for name in requested} if cache else {}
+    base_keys = {name: get_artifact_key(name, cache, text, keywords.get(name), input_hash="") for name in keys if name in REPORT_CONTENT_NODES}
+    content_keys = {}
+    cached = {name: key for name, key in keys.items() if cache.contains(key)}
+    nodes = resolve_report_nodes([name for name in requested if name not in cached])
+    nodes += [name for name in cached if name not in nodes]
+    module = sys.modules[__name__]
+    def lookup(name):
+        if name in base_keys and name not in cached:
+            content_keys[name] = get_content_key(name, base_keys[name], results)
+            if cache.contains(content_keys[name]):
+                cached[name] = content_keys[name]
+    def compute(name):
+        if name in cached:
+            return load_artifact(name, cached[name], cache, df, directory, text)
+        kind = get_node_kind(name)
+        if kind == "graph":
+            return getattr(module, name)(df, directory, **keywords.get(name, {}))
+        if kind == "text":
+            section, field = REPORT_TEXT_FIELDS[name]
+            return getattr(module, name)(df, text, section, field)[section][field]
+        return getattr(module, name)(df)
+    def finish(name, result):
+        if name in rendered:
+            result = store_figure(*result)
+        results[name] = result
+        if save_figures and get_node_kind(name) == "graph":
+            save_figure(result)
+        for key in [keys.get(name), content_keys.get(name)]:
+            if key and key != cached.get(name):
+                save_artifact(name, key, cache, result, directory)
+    results = {}
+    rendered = set()
+    if processes <= 1:
+        for name in nodes:
+            lookup(name)
+            finish(name, compute(name))
+    else:
+        if any(get_node_kind(name) == "graph" and name not in cached for name in nodes):
+            plt.resolve()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=processes) as thread_pool, concurrent.futures.ProcessPoolExecutor(max_workers=processes, initializer=initialize_render_worker, initargs=(df, directory)) as process_pool:
+            pending = {}
+            waiting = list(nodes)
+            while waiting or pending:
+                for name in [name for name in waiting if name in cached or all(dependency in results for dependency in REPORT_GRAPH[name])]:
+                    waiting.remove(name)
+                    lookup(name)
+                    if get_node_kind(name) == "graph" and name not in cached:
+                        tables = get_table_cache_entry(df)["tables"]
+                        graph = functools.partial(getattr(module, name), **keywords.get(name, {}))
+                        pending[process_pool.submit(render_scheduled_graph, graph, {dependency: tables[dependency] for dependency in REPORT_GRAPH[name] if dependency in tables})] = name
+                        rendered.add(name)
+                    else:
+                        pending[thread_pool.submit(compute, name)] = name
+                finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    finish(pending.pop(future), future.result())
+    return {name: results[name] for name in outputs if name in results}
 
 
 def save_state(data: any, filename: str, directory: str) -> None:
@@ -274,16 +1324,110 @@ def crop_image(width: int, height: int, filename: str, directory: str) -> None:
     Additional Information:
         - The `crop_image` function uses the Python Imaging Library (PIL) to open the specified image file.
         - The function crops the image using the coordinates (height/2, width/2, height/2 + width, width/2 + height).
-        - The resulting cropped image is saved as a PNG file in the same directory with the same filename, overwriting the original file.
+        - The image is read from `FIGURE_STORE` (or from disk, if it is not held there), and the cropped image is stored in `FIGURE_STORE` under the same path, replacing the original image.
         - Ensure that the image file exists in the specified directory, the dimensions are positive integers, and the dimensions are valid for cropping.
     """
     try:
-        im = Image.open(directory + "/images/" + filename)
+        im = Image.open(get_figure(directory + "/images/" + filename))
     except FileNotFoundError:
         raise FileNotFoundError(f"The image file '{filename}' does not exist in the directory '{directory}'/images.")
     im = im.crop((height/2, width/2, height/2 + width, width/2 + height))
-    im.save(directory + "/images/" + filename, "png")
-    return directory + "/images/" + filename
+    image = io.BytesIO()
+    im.save(image, "png")
+    return store_figure(directory + "/images/" + filename, image.getvalue())
+
+
+def project_coordinates(latitudes: np.ndarray, longitudes: np.ndarray, zoom: int) -> tuple:
+    """
+    Projects latitude and longitude coordinates onto the pixels of a Web Mercator map.
+
+    Args:
+        `latitudes` (np.ndarray): An array of latitudes, in degrees.
+        `longitudes` (np.ndarray): An array of longitudes, in degrees.
+        `zoom` (int): The zoom level of the map tiles.
+
+    Returns:
+        `tuple`: A tuple of two arrays, containing the x and y pixels of the coordinates on a map of `TILE_SIZE * 2 ** zoom` pixels square.
+
+    Preconditions:
+        - The latitudes must be within the Web Mercator bounds (about -85 to 85 degrees).
+
+    Raises:
+        None.
+
+    Example:
+        >>> project_coordinates(np.array([0.0]), np.array([0.0]), 1)
+        (array([256.]), array([256.]))
+    """
+    world_size = TILE_SIZE * 2 ** zoom
+    latitudes = np.radians(np.asarray(latitudes, dtype=float))
+    x = (np.asarray(longitudes, dtype=float) + 180) / 360 * world_size
+    y = (1 - np.log(np.tan(latitudes) + 1 / np.cos(latitudes)) / np.pi) / 2 * world_size
+    return x, y
+
+
+def render_static_map(latitudes: np.ndarray, longitudes: np.ndarray, colours: np.ndarray, lat_center: float, lon_center: float, zoom: int, filename: str, directory: str) -> str:
+    """
+    Draws a location map of size `MAP_SIZE` from the cached map tiles, without Plotly or Kaleido.
+
+    Args:
+        `latitudes` (np.ndarray): An array of the latitudes of the location markers.
+        `longitudes` (np.ndarray): An array of the longitudes of the location markers.
+        `colours` (np.ndarray): An array of the hex colours of the location markers.
+        `lat_center` (float): The latitude of the center of the map.
+        `lon_center` (float): The longitude of the center of the map.
+        `zoom` (int): The zoom level of the map, on the MapBox scale used by `create_map`.
+        `filename` (str): The name for the file to be saved as.
+        `directory` (str): The name of the directory for the file to be saved in.
+
+    Returns:
+        `str`: A string containing the path to the map, saved as a png, from the root directory.
+
+    Preconditions:
+        - The directory must contain an `images` folder.
+
+    Raises:
+        None.
+
+    Example:
+        >>> render_static_map(data['Location Latitude'], data['Location Longitude'], data['Color'], 49.28, -123.12, 11, "map.png", "data_sample_dataset")
+        'data_sample_dataset/images/map.png'
+
+    Additional Information:
+        - MapBox zoom levels are based on 512 pixel tiles, so the map is drawn from the 256 pixel tiles one zoom level deeper.
+        - The map tiles are read through `TILE_PROVIDER`, so only uncached tiles are fetched; an unavailable tile is left blank.
+        - The map is drawn at its final size, so it is not cropped with `crop_image`.
+        - Markers are drawn in the order of the DataFrame, matching the Plotly map.
+    """
+    zoom = int(zoom) + 1
+    tile_count = 2 ** zoom
+    width, height = MAP_SIZE
+    x_center, y_center = project_coordinates(np.array([lat_center]), np.array([lon_center]), zoom)
+    left, top = int(round(x_center[0] - width / 2)), int(round(y_center[0] - height / 2))
+
+    # Basemap
+    im = Image.new("RGB", MAP_SIZE, "white")
+    for tile_y in range(top // TILE_SIZE, (top + height - 1) // TILE_SIZE + 1):
+        if not 0 <= tile_y < tile_count:
+            continue
+        for tile_x in range(left // TILE_SIZE, (left + width - 1) // TILE_SIZE + 1):
+            try:
+                tile = Image.open(io.BytesIO(TILE_PROVIDER.get_tile(zoom, tile_x % tile_count, tile_y))).convert("RGB")
+            except OSError:
+                continue
+            im.paste(tile, (tile_x * TILE_SIZE - left, tile_y * TILE_SIZE - top))
+
+    # Markers
+    x, y = project_coordinates(latitudes, longitudes, zoom)
+    x, y = x - left, y - top
+    visible = np.isfinite(x) & np.isfinite(y) & (x > -MARKER_SIZE) & (x < width + MARKER_SIZE) & (y > -MARKER_SIZE) & (y < height + MARKER_SIZE)
+    draw = ImageDraw.Draw(im)
+    radius = MARKER_SIZE / 2
+    for marker_x, marker_y, colour in zip(x[visible], y[visible], np.asarray(colours)[visible]):
+        draw.ellipse((marker_x - radius, marker_y - radius, marker_x + radius, marker_y + radius), fill=colour)
+    image = io.BytesIO()
+    im.save(image, "png")
+    return store_figure(directory + "/images/" + filename, image.getvalue())
 
 
 def plot_bar_graph(x_axis: list, y_axis: list, text_section: str, barcolor: str, xlabel="xlabel", ylabel="ylabel", rotation=0) -> None:
@@ -422,16 +1566,175 @@ def plot_pie_graph(sizes: list, colours: list, text_section: str, labels="labels
     return
 
 
+def month_range(offset: int=0) -> tuple:
+    """
+    Returns the first and last day of the month `offset` months after the current month.
+
+    Args:
+        `offset` (int) [kwargg]: The number of months after the current month, defaulted to 0 (the current month).
+
+    Returns:
+        `tuple`: A tuple of two `datetime.date` objects, the first and last day of the month.
+
+    Preconditions:
+        - `offset` must be a non-negative integer.
+
+    Raises:
+        None.
+
+    Example:
+        >>> month_range(1)      # Called on 2023-05-13
+        (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30))
+    """
+    first_day = datetime.date.today().replace(day=1)
+    for _ in range(offset):
+        first_day = (first_day + datetime.timedelta(days=32)).replace(day=1)
+    last_day = (first_day + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1)
+    return first_day, last_day
+
+
+@memoize_table
+def parse_hours(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parses the hours columns of a bulk upload once, converting each `Hours Open X` and `Hours Closed X` into integer minutes past midnight.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame containing location and program hours data.
+
+    Returns:
+        `pd.DataFrame`: A DataFrame with one row per row of `df`, holding the hours columns along with the parsed `Minutes Open X`, `Minutes Closed X`, `Hours X`, `Weekday`, and `Specific Day` columns.
+
+    Preconditions:
+        - The DataFrame `df` must contain the columns `Location External ID`, `Program External ID`, `Hours Entity Type`, `Hours Open X`, `Hours Closed X`, `Day of Week`, `Week of Month`, `Day of Month`, `Frequency`, `Specific Date`, `Specific Date Closed Indicator`, and `Specific Date Reason`.
+
+    Raises:
+        None.
+
+    Example:
+        >>> data = pd.DataFrame({
+        ...     'Hours Open 1': ['9:30', '11:00'],
+        ...     'Hours Closed 1': ['11:30', '25:00'],
+        ...     ...
+        ... })
+        >>> parse_hours(data)[['Minutes Open 1', 'Minutes Closed 1', 'Hours 1']]
+            Minutes Open 1      Minutes Closed 1        Hours 1
+        0       570                 690                     2
+        1       660                 -1                      0
+
+    Additional Information:
+        - Hours that are missing or not formatted as `%H:%M` are stored as -1 minutes and contribute 0 hours.
+        - `Hours X` counts whole hours only (the closing hour less the opening hour), matching the bars of the hours preview graphs.
+        - `Weekday` is the index (Monday = 0) of the `Day of Week`, or -1 if the day is not recognized.
+        - `Specific Day` is the `Specific Date` as a datetime, or NaT if missing or not formatted as `%Y-%m-%d`.
+    """
+    weekdays = {name: index for index, name in enumerate(calendar.day_name)}
+    df = get_entity_rows(df, ["hours", "locations", "programs"], columns=['Location External ID', 'Program External ID'] + HOURS_COLUMNS)
+    new_df = df[['Location External ID', 'Program External ID', 'Hours Entity Type', 'Hours Open 1', 'Hours Closed 1', 'Hours Open 2', 'Hours Closed 2', 'Hours Open 3', 'Hours Closed 3',
+                 'Day of Week', 'Week of Month', 'Day of Month', 'Frequency', 'Specific Date', 'Specific Date Closed Indicator', 'Specific Date Reason']].reset_index(drop=True)
+    for i in range(1, 4):
+        for column in ["Open", "Closed"]:
+            times = new_df["Hours " + column + " " + str(i)]
+            times = times.where(times.map(lambda value: isinstance(value, str))).astype(str).str.extract(r'^([0-9]{1,2}):([0-9]{1,2})$').astype(float)
+            new_df["Minutes " + column + " " + str(i)] = (times[0] * 60 + times[1]).where((times[0] <= 23) & (times[1] <= 59), -1).astype(int)
+        valid = (new_df["Minutes Open " + str(i)] >= 0) & (new_df["Minutes Closed " + str(i)] >= 0)
+        new_df["Hours " + str(i)] = np.where(valid, new_df["Minutes Closed " + str(i)] // 60 - new_df["Minutes Open " + str(i)] // 60, 0)
+    new_df["Weekday"] = new_df["Day of Week"].map(weekdays).astype(float).fillna(-1).astype(int)
+    new_df["Specific Day"] = pd.to_datetime(new_df["Specific Date"].astype(str), format='%Y-%m-%d', errors='coerce')
+    return new_df
+
+
+def expand_hours(df: pd.DataFrame, entity_type: str, start: datetime.date, end: datetime.date) -> pd.Series:
+    """
+    Expands the recurring and specific date hours of every location or program onto a day grid, totalling the hours open on each day.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame containing location and program hours data.
+        `entity_type` (str): The `Hours Entity Type` to expand, either `Location` or `Program`.
+        `start` (datetime.date): The first day of the date range.
+        `end` (datetime.date): The last day of the date range.
+
+    Returns:
+        `pd.Series`: A Series of integer hours, indexed by each day from `start` to `end` (inclusive).
+
+    Preconditions:
+        - The DataFrame `df` must contain the columns required by `parse_hours`.
+        - `start` must not be after `end`.
+
+    Raises:
+        None.
+
+    Example:
+        >>> expand_hours(data, "Location", *month_range())
+        2023-05-01     6
+        2023-05-02     0
+        ...
+        2023-05-31     0
+        Freq: D, dtype: int64
+
+    Additional Information:
+        - `Weekly` hours are added to every matching weekday, and `Every Other Week` hours to matching weekdays in the first half of each 14 day ordinal cycle.
+        - Duplicate `Weekly` and `Every Other Week` hours for the same entity are only counted once, matching the hours appendix tables.
+        - `Week of Month` hours are added to the matching weekday of the given week, where each week of the month begins on a Saturday.
+        - `Day of Month` hours are added to the nth occurrence (1 - 4) of the matching weekday in each month.
+        - `Specific Date` hours are added in upload order, with a `CLOSED` indicator resetting the total for that day to 0.
+        - The grid is built over whole months, so every recurrence is resolved in a single pass regardless of the date range.
+    """
+    hours = parse_hours(df)
+    hours = hours[hours["Hours Entity Type"] == entity_type]
+    row_hours = hours[["Hours 1", "Hours 2", "Hours 3"]].sum(axis=1).values
+
+    # Day grid
+    days = pd.date_range(start.replace(day=1), (end.replace(day=1) + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1), freq='D')
+    grid = pd.DataFrame({"Month": days.year * 12 + days.month, "Weekday": days.weekday, "Day": days.day, "Position": np.arange(len(days))})
+    grid["Week"] = (1 + (grid["Weekday"] == 5).groupby(grid["Month"]).cumsum()).astype(float)
+    grid["Occurrence"] = ((grid["Day"] - 1) // 7 + 1).astype(float)
+    ordinals = days.values.astype('datetime64[D]').astype(np.int64) + datetime.date(1970, 1, 1).toordinal()
+    totals = np.zeros(len(days), dtype=np.int64)
+
+    # Weekly and every other week hours
+    for frequency, active_days in [("Weekly", np.ones(len(days), dtype=bool)), ("Every Other Week", ordinals % 14 <= 6)]:
+        slots = pd.concat([hours.loc[hours["Frequency"] == frequency, [entity_type + " External ID", "Hours Open " + str(i), "Hours Closed " + str(i), "Day of Week", "Weekday", "Hours " + str(i)]]
+                           .dropna(subset=["Hours Open " + str(i), "Hours Closed " + str(i)]).set_axis([entity_type + " External ID", "Hours Open", "Hours Closed", "Day of Week", "Weekday", "Hours"], axis=1)
+                           for i in range(1, 4)]).drop_duplicates(subset=[entity_type + " External ID", "Hours Open", "Hours Closed", "Day of Week"])
+        slots = slots[slots["Weekday"] >= 0]
+        weekday_hours = np.bincount(slots["Weekday"], weights=slots["Hours"], minlength=7).astype(np.int64)
+        totals += np.where(active_days, weekday_hours[days.weekday], 0)
+
+    # Week of month
+    week_of_month_days = pd.concat([grid, grid[grid["Day"] == 1].assign(Week=1)]).sort_values(by="Position", kind="stable").drop_duplicates(subset=["Month", "Weekday", "Week"])
+    week_of_month_hours = pd.DataFrame({"Weekday": hours["Weekday"].values, "Week": hours["Week of Month"].values, "Hours": row_hours})[(hours["Frequency"] == "Week of Month").values]
+    week_of_month_hours = week_of_month_hours.merge(week_of_month_days, on=["Weekday", "Week"])
+    np.add.at(totals, week_of_month_hours["Position"].values, week_of_month_hours["Hours"].values)
+
+    # Day of month
+    weekday_prefixes = {name[0:3].upper(): index for index, name in enumerate(calendar.day_name)}
+    day_of_month_hours = pd.DataFrame({"Weekday": hours["Day of Week"].astype(str).str[0:3].str.upper().map(weekday_prefixes).values, "Occurrence": np.floor(hours["Day of Month"].values), "Hours": row_hours})[(hours["Frequency"] == "Day of Month").values & (np.floor(hours["Day of Month"].values) >= 1) & (np.floor(hours["Day of Month"].values) <= 4)]
+    day_of_month_hours = day_of_month_hours.merge(grid, on=["Weekday", "Occurrence"])
+    np.add.at(totals, day_of_month_hours["Position"].values, day_of_month_hours["Hours"].values)
+
+    # Specific date
+    specific_dates = hours["Specific Date Reason"].notna().values & hours["Specific Day"].between(days[0], days[-1]).values
+    positions = (hours["Specific Day"].values[specific_dates] - days.values[0]).astype('timedelta64[D]').astype(np.int64)
+    closed = (hours["Specific Date Closed Indicator"].values[specific_dates] == "CLOSED")
+    order = np.arange(len(positions))
+    last_closed = pd.Series(np.where(closed, order, -1)).groupby(positions).transform("max").values
+    totals[positions[closed]] = 0
+    np.add.at(totals, positions[order > last_closed], row_hours[specific_dates][order > last_closed])
+
+    return pd.Series(totals, index=days).loc[pd.Timestamp(start):pd.Timestamp(end)]
+
+
 
 
 # GRAPHS
-def create_map(df: pd.DataFrame, directory: str) -> str:
+def create_map(df: pd.DataFrame, directory: str, backend: str="plotly") -> str:
     """
     Creates a map visualization based on the provided DataFrame.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the map data.
         `directory` (str): The directory where the map image will be saved.
+        `backend` (str) [kwargg]: The map renderer, either `plotly` or `pil`, defaulted to `plotly`.
 
     Returns:
         `str`: A string containing the path to the graph, saved as a png, from the root directory. 
@@ -444,7 +1747,7 @@ def create_map(df: pd.DataFrame, directory: str) -> str:
           must contain boolean values.
 
     Raises:
-        None
+        `ValueError`: If the backend is not `plotly` or `pil`.
 
     Example:
         >>> create_map(data, "/path/to/maps")
@@ -455,14 +1758,23 @@ def create_map(df: pd.DataFrame, directory: str) -> str:
         - The marker color is determined based on the conditions specified using the Organization and Location statuses.
         - The resulting map is centered based on the average latitude and longitude values.
         - The zoom level is determined dynamically based on the range of latitude and longitude values in the DataFrame.
-        - The generated map image is saved as a PNG file in the specified directory.
+        - The map tiles are served from the tile cache by a local tile server (see `tileCache.py`), so a network's tiles are only fetched once.
+        - The generated map image is held in `FIGURE_STORE` as a PNG image, under the `images` folder of the specified directory (see `save_figure`).
         - The function uses the `crop_image` function to crop the map image to a specific width and height (624x403).
+        - With the `pil` backend, the map is drawn at 624x403 from the cached map tiles by `render_static_map`, skipping Plotly, Kaleido, and `crop_image`.
         - Ensure that the DataFrame contains the required columns and represents the relevant map data, and the directory is valid.
     """
     df2 = df.copy()
     df2 = df2[['Location Latitude', 'Location Longitude', 'Organization Approval Status', 'Organization Active Status', 'Location Active Status', 'Location Approval Status']]
     df2['Color'] = np.where((df['Organization Approval Status'] == True) & (df['Organization Active Status'] == True) & (df['Location Approval Status'] == True) & (df['Location Active Status'] == True), VIRIDIAN, SALMON)
-
+    lat_center = df2['Location Latitude'].mean()
+    lon_center = df2['Location Longitude'].mean()
+    zoom = min(map_scope((df2['Location Longitude'].max() - df2['Location Longitude'].min())), map_scope((df2['Location Latitude'].max() - df2['Location Latitude'].min())))
+
+    if backend == "pil":
+        return render_static_map(df2['Location Latitude'].values, df2['Location Longitude'].values, df2['Color'].values, lat_center, lon_center, zoom, "map.png", directory)
+    if backend != "plotly":
+        raise ValueError(f"The map backend '{backend}' does not exist, expected 'plotly' or 'pil'.")
     fig = go.Figure(go.Scattermapbox(
             lat=df2['Location Latitude'],
             lon=df2['Location Longitude'],
@@ -474,27 +1786,29 @@ def create_map(df: pd.DataFrame, directory: str) -> str:
         autosize=True,
         hovermode='closest',
         mapbox=dict(
-            accesstoken=PK,
+            style="white-bg",
+            layers=[dict(below="traces", sourcetype="raster", source=[tc.get_tile_server(TILE_PROVIDER).url_template])],
             bearing=0,
             center=dict(
-                lat=df2['Location Latitude'].mean(),
-                lon=df2['Location Longitude'].mean(),
+                lat=lat_center,
+                lon=lon_center,
             ),
             pitch=0,
-            zoom=min(map_scope((df2['Location Longitude'].max() - df2['Location Longitude'].min())), map_scope((df2['Location Latitude'].max() - df2['Location Latitude'].min())))
+            zoom=zoom
         ),
     )
-    fig.write_image(directory + "/images" + '/map.png', width=1000, height=1000)
+    store_figure(directory + "/images" + '/map.png', fig.to_image(format="png", width=1000, height=1000))
     return crop_image(624, 403, "map.png", directory)
 
 
-def create_zoomed_map(df: pd.DataFrame, directory: str, lat_epicenter:float=0, lon_epicenter:float=0) -> str:
+def create_zoomed_map(df: pd.DataFrame, directory: str, lat_epicenter:float=0, lon_epicenter:float=0, backend: str="plotly") -> str:
     """
     Creates a zoomed in map visualization based on the provided DataFrame and specified latitude and longitude coordinates.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the map data.
         `directory` (str): The directory where the map image will be saved.
+        `backend` (str) [kwargg]: The map renderer, either `plotly` or `pil`, defaulted to `plotly`.
         `lat_epicenter` (float) [kwargg]: The center point for the latitude coordinate, defaulted to 0.
         `lon_epicenter` (float) [kwargg]: The center point for the longitude coordinate, defaulted to 0.
 
@@ -509,7 +1823,7 @@ def create_zoomed_map(df: pd.DataFrame, directory: str, lat_epicenter:float=0, l
           must contain boolean values.
 
     Raises:
-        None
+        `ValueError`: If the backend is not `plotly` or `pil`.
 
     Example:
         >>> create_map(data, "/path/to/maps")
@@ -520,8 +1834,10 @@ def create_zoomed_map(df: pd.DataFrame, directory: str, lat_epicenter:float=0, l
         - The marker color is determined based on the conditions specified using the Organization and Location statuses.
         - The resulting map is centered based on the passed in latitude and longitude coordinates from the key-word arguments.
         - The zoom level is fixed at 11.
-        - The generated map image is saved as a PNG file in the specified directory.
+        - The map tiles are served from the tile cache by a local tile server (see `tileCache.py`), so a network's tiles are only fetched once.
+        - The generated map image is held in `FIGURE_STORE` as a PNG image, under the `images` folder of the specified directory (see `save_figure`).
         - The function uses the `crop_image` function to crop the map image to a specific width and height (624x403).
+        - With the `pil` backend, the map is drawn at 624x403 from the cached map tiles by `render_static_map`, skipping Plotly, Kaleido, and `crop_image`.
         - Ensure that the DataFrame contains the required columns and represents the relevant map data, and the directory is valid.
     """
     df2 = df.copy()
@@ -532,6 +1848,10 @@ def create_zoomed_map(df: pd.DataFrame, directory: str, lat_epicenter:float=0, l
         lat_epicenter = df2['Location Latitude'].mean()
         lon_epicenter = df2['Location Longitude'].mean()
 
+    if backend == "pil":
+        return render_static_map(df2['Location Latitude'].values, df2['Location Longitude'].values, df2['Color'].values, lat_epicenter, lon_epicenter, 11, "zoomed_map.png", directory)
+    if backend != "plotly":
+        raise ValueError(f"The map backend '{backend}' does not exist, expected 'plotly' or 'pil'.")
     fig = go.Figure(go.Scattermapbox(
             lat=df2['Location Latitude'],
             lon=df2['Location Longitude'],
@@ -543,7 +1863,8 @@ def create_zoomed_map(df: pd.DataFrame, directory: str, lat_epicenter:float=0, l
         autosize=True,
         hovermode='closest',
         mapbox=dict(
-            accesstoken=PK,
+            style="white-bg",
+            layers=[dict(below="traces", sourcetype="raster", source=[tc.get_tile_server(TILE_PROVIDER).url_template])],
             bearing=0,
             center=dict(
                 lat=lat_epicenter,
@@ -553,20 +1874,21 @@ def create_zoomed_map(df: pd.DataFrame, directory: str, lat_epicenter:float=0, l
             zoom=11
         ),
     )
-    fig.write_image(directory + "/images" + '/zoomed_map.png', width=1000, height=1000)
+    store_figure(directory + "/images" + '/zoomed_map.png', fig.to_image(format="png", width=1000, height=1000))
     return crop_image(624, 403, "zoomed_map.png", directory)
 
 
-def graph_profile_grade(df: pd.DataFrame, directory: str) -> str:
+def graph_profile_grade(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to visualize the profile completion grade based on the provided DataFrame.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the profile completion data.
         `directory` (str): The directory where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory. 
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory. 
 
     Preconditions:
         - The Pandas DataFrame `df` must contain the necessary columns and represent the relevant profile completion data.
@@ -602,19 +1924,20 @@ def graph_profile_grade(df: pd.DataFrame, directory: str) -> str:
         except KeyError:
             y_axis[i] = 0
     plot_bar_graph(x_axis, y_axis, "PROFILE COMPLETENESS", VIRIDIAN)
-    return save_graph(TEXT["PROFILE COMPLETENESS"]["filename"], directory, 300)
+    return save_graph(TEXT["PROFILE COMPLETENESS"]["filename"], directory, 300, vector=vector)
 
 
-def graph_missing_organization_contact_info(df: pd.DataFrame, directory: str) -> str:
+def graph_missing_organization_contact_info(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to visualize the missing organization contact information based on the provided DataFrame.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the organization contact information data.
         `directory` (str): The directory where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory. 
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory. 
 
     Preconditions:
         - The Pandas DataFrame `df` must contain the necessary columns and represent the relevant organization contact information data.
@@ -655,19 +1978,20 @@ def graph_missing_organization_contact_info(df: pd.DataFrame, directory: str) ->
         len(df[df[TEXT["APPENDIX ORGANIZATION CONTACT INFORMATION"]["columns"][1:]].notna().all(axis=1)])
         ]
     plot_bar_graph(x_axis, y_axis, "VIVERY CONTACT INFORMATION", VIVERY_GREEN)
-    return save_graph(TEXT["VIVERY CONTACT INFORMATION"]["filename"], directory, 300)
+    return save_graph(TEXT["VIVERY CONTACT INFORMATION"]["filename"], directory, 300, vector=vector)
 
 
-def graph_missing_location_contact_info(df: pd.DataFrame, directory: str) -> str:
+def graph_missing_location_contact_info(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to visualize the missing location contact information based on the provided DataFrame.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the location contact information data.
         `directory` (str): The directory where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory. 
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory. 
 
     Preconditions:
         - The Pandas DataFrame `df` must contain the necessary columns and represent the relevant location contact information data.
@@ -709,19 +2033,20 @@ def graph_missing_location_contact_info(df: pd.DataFrame, directory: str) -> str
         len(df[df[TEXT["APPENDIX LOCATION CONTACT INFORMATION"]["columns"][1:]].notna().all(axis=1)])
         ]
     plot_bar_graph(x_axis, y_axis, "PUBLIC CONTACT INFORMATION", VIRIDIAN, xlabel="location xlabel", ylabel="location ylabel")
-    return save_graph(TEXT["PUBLIC CONTACT INFORMATION"]["location filename"], directory, 300)
+    return save_graph(TEXT["PUBLIC CONTACT INFORMATION"]["location filename"], directory, 300, vector=vector)
 
 
-def graph_missing_program_contact_info(df: pd.DataFrame, directory: str) -> str:
+def graph_missing_program_contact_info(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to visualize the missing program contact information based on the provided DataFrame.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the program contact information data.
         `directory` (str): The directory where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory. 
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory. 
 
     Preconditions:
         - The Pandas DataFrame `df` must contain the necessary columns and represent the relevant program contact information data.
@@ -762,19 +2087,20 @@ def graph_missing_program_contact_info(df: pd.DataFrame, directory: str) -> str:
         len(df[df[TEXT["APPENDIX PROGRAM CONTACT INFORMATION"]["columns"][1:]].notna().all(axis=1)])
         ]
     plot_bar_graph(x_axis, y_axis, "PUBLIC CONTACT INFORMATION", SAGE, xlabel="program xlabel", ylabel="program ylabel")
-    return save_graph(TEXT["PUBLIC CONTACT INFORMATION"]["program filename"], directory, 300)
+    return save_graph(TEXT["PUBLIC CONTACT INFORMATION"]["program filename"], directory, 300, vector=vector)
 
 
-def graph_program_type(df: pd.DataFrame, directory: str) -> str:
+def graph_program_type(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a pie chart to visualize the distribution of program types.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the program data.
         `directory` (str): The directory where the graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory. 
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory. 
 
     Preconditions:
         - The Pandas DataFrame `df` must contain the necessary columns and represent the relevant program data.
@@ -799,19 +2125,20 @@ def graph_program_type(df: pd.DataFrame, directory: str) -> str:
     sizes = [len(df.loc[df["Program Type"] == "Food Program"]), len(df) - len(df.loc[df["Program Type"] == "Food Program"])]
     colours = [SAGE, VIRIDIAN]
     plot_pie_graph(sizes, colours, "PROGRAM TYPES", labels="program types labels")
-    return save_graph(TEXT["PROGRAM TYPES"]["program types filename"], directory, 300)
+    return save_graph(TEXT["PROGRAM TYPES"]["program types filename"], directory, 300, vector=vector)
 
 
-def graph_food_program_breakdown(df: pd.DataFrame, directory: str) -> str:
+def graph_food_program_breakdown(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a pie chart to provide a breakdown of food programs.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the food program data.
         `directory` (str): The directory where the graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory. 
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory. 
 
     Preconditions:
         - The Pandas DataFrame `df` must contain the necessary columns and represent the relevant food program data.
@@ -842,19 +2169,20 @@ def graph_food_program_breakdown(df: pd.DataFrame, directory: str) -> str:
         ]
     colours = [VIVERY_GREEN, VIRIDIAN, SAGE, NEON_LIME, NEON_BLUE]
     plot_pie_graph(sizes, colours, "PROGRAM TYPES", labels="food program types labels")
-    return save_graph(TEXT["PROGRAM TYPES"]["food program types filename"], directory, 300)
+    return save_graph(TEXT["PROGRAM TYPES"]["food program types filename"], directory, 300, vector=vector)
 
 
-def graph_program_filter_usage(df: pd.DataFrame, directory: str) -> str:
+def graph_program_filter_usage(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to visualize the usage of program and location filter fields.
 
     Args:
         `df` (pd.DataFrame): The DataFrame containing the program and location filter fields data.
         `directory` (str): The directory path where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory. 
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory. 
 
     Preconditions:
         - The DataFrame `df` must contain the necessary columns representing the program and location filter fields.
@@ -884,19 +2212,20 @@ def graph_program_filter_usage(df: pd.DataFrame, directory: str) -> str:
     if sum(y_axis) == 0:
         return "resources\images\\null_graph.png"
     plot_bar_graph(x_axis, y_axis, "PROGRAM FILTER FIELDS", SAGE)
-    return save_graph(TEXT["PROGRAM FILTER FIELDS"]["filename"], directory, 300)
+    return save_graph(TEXT["PROGRAM FILTER FIELDS"]["filename"], directory, 300, vector=vector)
 
 
-def graph_network_hours_overview(df: pd.DataFrame, directory: str) -> str:
+def graph_network_hours_overview(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a pie chart to provide an overview of network hours.
 
     Args:
         `df` (pd.DataFrame): The Pandas DataFrame containing the network hours data.
         `directory` (str): The directory where the graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory.       
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory.       
 
     Preconditions:
         - The Pandas DataFrame `df` must contain the necessary columns and represent the relevant network hours data.
@@ -922,19 +2251,20 @@ def graph_network_hours_overview(df: pd.DataFrame, directory: str) -> str:
     sizes = [len(program_hours_dataframe), len(location_hours_dataframe)]
     colours = [SAGE, VIRIDIAN]
     plot_pie_graph(sizes, colours, "NETWORK HOURS OVERVIEW")
-    return save_graph(TEXT["NETWORK HOURS OVERVIEW"]["filename"], directory, 300)
+    return save_graph(TEXT["NETWORK HOURS OVERVIEW"]["filename"], directory, 300, vector=vector)
 
 
-def graph_sample_location_hours_current_month(df: pd.DataFrame, directory: str) -> str:
+def graph_sample_location_hours_current_month(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to display the sample location hours for the current month.
 
     Args:
         `df` (pd.DataFrame): The DataFrame containing location hours data.
         `directory` (str): The directory path where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory.       
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory.       
 
     Preconditions:
         - The DataFrame `df` must contain the necessary columns representing location hours data.
@@ -949,109 +2279,36 @@ def graph_sample_location_hours_current_month(df: pd.DataFrame, directory: str)
         # and saves the graph in the specified directory.
 
     Additional Information:
-        - The function initializes `current_month` as a dictionary with dates as keys and initial values set to zero.
-        - The function retrieves weekly hours data and updates the corresponding weekdays in `current_month` based on the opening and closing hours.
-        - The function retrieves every other week hours data and updates the corresponding weekdays in `current_month` based on the opening and closing hours.
-        - The function retrieves week of the month hours data and updates the corresponding dates in `current_month` based on the opening and closing hours and the specified week and day of the week.
-        - The function retrieves day of the month hours data and updates the corresponding dates in `current_month` based on the opening and closing hours and the specified day and day of the week.
-        - The function retrieves specific date hours data and updates the corresponding dates in `current_month` based on the opening and closing hours and the specified specific dates.
-        - The function generates a bar graph using the x-axis values from `current_month` and the y-axis values representing the accumulated hours.
+        - The function expands the location hours of the current month onto a day grid using `expand_hours`, covering weekly, every other week, week of month, day of month, and specific date hours.
+        - The function generates a bar graph using the days of the current month as the x-axis values and the total hours open as the y-axis values.
         - The graph is saved with the filename specified in `TEXT["LOCATION HOURS PREVIEW"]["current month filename"]` in the specified directory.
     """
-    # Initialize dates
-    current_month = {day: 0 for day in pd.date_range(start=datetime.date.today().replace(day=1),
-                                                     end=(datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1), freq='D'
-                                                     ).to_pydatetime()}
-    
-    # Weekly hours
-    weekly_weekdays = {"Monday": 0, "Tuesday": 0, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
-    weekly_hours = create_location_hours_table(df.loc[df["Frequency"] == "Weekly"])
-    for _, rows in weekly_hours.iterrows():
-        try:
-            weekly_weekdays[rows["Day"]] += int(datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][3]], '%H:%M').hour - datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][2]], '%H:%M').hour)
-        except:
-            pass
-    for day, _ in current_month.items():
-        current_month[day] += weekly_weekdays[calendar.day_name[day.weekday()]]
-
-    # Every other week hours
-    every_other_week_weekdays = {"Monday": 0, "Tuesday": 0, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
-    every_other_week_hours = create_location_hours_table(df.loc[df["Frequency"] == "Every Other Week"])
-    for _, rows in every_other_week_hours.iterrows():
-        try:
-            every_other_week_weekdays[rows["Day"]] += int(datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][3]], '%H:%M').hour - datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][2]], '%H:%M').hour)
-        except:
-            pass
-    for day, _ in current_month.items():
-        if (day.toordinal() % 14 <= 6):
-            current_month[day] += every_other_week_weekdays[calendar.day_name[day.weekday()]]
-    
-    # Week of month
-    week_of_month_hours = df.loc[(df["Frequency"] == "Week of Month") & (df['Hours Entity Type'] == 'Location')]
-    for _, rows in week_of_month_hours.iterrows():
-        current_month_day_indexer = datetime.date.today().replace(day=1)
-        current_month_week_counter = 1
-        current_month_day_counter = 1
-        flag = True
-        while (calendar.day_name[current_month_day_indexer.weekday()] != rows['Day of Week'] or current_month_week_counter != rows['Week of Month']) and flag:
-            try:
-                current_month_day_indexer = datetime.date.today().replace(day=current_month_day_counter)
-            except:
-                flag = False
-            current_month_day_counter += 1
-            current_month_week_counter += calendar.day_name[current_month_day_indexer.weekday()] == "Saturday"
-        for i in range(1, 4):
-            try:
-                current_month[datetime.datetime.strptime(str(current_month_day_indexer), '%Y-%m-%d')] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-            except:
-                pass
-
-    # Day of month
-    day_of_month_hours = df.loc[(df["Frequency"] == "Day of Month") & (df['Hours Entity Type'] == 'Location')]
-    for _, rows in day_of_month_hours.iterrows():
-        try:
-            current_month_indexer = pd.date_range(datetime.date.today().replace(day=1), (datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1), freq='WOM-'+ str(int(rows['Day of Month'])) + rows['Day of Week'][0:3].upper())[0]
-            for i in range(1, 4):
-                try:
-                    current_month[current_month_indexer] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-                except:
-                    pass
-        except:
-            pass
-    
-    # Specific date
-    specific_date_hours = df.loc[(df["Specific Date Reason"].notna()) & (df["Hours Entity Type"] == "Location")]
-    for _, rows in specific_date_hours.iterrows():
-        if pd.date_range(start=datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d'), periods=1).to_pydatetime()[0] in current_month.keys():
-            for i in range(1, 4):
-                try:
-                    current_month[datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d')] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-                except:
-                    pass
-        if pd.date_range(start=datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d'), periods=1).to_pydatetime()[0] in current_month.keys() and rows["Specific Date Closed Indicator"] == "CLOSED":
-            current_month[datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d')] = 0
+    # Expand hours
+    first_day, last_day = month_range(0)
+    current_month = expand_hours(df, "Location", first_day, last_day)
 
     # Graph
-    x_axis = [str(date.strftime("%d")) for date in list(current_month.keys())[:-1]]
-    y_axis = list(current_month.values())[:-1]
-    TEXT["LOCATION HOURS PREVIEW"]["xlabel"] = calendar.month_name[int(list(current_month.keys())[0].strftime("%m"))]
-    TEXT["LOCATION HOURS PREVIEW"]["current month filename"] = "location_hours_" + calendar.month_name[int(list(current_month.keys())[0].strftime("%m"))].lower() + ".png"
+    x_axis = current_month.index.strftime("%d").tolist()
+    y_axis = current_month.tolist()
+    TEXT["LOCATION HOURS PREVIEW"]["xlabel"] = calendar.month_name[first_day.month]
+    TEXT["LOCATION HOURS PREVIEW"]["current month filename"] = "location_hours_" + calendar.month_name[first_day.month].lower() + ".png"
     if sum(y_axis) == 0:
         return "resources\images\\null_graph.png"
     plot_bar_graph(x_axis, y_axis, "LOCATION HOURS PREVIEW", VIRIDIAN, rotation=45)
-    return save_graph(TEXT["LOCATION HOURS PREVIEW"]["current month filename"], directory, 300)
+    return save_graph(TEXT["LOCATION HOURS PREVIEW"]["current month filename"], directory, 300, vector=vector)
 
 
-def graph_sample_location_hours_next_month(df: pd.DataFrame, directory: str) -> str:
+def graph_sample_location_hours_next_month(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to display the sample location hours for the next month.
 
     Args:
         `df` (pd.DataFrame): The DataFrame containing location hours data.
         `directory` (str): The directory path where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory.   
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory.   
 
     Preconditions:
         - The DataFrame `df` must contain the necessary columns representing location hours data.
@@ -1066,108 +2323,36 @@ def graph_sample_location_hours_next_month(df: pd.DataFrame, directory: str) ->
         # and saves the graph in the specified directory.
 
     Additional Information:
-        - The function initializes `next_month` as a dictionary with dates as keys and initial values set to zero.
-        - The function retrieves weekly hours data and updates the corresponding weekdays in `next_month` based on the opening and closing hours.
-        - The function retrieves every other week hours data and updates the corresponding weekdays in `next_month` based on the opening and closing hours.
-        - The function retrieves week of the month hours data and updates the corresponding dates in `next_month` based on the opening and closing hours and the specified week and day of the week.
-        - The function retrieves day of the month hours data and updates the corresponding dates in `next_month` based on the opening and closing hours and the specified day and day of the week.
-        - The function retrieves specific date hours data and updates the corresponding dates in `next_month` based on the opening and closing hours and the specified specific dates.
-        - The function generates a bar graph using the x-axis values from `next_month` and the y-axis values representing the accumulated hours.
+        - The function expands the location hours of the next month onto a day grid using `expand_hours`, covering weekly, every other week, week of month, day of month, and specific date hours.
+        - The function generates a bar graph using the days of the next month as the x-axis values and the total hours open as the y-axis values.
         - The graph is saved with the filename specified in `TEXT["LOCATION HOURS PREVIEW"]["next month filename"]` in the specified directory.
     """
-    # Initialize dates
-    next_month = {day: 0 for day in pd.date_range(start=(datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1),
-                                                  end=(datetime.date.today().replace(day=1) + datetime.timedelta(days=63)).replace(day=1), freq='D'
-                                                  ).to_pydatetime()}
-    
-    # WEEKLY HOURS
-    weekly_weekdays = {"Monday": 0, "Tuesday": 0, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
-    weekly_hours = create_location_hours_table(df.loc[df["Frequency"] == "Weekly"])
-    for _, rows in weekly_hours.iterrows():
-        try:
-            weekly_weekdays[rows["Day"]] += int(datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][3]], '%H:%M').hour - datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][2]], '%H:%M').hour)
-        except:
-            pass
-    for day, _ in next_month.items():
-        next_month[day] += weekly_weekdays[calendar.day_name[day.weekday()]]
-
-    # EVERY OTHER WEEK HOURS
-    every_other_week_weekdays = {"Monday": 0, "Tuesday": 0, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
-    every_other_week_hours = create_location_hours_table(df.loc[df["Frequency"] == "Every Other Week"])
-    for _, rows in every_other_week_hours.iterrows():
-        try:
-            every_other_week_weekdays[rows["Day"]] += int(datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][3]], '%H:%M').hour - datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][2]], '%H:%M').hour)
-        except:
-            pass
-    for day, _ in next_month.items():
-        if (day.toordinal() % 14 <= 6):
-            next_month[day] += every_other_week_weekdays[calendar.day_name[day.weekday()]]
-    
-    # WEEK OF MONTH
-    week_of_month_hours = df.loc[(df["Frequency"] == "Week of Month") & (df['Hours Entity Type'] == 'Location')]
-    for _, rows in week_of_month_hours.iterrows():
-        next_month_day_indexer = (datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
-        next_month_week_counter = 1
-        next_month_day_counter = 1
-        flag = True
-        while (calendar.day_name[next_month_day_indexer.weekday()] != rows['Day of Week'] or next_month_week_counter != rows['Week of Month']) and flag:
-            try:
-                next_month_day_indexer = (datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=next_month_day_counter)
-            except:
-                flag = False
-            next_month_day_counter += 1
-            next_month_week_counter += calendar.day_name[next_month_day_indexer.weekday()] == "Saturday"
-        for i in range(1, 4):
-            try:
-                next_month[datetime.datetime.strptime(str(next_month_day_indexer), '%Y-%m-%d')] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-            except:
-                pass
+    # Expand hours
+    first_day, last_day = month_range(1)
+    next_month = expand_hours(df, "Location", first_day, last_day)
 
-    # DAY OF MONTH
-    day_of_month_hours = df.loc[(df["Frequency"] == "Day of Month") & (df['Hours Entity Type'] == 'Location')]
-    for _, rows in day_of_month_hours.iterrows():
-        try:
-            next_month_indexer = pd.date_range((datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1), (datetime.date.today().replace(day=1) + datetime.timedelta(days=63)).replace(day=1), freq='WOM-'+ str(int(rows['Day of Month'])) + rows['Day of Week'][0:3].upper())[0]
-            for i in range(1, 4):
-                try:
-                    next_month[next_month_indexer] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-                except:
-                    pass
-        except:
-            pass
-    
-    # SPECIFIC DATE
-    specific_date_hours = df.loc[(df["Specific Date Reason"].notna()) & (df["Hours Entity Type"] == "Location")]
-    for _, rows in specific_date_hours.iterrows():
-        if pd.date_range(start=datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d'), periods=1).to_pydatetime()[0] in next_month.keys():
-            for i in range(1, 4):
-                try:
-                    next_month[datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d')] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-                except:
-                    pass
-        if pd.date_range(start=datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d'), periods=1).to_pydatetime()[0] in next_month.keys() and rows["Specific Date Closed Indicator"] == "CLOSED":
-            next_month[datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d')] = 0
     # Graph
-    x_axis = [str(date.strftime("%d")) for date in list(next_month.keys())[:-1]]
-    y_axis = list(next_month.values())[:-1]
-    TEXT["LOCATION HOURS PREVIEW"]["xlabel"] = calendar.month_name[int(list(next_month.keys())[0].strftime("%m"))]
-    TEXT["LOCATION HOURS PREVIEW"]["current month filename"] = "location_hours_" + calendar.month_name[int(list(next_month.keys())[0].strftime("%m"))].lower() + ".png"
+    x_axis = next_month.index.strftime("%d").tolist()
+    y_axis = next_month.tolist()
+    TEXT["LOCATION HOURS PREVIEW"]["xlabel"] = calendar.month_name[first_day.month]
+    TEXT["LOCATION HOURS PREVIEW"]["current month filename"] = "location_hours_" + calendar.month_name[first_day.month].lower() + ".png"
     if sum(y_axis) == 0:
         return "resources\images\\null_graph.png"
     plot_bar_graph(x_axis, y_axis, "LOCATION HOURS PREVIEW", VIRIDIAN, rotation=45)
-    return save_graph(TEXT["LOCATION HOURS PREVIEW"]["current month filename"], directory, 300)
+    return save_graph(TEXT["LOCATION HOURS PREVIEW"]["current month filename"], directory, 300, vector=vector)
 
 
-def graph_sample_program_hours_current_month(df: pd.DataFrame, directory: str) -> str:
+def graph_sample_program_hours_current_month(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to display the sample program hours for the current month.
 
     Args:
         `df` (pd.DataFrame): The DataFrame containing program hours data.
         `directory` (str): The directory path where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory.   
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory.   
 
     Preconditions:
         - The DataFrame `df` must contain the necessary columns representing program hours data.
@@ -1182,109 +2367,36 @@ def graph_sample_program_hours_current_month(df: pd.DataFrame, directory: str) -
         # and saves the graph in the specified directory.
 
     Additional Information:
-        - The function initializes `current_month` as a dictionary with dates as keys and initial values set to zero.
-        - The function retrieves weekly hours data and updates the corresponding weekdays in `current_month` based on the opening and closing hours.
-        - The function retrieves every other week hours data and updates the corresponding weekdays in `current_month` based on the opening and closing hours.
-        - The function retrieves week of the month hours data and updates the corresponding dates in `current_month` based on the opening and closing hours and the specified week and day of the week.
-        - The function retrieves day of the month hours data and updates the corresponding dates in `current_month` based on the opening and closing hours and the specified day and day of the week.
-        - The function retrieves specific date hours data and updates the corresponding dates in `current_month` based on the opening and closing hours and the specified specific dates.
-        - The function generates a bar graph using the x-axis values from `current_month` and the y-axis values representing the accumulated hours.
+        - The function expands the program hours of the current month onto a day grid using `expand_hours`, covering weekly, every other week, week of month, day of month, and specific date hours.
+        - The function generates a bar graph using the days of the current month as the x-axis values and the total hours open as the y-axis values.
         - The graph is saved with the filename specified in `TEXT["PROGRAM HOURS PREVIEW"]["current month filename"]` in the specified directory.
-    """
-    # Initialize dates
-    current_month = {day: 0 for day in pd.date_range(start=datetime.date.today().replace(day=1),
-                                                     end=(datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1), freq='D'
-                                                     ).to_pydatetime()}
-    
-    # Weekly hours
-    weekly_weekdays = {"Monday": 0, "Tuesday": 0, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
-    weekly_hours = create_program_hours_table(df.loc[df["Frequency"] == "Weekly"])
-    for _, rows in weekly_hours.iterrows():
-        try:
-            weekly_weekdays[rows["Day"]] += int(datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][3]], '%H:%M').hour - datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][2]], '%H:%M').hour)
-        except:
-            pass
-    for day, _ in current_month.items():
-        current_month[day] += weekly_weekdays[calendar.day_name[day.weekday()]]
-
-    # Every other week hours
-    every_other_week_weekdays = {"Monday": 0, "Tuesday": 0, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
-    every_other_week_hours = create_program_hours_table(df.loc[df["Frequency"] == "Every Other Week"])
-    for _, rows in every_other_week_hours.iterrows():
-        try:
-            every_other_week_weekdays[rows["Day"]] += int(datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][3]], '%H:%M').hour - datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][2]], '%H:%M').hour)
-        except:
-            pass
-    for day, _ in current_month.items():
-        if (day.toordinal() % 14 <= 6):
-            current_month[day] += every_other_week_weekdays[calendar.day_name[day.weekday()]]
-    
-    # Week of month
-    week_of_month_hours = df.loc[(df["Frequency"] == "Week of Month") & (df['Hours Entity Type'] == 'Program')]
-    for _, rows in week_of_month_hours.iterrows():
-        current_month_day_indexer = datetime.date.today().replace(day=1)
-        current_month_week_counter = 1
-        current_month_day_counter = 1
-        flag = True
-        while (calendar.day_name[current_month_day_indexer.weekday()] != rows['Day of Week'] or current_month_week_counter != rows['Week of Month']) and flag:
-            try:
-                current_month_day_indexer = datetime.date.today().replace(day=current_month_day_counter)
-            except:
-                flag = False
-            current_month_day_counter += 1
-            current_month_week_counter += calendar.day_name[current_month_day_indexer.weekday()] == "Saturday"
-        for i in range(1, 4):
-            try:
-                current_month[datetime.datetime.strptime(str(current_month_day_indexer), '%Y-%m-%d')] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-            except:
-                pass
-
-    # Day of month
-    day_of_month_hours = df.loc[(df["Frequency"] == "Day of Month") & (df['Hours Entity Type'] == 'Program')]
-    for _, rows in day_of_month_hours.iterrows():
-        try:
-            current_month_indexer = pd.date_range(datetime.date.today().replace(day=1), (datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1), freq='WOM-'+ str(int(rows['Day of Month'])) + rows['Day of Week'][0:3].upper())[0]
-            for i in range(1, 4):
-                try:
-                    current_month[current_month_indexer] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-                except:
-                    pass
-        except:
-            pass
-    
-    # Specific date
-    specific_date_hours = df.loc[(df["Specific Date Reason"].notna()) & (df["Hours Entity Type"] == 'Program')]
-    for _, rows in specific_date_hours.iterrows():
-        if pd.date_range(start=datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d'), periods=1).to_pydatetime()[0] in current_month.keys():
-            for i in range(1, 4):
-                try:
-                    current_month[datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d')] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-                except:
-                    pass
-        if pd.date_range(start=datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d'), periods=1).to_pydatetime()[0] in current_month.keys() and rows["Specific Date Closed Indicator"] == "CLOSED":
-            current_month[datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d')] = 0
+    """
+    # Expand hours
+    first_day, last_day = month_range(0)
+    current_month = expand_hours(df, "Program", first_day, last_day)
 
     # Graph
-    x_axis = [str(date.strftime("%d")) for date in list(current_month.keys())[:-1]]
-    y_axis = list(current_month.values())[:-1]
-    TEXT["PROGRAM HOURS PREVIEW"]["xlabel"] = calendar.month_name[int(list(current_month.keys())[0].strftime("%m"))]
-    TEXT["PROGRAM HOURS PREVIEW"]["current month filename"] = "program_hours_" + calendar.month_name[int(list(current_month.keys())[0].strftime("%m"))].lower() + ".png"
+    x_axis = current_month.index.strftime("%d").tolist()
+    y_axis = current_month.tolist()
+    TEXT["PROGRAM HOURS PREVIEW"]["xlabel"] = calendar.month_name[first_day.month]
+    TEXT["PROGRAM HOURS PREVIEW"]["current month filename"] = "program_hours_" + calendar.month_name[first_day.month].lower() + ".png"
     if sum(y_axis) == 0:
         return "resources\images\\null_graph.png"
     plot_bar_graph(x_axis, y_axis, "PROGRAM HOURS PREVIEW", SAGE, rotation=45)
-    return save_graph(TEXT["PROGRAM HOURS PREVIEW"]["current month filename"], directory, 300)
+    return save_graph(TEXT["PROGRAM HOURS PREVIEW"]["current month filename"], directory, 300, vector=vector)
 
 
-def graph_sample_program_hours_next_month(df: pd.DataFrame, directory: str) -> str:
+def graph_sample_program_hours_next_month(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to display the sample program hours for the next month.
 
     Args:
         `df` (pd.DataFrame): The DataFrame containing program hours data.
         `directory` (str): The directory path where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory.
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory.
 
     Preconditions:
         - The DataFrame `df` must contain the necessary columns representing program hours data.
@@ -1299,107 +2411,36 @@ def graph_sample_program_hours_next_month(df: pd.DataFrame, directory: str) -> s
         # and saves the graph in the specified directory.
 
     Additional Information:
-        - The function initializes `next_month` as a dictionary with dates as keys and initial values set to zero.
-        - The function retrieves weekly hours data and updates the corresponding weekdays in `next_month` based on the opening and closing hours.
-        - The function retrieves every other week hours data and updates the corresponding weekdays in `next_month` based on the opening and closing hours.
-        - The function retrieves week of the month hours data and updates the corresponding dates in `next_month` based on the opening and closing hours and the specified week and day of the week.
-        - The function retrieves day of the month hours data and updates the corresponding dates in `next_month` based on the opening and closing hours and the specified day and day of the week.
-        - The function retrieves specific date hours data and updates the corresponding dates in `next_month` based on the opening and closing hours and the specified specific dates.
-        - The function generates a bar graph using the x-axis values from `next_month` and the y-axis values representing the accumulated hours.
+        - The function expands the program hours of the next month onto a day grid using `expand_hours`, covering weekly, every other week, week of month, day of month, and specific date hours.
+        - The function generates a bar graph using the days of the next month as the x-axis values and the total hours open as the y-axis values.
         - The graph is saved with the filename specified in `TEXT["PROGRAM HOURS PREVIEW"]["next month filename"]` in the specified directory.
     """
-    # Initialize dates
-    next_month = {day: 0 for day in pd.date_range(start=(datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1),
-                                                  end=(datetime.date.today().replace(day=1) + datetime.timedelta(days=63)).replace(day=1), freq='D'
-                                                  ).to_pydatetime()}
-    
-    # WEEKLY HOURS
-    weekly_weekdays = {"Monday": 0, "Tuesday": 0, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
-    weekly_hours = create_program_hours_table(df.loc[df["Frequency"] == "Weekly"])
-    for _, rows in weekly_hours.iterrows():
-        try:
-            weekly_weekdays[rows["Day"]] += int(datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][3]], '%H:%M').hour - datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][2]], '%H:%M').hour)
-        except:
-            pass
-    for day, _ in next_month.items():
-        next_month[day] += weekly_weekdays[calendar.day_name[day.weekday()]]
-
-    # EVERY OTHER WEEK HOURS
-    every_other_week_weekdays = {"Monday": 0, "Tuesday": 0, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
-    every_other_week_hours = create_program_hours_table(df.loc[df["Frequency"] == "Every Other Week"])
-    for _, rows in every_other_week_hours.iterrows():
-        try:
-            every_other_week_weekdays[rows["Day"]] += int(datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][3]], '%H:%M').hour - datetime.datetime.strptime(rows[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][2]], '%H:%M').hour)
-        except:
-            pass
-    for day, _ in next_month.items():
-        if (day.toordinal() % 14 <= 6):
-            next_month[day] += every_other_week_weekdays[calendar.day_name[day.weekday()]]
-    
-    # WEEK OF MONTH
-    week_of_month_hours = df.loc[(df["Frequency"] == "Week of Month") & (df['Hours Entity Type'] == 'Program')]
-    for _, rows in week_of_month_hours.iterrows():
-        next_month_day_indexer = (datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
-        next_month_week_counter = 1
-        next_month_day_counter = 1
-        flag = True
-        while (calendar.day_name[next_month_day_indexer.weekday()] != rows['Day of Week'] or next_month_week_counter != rows['Week of Month']) and flag:
-            try:
-                next_month_day_indexer = (datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=next_month_day_counter)
-            except:
-                flag = False
-            next_month_day_counter += 1
-            next_month_week_counter += calendar.day_name[next_month_day_indexer.weekday()] == "Saturday"
-        for i in range(1, 4):
-            try:
-                next_month[datetime.datetime.strptime(str(next_month_day_indexer), '%Y-%m-%d')] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-            except:
-                pass
+    # Expand hours
+    first_day, last_day = month_range(1)
+    next_month = expand_hours(df, "Program", first_day, last_day)
 
-    # DAY OF MONTH
-    day_of_month_hours = df.loc[(df["Frequency"] == "Day of Month") & (df['Hours Entity Type'] == 'Program')]
-    for _, rows in day_of_month_hours.iterrows():
-        try:
-            next_month_indexer = pd.date_range((datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1), (datetime.date.today().replace(day=1) + datetime.timedelta(days=63)).replace(day=1), freq='WOM-'+ str(int(rows['Day of Month'])) + rows['Day of Week'][0:3].upper())[0]
-            for i in range(1, 4):
-                try:
-                    next_month[next_month_indexer] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-                except:
-                    pass
-        except:
-            pass
-    
-    specific_date_hours = df.loc[(df["Specific Date Reason"].notna()) & (df["Hours Entity Type"] == 'Program')]
-    for _, rows in specific_date_hours.iterrows():
-        if pd.date_range(start=datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d'), periods=1).to_pydatetime()[0] in next_month.keys():
-            for i in range(1, 4):
-                try:
-                    next_month[datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d')] += int(datetime.datetime.strptime(rows["Hours Closed " + str(i)], '%H:%M').hour - datetime.datetime.strptime(rows["Hours Open " + str(i)], '%H:%M').hour)
-                except:
-                    pass
-        if pd.date_range(start=datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d'), periods=1).to_pydatetime()[0] in next_month.keys() and rows["Specific Date Closed Indicator"] == "CLOSED":
-            next_month[datetime.datetime.strptime(str(rows["Specific Date"]), '%Y-%m-%d')] = 0
     # Graph
-    x_axis = [str(date.strftime("%d")) for date in list(next_month.keys())[:-1]]
-    y_axis = list(next_month.values())[:-1]
-    TEXT["PROGRAM HOURS PREVIEW"]["xlabel"] = calendar.month_name[int(list(next_month.keys())[0].strftime("%m"))]
-    TEXT["PROGRAM HOURS PREVIEW"]["current month filename"] = "program_hours_" + calendar.month_name[int(list(next_month.keys())[0].strftime("%m"))].lower() + ".png"
+    x_axis = next_month.index.strftime("%d").tolist()
+    y_axis = next_month.tolist()
+    TEXT["PROGRAM HOURS PREVIEW"]["xlabel"] = calendar.month_name[first_day.month]
+    TEXT["PROGRAM HOURS PREVIEW"]["current month filename"] = "program_hours_" + calendar.month_name[first_day.month].lower() + ".png"
     if sum(y_axis) == 0:
         return "resources\images\\null_graph.png"
     plot_bar_graph(x_axis, y_axis, "PROGRAM HOURS PREVIEW", SAGE, rotation=45)
-    return save_graph(TEXT["PROGRAM HOURS PREVIEW"]["current month filename"], directory, 300)
+    return save_graph(TEXT["PROGRAM HOURS PREVIEW"]["current month filename"], directory, 300, vector=vector)
 
 
-def graph_program_qualifications(df: pd.DataFrame, directory: str) -> str:
+def graph_program_qualifications(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to visualize the number of programs with missing qualifications.
 
     Args:
         `df` (pd.DataFrame): The DataFrame containing program data.
         `directory` (str): The directory path where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory.
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory.
 
     Preconditions:
         - The DataFrame `df` must contain the necessary columns representing program qualifications.
@@ -1425,19 +2466,20 @@ def graph_program_qualifications(df: pd.DataFrame, directory: str) -> str:
     x_axis = TEXT["MISSING PROGRAM QUALIFICATIONS"]["xaxis"]
     y_axis = [len(create_program_by_program_qualifications_table(df).dropna()), len(create_program_table(df)) - len(create_program_by_program_qualifications_table(df).dropna())] 
     plot_bar_graph(x_axis, y_axis, "MISSING PROGRAM QUALIFICATIONS", SAGE)
-    return save_graph(TEXT["MISSING PROGRAM QUALIFICATIONS"]["filename"], directory, 300)
+    return save_graph(TEXT["MISSING PROGRAM QUALIFICATIONS"]["filename"], directory, 300, vector=vector)
 
 
-def graph_program_service_areas(df: pd.DataFrame, directory: str) -> str:
+def graph_program_service_areas(df: pd.DataFrame, directory: str, vector: bool=False) -> str:
     """
     Generates a bar graph to visualize the number of programs with missing service areas.
 
     Args:
         `df` (pd.DataFrame): The DataFrame containing program data.
         `directory` (str): The directory path where the generated graph will be saved.
+        `vector` (bool) [kwargg]: True to save the graph as a vector image (SVG) rather than a PNG, defaulted to False.
 
     Returns:
-        `str`: A string containing the path to the graph, saved as a png, from the root directory.
+        `str`: A string containing the path to the graph, saved as a png (or an svg, if `vector`), from the root directory.
 
     Preconditions:
         - The DataFrame `df` must contain the necessary columns representing program service areas.
@@ -1463,12 +2505,93 @@ def graph_program_service_areas(df: pd.DataFrame, directory: str) -> str:
     x_axis = TEXT["MISSING PROGRAM SERVICE AREA"]["xaxis"]
     y_axis = [len(create_program_by_program_service_area_table(df).dropna()), len(create_program_table(df)) - len(create_program_by_program_service_area_table(df).dropna())] 
     plot_bar_graph(x_axis, y_axis, "MISSING PROGRAM SERVICE AREA", SAGE)
-    return save_graph(TEXT["MISSING PROGRAM SERVICE AREA"]["filename"], directory, 300)
+    return save_graph(TEXT["MISSING PROGRAM SERVICE AREA"]["filename"], directory, 300, vector=vector)
 
 
 
 
 # TABLES
+def get_network_overview_ids(df: pd.DataFrame) -> dict:
+    """
+    Finds the External IDs of the active, inactive, and total organizations, locations, and programs of a network.
+
+    Args:
+        `df` (pd.DataFrame): The Pandas DataFrame containing the network data.
+
+    Returns:
+        `dict`: A dictionary keyed by `active`, `inactive`, and `total`, each holding a list of three arrays of the unique External IDs of the organizations, locations, and programs.
+
+    Preconditions:
+        - The Pandas DataFrame must contain the External ID, Approval Status, and Active Status columns of organizations, locations, and programs.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_network_overview_ids(data)["inactive"]
+        [array([1990]), array([1992, 1993]), array(['PANTRY03'], dtype=object)]
+
+    Additional Information:
+        - A location is active only if its organization is also active, and a program only if its location and organization are also active.
+        - An entity is counted as both active and inactive if it appears with both statuses.
+        - The IDs of separate bulk uploads (or chunks of one bulk upload) can be merged, and counted as `create_network_overview_table` counts them (see `chunkedAggregator.py`).
+    """
+    organizations = build_entity_store(df)["organizations"]
+    locations = get_entity_rows(df, ["locations", "organizations"])
+    programs = get_entity_rows(df, ["programs", "locations", "organizations"])
+    active = [
+        organizations.loc[(organizations['Organization Approval Status'] == True) & (organizations['Organization Active Status'] == True)]['Organization External ID'].dropna().unique(),
+        locations.loc[(locations['Location Approval Status'] == True) & (locations['Location Active Status'] == True) & (locations['Organization Approval Status'] == True) & (locations['Organization Active Status'] == True)]['Location External ID'].dropna().unique(),
+        programs.loc[(programs['Program Approval Status'] == True) & (programs['Program Active Status'] == True) & (programs['Location Approval Status'] == True) & (programs['Location Active Status'] == True) & (programs['Organization Approval Status'] == True) & (programs['Organization Active Status'] == True)]['Program External ID'].dropna().unique()
+        ]
+    inactive = [
+        organizations.loc[(organizations['Organization Approval Status'] != True) | (organizations['Organization Active Status'] != True)]['Organization External ID'].dropna().unique(),
+        locations.loc[(locations['Location Approval Status'] != True) | (locations['Location Active Status'] != True) | (locations['Organization Approval Status'] != True) | (locations['Organization Active Status'] != True)]['Location External ID'].dropna().unique(),
+        programs.loc[(programs['Program Approval Status'] != True) | (programs['Program Active Status'] != True) | (programs['Location Approval Status'] != True) | (programs['Location Active Status'] != True) | (programs['Organization Approval Status'] != True) | (programs['Organization Active Status'] != True)]['Program External ID'].dropna().unique()
+        ]
+    total = [
+        organizations['Organization External ID'].dropna().unique(),
+        locations['Location External ID'].dropna().unique(),
+        programs['Program External ID'].dropna().unique()
+        ]
+    return {"active": active, "inactive": inactive, "total": total}
+
+
+def build_network_overview_table(active: list, inactive: list, total: list) -> pd.DataFrame:
+    """
+    Builds the network overview table from the counts of active, inactive, and total organizations, locations, and programs.
+
+    Args:
+        `active` (list): The number of active organizations, locations, and programs.
+        `inactive` (list): The number of inactive organizations, locations, and programs.
+        `total` (list): The total number of organizations, locations, and programs.
+
+    Returns:
+        `pd.DataFrame`: A DataFrame containing the network overview information.
+
+    Preconditions:
+        - Each list must hold three counts, in the order organizations, locations, programs.
+
+    Raises:
+        None.
+
+    Example:
+        >>> build_network_overview_table([2, 3, 2], [1, 2, 1], [3, 3, 3])
+            Level               Active  Inactive  Total
+        0       Organizations       2         1      3
+        1       Locations           3         2      3
+        2       Programs            2         1      3
+    """
+    data = {
+        TEXT["NETWORK OVERVIEW"]["columns"][0]: TEXT["NETWORK OVERVIEW"]["rows"],
+        TEXT["NETWORK OVERVIEW"]["columns"][1]: active,
+        TEXT["NETWORK OVERVIEW"]["columns"][2]: inactive,
+        TEXT["NETWORK OVERVIEW"]["columns"][3]: total
+        }
+    return pd.DataFrame(data, columns=TEXT["NETWORK OVERVIEW"]["columns"])
+
+
+@memoize_table
 def create_network_overview_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a network overview table based on the provided DataFrame.
@@ -1522,30 +2645,11 @@ def create_network_overview_table(df: pd.DataFrame) -> pd.DataFrame:
         - The count of unique entities is based on their respective external ID columns.
         - The table row headers and column headers are obtained from the `TEXT` dictionary under the key `NETWORK OVERVIEW`.
     """
-    active = [
-        df[['Organization External ID', 'Organization Approval Status', 'Organization Active Status']].loc[(df['Organization Approval Status'] == True) & (df['Organization Active Status'] == True)]['Organization External ID'].nunique(),
-        df[['Location External ID', 'Location Approval Status', 'Location Active Status']].loc[(df['Location Approval Status'] == True) & (df['Location Active Status'] == True) & (df['Organization Approval Status'] == True) & (df['Organization Active Status'] == True)]['Location External ID'].nunique(),
-        df[['Program External ID', 'Program Approval Status', 'Program Active Status']].loc[(df['Program Approval Status'] == True) & (df['Program Active Status'] == True) & (df['Location Approval Status'] == True) & (df['Location Active Status'] == True) & (df['Organization Approval Status'] == True) & (df['Organization Active Status'] == True)]['Program External ID'].nunique()
-        ]
-    inactive = [
-        df[['Organization External ID', 'Organization Approval Status', 'Organization Active Status']].loc[(df['Organization Approval Status'] != True) | (df['Organization Active Status'] != True)]['Organization External ID'].nunique(),
-        df[['Location External ID', 'Location Approval Status', 'Location Active Status']].loc[(df['Location Approval Status'] != True) | (df['Location Active Status'] != True) | (df['Organization Approval Status'] != True) | (df['Organization Active Status'] != True)]['Location External ID'].nunique(),
-        df[['Program External ID', 'Program Approval Status', 'Program Active Status']].loc[(df['Program Approval Status'] != True) | (df['Program Active Status'] != True) | (df['Location Approval Status'] != True) | (df['Location Active Status'] != True) | (df['Organization Approval Status'] != True) | (df['Organization Active Status'] != True)]['Program External ID'].nunique()
-        ]
-    total = [
-        df[['Organization External ID', 'Organization Approval Status', 'Organization Active Status']]['Organization External ID'].nunique(),
-        df[['Location External ID', 'Location Approval Status', 'Location Active Status']]['Location External ID'].nunique(),
-        df[['Program External ID', 'Program Approval Status', 'Program Active Status']]['Program External ID'].nunique()
-        ]
-    data = {
-        TEXT["NETWORK OVERVIEW"]["columns"][0]: TEXT["NETWORK OVERVIEW"]["rows"],
-        TEXT["NETWORK OVERVIEW"]["columns"][1]: active,
-        TEXT["NETWORK OVERVIEW"]["columns"][2]: inactive,
-        TEXT["NETWORK OVERVIEW"]["columns"][3]: total
-        }
-    return pd.DataFrame(data, columns=TEXT["NETWORK OVERVIEW"]["columns"])
+    network_overview_ids = get_network_overview_ids(df)
+    return build_network_overview_table(*[[len(ids) for ids in network_overview_ids[status]] for status in ["active", "inactive", "total"]])
 
 
+@memoize_table
 def create_highest_graded_profiles_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of the highest graded program profiles based on the provided DataFrame.
@@ -1586,6 +2690,7 @@ def create_highest_graded_profiles_table(df: pd.DataFrame) -> pd.DataFrame:
     return create_program_profile_completion_table(df).sort_values(by=[TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["columns"][1], TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["columns"][0]], ascending=[False, True]).head(5).reset_index(drop=True)
 
 
+@memoize_table
 def create_lowest_graded_profiles_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of the lowest graded program profiles based on the provided DataFrame.
@@ -1626,6 +2731,7 @@ def create_lowest_graded_profiles_table(df: pd.DataFrame) -> pd.DataFrame:
     return create_program_profile_completion_table(df).sort_values(by=[TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["columns"][1], TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["columns"][0]], ascending=[True, False]).head(5).reset_index(drop=True)
 
 
+@memoize_table
 def create_high_low_graded_profiles_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Concatenates the highest graded profiles table and the lowest graded profiles table.
@@ -1733,6 +2839,7 @@ def create_recommended_program_filters_table(_: any) -> pd.DataFrame:
     return df.reset_index(drop=True)
 
 
+@memoize_table
 def create_hour_type_usage_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of hour type usage based on the provided DataFrame.
@@ -1769,19 +2876,20 @@ def create_hour_type_usage_table(df: pd.DataFrame) -> pd.DataFrame:
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant data.
         - Table row headers and column headers are pulled from `text.json`.
     """
+    hours = build_entity_store(df)["hours"]
     locations = [
-        len(df[['Location External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Location') & (df['Frequency'] == 'Weekly')]['Location External ID']),
-        len(df[['Location External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Location') & (df['Frequency'] == 'Every Other Week')]['Location External ID']),
-        len(df[['Location External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Location') & (df['Frequency'] == 'Week of Month')]['Location External ID']),
-        len(df[['Location External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Location') & (df['Frequency'] == 'Day of Month')]['Location External ID']),
-        len(df[['Location External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Location') & (df['Frequency'] == 'Call for Information')]['Location External ID'])
+        len(hours.loc[(hours['Hours Entity Type'] == 'Location') & (hours['Frequency'] == 'Weekly')]),
+        len(hours.loc[(hours['Hours Entity Type'] == 'Location') & (hours['Frequency'] == 'Every Other Week')]),
+        len(hours.loc[(hours['Hours Entity Type'] == 'Location') & (hours['Frequency'] == 'Week of Month')]),
+        len(hours.loc[(hours['Hours Entity Type'] == 'Location') & (hours['Frequency'] == 'Day of Month')]),
+        len(hours.loc[(hours['Hours Entity Type'] == 'Location') & (hours['Frequency'] == 'Call for Information')])
     ]
     programs = [
-        len(df[['Program External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Program') & (df['Frequency'] == 'Weekly')]['Program External ID']),
-        len(df[['Program External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Program') & (df['Frequency'] == 'Every Other Week')]['Program External ID']),
-        len(df[['Program External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Program') & (df['Frequency'] == 'Week of Month')]['Program External ID']),
-        len(df[['Program External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Program') & (df['Frequency'] == 'Day of Month')]['Program External ID']),
-        len(df[['Program External ID', 'Hours Entity Type', 'Frequency']].loc[(df['Hours Entity Type'] == 'Program') & (df['Frequency'] == 'Call for Information')]['Program External ID'])
+        len(hours.loc[(hours['Hours Entity Type'] == 'Program') & (hours['Frequency'] == 'Weekly')]),
+        len(hours.loc[(hours['Hours Entity Type'] == 'Program') & (hours['Frequency'] == 'Every Other Week')]),
+        len(hours.loc[(hours['Hours Entity Type'] == 'Program') & (hours['Frequency'] == 'Week of Month')]),
+        len(hours.loc[(hours['Hours Entity Type'] == 'Program') & (hours['Frequency'] == 'Day of Month')]),
+        len(hours.loc[(hours['Hours Entity Type'] == 'Program') & (hours['Frequency'] == 'Call for Information')])
     ]
     data = {
         'Hour Type': TEXT["NETWORK HOUR TYPE USAGE"]["rows"],
@@ -1791,6 +2899,7 @@ def create_hour_type_usage_table(df: pd.DataFrame) -> pd.DataFrame:
     return pd.DataFrame(data, columns=TEXT["NETWORK HOUR TYPE USAGE"]["columns"])
 
 
+@memoize_table
 def create_organization_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a new DataFrame containing selected columns related to organizations.
@@ -1836,7 +2945,7 @@ def create_organization_table(df: pd.DataFrame) -> pd.DataFrame:
         - The resulting DataFrame is sorted by `Organization External ID` in ascending order.
         - Duplicate values are dropped to ensure unique organizations.
     """
-    df_copy = df.drop_duplicates(subset=['Organization External ID']).copy()
+    df_copy = build_entity_store(df)["organizations"].drop_duplicates(subset=['Organization External ID']).copy()
     df_copy = df_copy[['Organization External ID', 'Organization Name', 'Organization Address 1', 'Organization Approval Status', 'Organization Active Status']]
     df_copy['Organization Active'] = np.where((df_copy['Organization Approval Status'] == True) & (df_copy['Organization Active Status'] == True), "Active", "Inactive")
     df_copy = df_copy[['Organization External ID', 'Organization Name', 'Organization Address 1', 'Organization Active']]
@@ -1844,6 +2953,7 @@ def create_organization_table(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy.sort_values(by=TEXT["APPENDIX ORGANIZATION LIST"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_location_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of locations based on the provided DataFrame.
@@ -1887,7 +2997,8 @@ def create_location_table(df: pd.DataFrame) -> pd.DataFrame:
         - The resulting DataFrame is sorted by `Location External ID` in ascending order.
         - Duplicate values are dropped to ensure unique locations.
     """
-    df_copy = df.drop_duplicates(subset=['Location External ID']).copy()
+    store = build_entity_store(df)
+    df_copy = store["locations"].merge(store["organizations"], on="Organization Key", how="left").drop_duplicates(subset=['Location External ID']).copy()
     df_copy = df_copy[['Location External ID', 'Location Name', 'Location Address 1', 'Organization Approval Status', 'Organization Active Status', 'Location Approval Status', 'Location Active Status']]
     df_copy['Location Active'] = np.where((df_copy['Organization Approval Status'] == True) & (df_copy['Organization Active Status'] == True) & (df_copy['Location Active Status'] == True) & (df_copy['Location Approval Status'] == True), "Active", "Inactive")
     df_copy = df_copy[['Location External ID', 'Location Name', 'Location Address 1', 'Location Active']]
@@ -1895,6 +3006,7 @@ def create_location_table(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy.sort_values(by=TEXT["APPENDIX LOCATION LIST"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs based on the provided DataFrame.
@@ -1935,7 +3047,8 @@ def create_program_table(df: pd.DataFrame) -> pd.DataFrame:
         - The column headers for the table are sourced from `text.json` using the `APPENDIX PROGRAM LIST` section.
         - The values in the table are sorted by `Location External ID` in ascending order.
     """
-    df_copy = df.drop_duplicates(subset=['Program External ID']).copy()
+    store = build_entity_store(df)
+    df_copy = store["programs"].merge(store["locations"].drop(columns="Organization Key"), on="Location Key", how="left").merge(store["organizations"], on="Organization Key", how="left").drop_duplicates(subset=['Program External ID']).copy()
     df_copy = df_copy[['Program External ID', 'Program Name', 'Location External ID', 'Organization Approval Status', 'Organization Active Status', 'Location Approval Status', 'Location Active Status', 'Program Approval Status', 'Program Active Status']]
     df_copy['Program Active'] = np.where((df_copy['Organization Approval Status'] == True) & (df_copy['Organization Active Status'] == True) & (df_copy['Location Active Status'] == True) & (df_copy['Location Approval Status'] == True) & (df_copy['Program Active Status'] == True) & (df_copy['Program Approval Status'] == True), "Active", "Inactive")
     df_copy = df_copy[['Program External ID', 'Program Name', 'Location External ID', 'Program Active']]
@@ -2022,6 +3135,142 @@ def create_program_category_field_weights(_: any) -> pd.DataFrame:
     return df.sort_values(by=TEXT["APPENDIX PROGRAM CATEGORY FIELD WEIGHTS"]["columns"][1], ascending=False).reset_index(drop=True)
 
 
+@memoize_table
+def get_profile_contributions(df: pd.DataFrame) -> dict:
+    """
+    Breaks the profile score of each organization, location, program, and hours record down into the points of each weighted field.
+
+    Args:
+        `df` (pd.DataFrame): The Pandas DataFrame containing the data.
+
+    Returns:
+        `dict`: A dictionary of DataFrames, keyed by `organizations`, `locations`, `programs`, and `hours`, each holding one row per entity (in the order of the entity store) and one column per field weighted above zero, with the points the field contributes.
+
+    Preconditions:
+        - The Pandas DataFrame must contain every column weighted in `WEIGHTS`.
+
+    Raises:
+        `KeyError`: If a column weighted in `WEIGHTS` is missing from the DataFrame.
+
+    Example:
+        >>> get_profile_contributions(data)["locations"]
+            Location Name   Location Address 1  Location Phone  ...
+        0       2               2                   0
+        1       2               2                   3
+
+    Additional Information:
+        - The points are the null mask of the weighted columns multiplied by a NumPy vector of their weights, computed without copying the values of the entity store.
+        - The profile score of an entity is the sum of its row (see `get_profile_scores`).
+        - The points are stored in the smallest integer type holding the largest weight.
+    """
+    missing_columns = [column for column in WEIGHTS.keys() if column not in df.columns]
+    if missing_columns:
+        raise KeyError(f"The columns {missing_columns} are weighted in '{WEIGHTS_SAVE_NAME}' but missing from the DataFrame.")
+    store = build_entity_store(df)
+    contributions = {}
+    for entity in ["organizations", "locations", "programs", "hours"]:
+        columns = [column for column in store[entity].columns if WEIGHTS.get(column, 0) > 0]
+        weights = np.array([WEIGHTS[column] for column in columns], dtype=np.min_scalar_type(max([WEIGHTS[column] for column in columns], default=0)))
+        mask = np.column_stack([store[entity][column].notna().to_numpy() for column in columns]) if columns else np.zeros((len(store[entity]), 0), dtype=bool)
+        contributions[entity] = pd.DataFrame(mask * weights, columns=columns)
+    return contributions
+
+
+def get_profile_scores(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Scores the profile completion of each row of a bulk upload.
+
+    Args:
+        `df` (pd.DataFrame): The Pandas DataFrame containing the data.
+
+    Returns:
+        `pd.DataFrame`: A DataFrame containing the `Location Name` and `Profile Score` of each bulk upload row.
+
+    Preconditions:
+        - The Pandas DataFrame must contain every column weighted in `WEIGHTS`.
+
+    Raises:
+        `KeyError`: If a column weighted in `WEIGHTS` is missing from the DataFrame.
+
+    Example:
+        >>> get_profile_scores(data)
+            Location Name       Profile Score
+        0   Good Food               8
+        1   Good Food               5
+
+    Additional Information:
+        - Each organization, location, and program is scored once in the entity store (see `get_profile_contributions`), and its score is gathered onto the rows it appears on.
+        - The scores of separate chunks of a bulk upload can be concatenated, and graded by `build_program_profile_completion_table` (see `chunkedAggregator.py`).
+    """
+    store = build_entity_store(df)
+    contributions = get_profile_contributions(df)
+    profile_score = np.zeros(len(store["hours"]), dtype=np.int64)
+    for entity in ["organizations", "locations", "programs", "hours"]:
+        entity_score = contributions[entity].to_numpy().sum(axis=1, dtype=np.int64)
+        profile_score += entity_score if entity == "hours" else entity_score[store["hours"][ENTITY_KEYS[entity]].values]
+    return pd.DataFrame({"Location Name": store["locations"]["Location Name"].values[store["hours"]["Location Key"].values], "Profile Score": profile_score})
+
+
+def get_tier_levels(scores: np.ndarray) -> np.ndarray:
+    """
+    Looks up the profile completion tier of each profile score.
+
+    Args:
+        `scores` (np.ndarray): An array of profile scores.
+
+    Returns:
+        `np.ndarray`: An array of the name of the tier of each score.
+
+    Preconditions:
+        - `PROFILE_COMPLETION_TIERS` must contain the columns `Tier` and `Min`.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_tier_levels(np.array([8, 21, 40]))
+        array(['Basic', 'Quality', 'Exceptional'], dtype=object)
+
+    Additional Information:
+        - A score falls in the tier with the highest `Min` at or below it, found by a binary search over the `Min` column of `profile_completion_tiers.csv`, so the tiers are changed by editing the file.
+        - A score below every `Min` falls in the lowest tier.
+    """
+    tiers = PROFILE_COMPLETION_TIERS.sort_values(by="Min", kind="stable")
+    positions = np.searchsorted(tiers["Min"].to_numpy(), scores, side="right") - 1
+    return tiers["Tier"].to_numpy()[np.clip(positions, 0, None)]
+
+
+def build_program_profile_completion_table(scores: pd.DataFrame) -> pd.DataFrame:
+    """
+    Grades the maximum profile score of each location.
+
+    Args:
+        `scores` (pd.DataFrame): A DataFrame containing the `Location Name` and `Profile Score` of each bulk upload row, as returned by `get_profile_scores`.
+
+    Returns:
+        `pd.DataFrame`: A DataFrame containing program profile completion grades for each Location.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> build_program_profile_completion_table(get_profile_scores(data))
+            Location Name     Profile Score   Tier Level
+        0   Good Food               8           Basic
+
+    Additional Information:
+        - The scores may already be reduced to the maximum score of each location, as the maximum of the maxima is unchanged.
+    """
+    df2 = scores.groupby(['Location Name']).max().reset_index()
+    df2["Tier Level"] = get_tier_levels(df2["Profile Score"].to_numpy())
+    df2.columns = TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["columns"]
+    return df2.sort_values(by=TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["columns"][1], ascending=False).drop_duplicates().reset_index(drop=True)
+
+
+@memoize_table
 def create_program_profile_completion_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of program profile completion grades based on the provided DataFrame.
@@ -2038,7 +3287,7 @@ def create_program_profile_completion_table(df: pd.DataFrame) -> pd.DataFrame:
         - `weights.json` file must be present in the working directory's `resource` folder to access the completion weight for each column.
 
     Raises:
-        None.
+        `KeyError`: If a column weighted in `WEIGHTS` is missing from the DataFrame.
 
     Example:
         >>> data = pd.DataFrame({'Location External ID': ['L1', 'L2', 'L3'],
@@ -2057,7 +3306,7 @@ def create_program_profile_completion_table(df: pd.DataFrame) -> pd.DataFrame:
         - The function then multiplies the integers by the corresponding weight from `weights.json` to calculate the profile completion score for each row.
         - The table displays the maximum profile score for each location based on the `Location External ID`.
         - The profile completion grades model after the internal scores Vivery uses to measure profile completeness.
-        - The calculated score determines the Tier Level displayed in the table:
+        - The calculated score determines the Tier Level displayed in the table, by the `Min` score of each tier in `profile_completion_tiers.csv`:
             - Score >= 36: Exceptional
             - Score >= 21: Quality
             - Score <= 20: Basic
@@ -2065,15 +3314,10 @@ def create_program_profile_completion_table(df: pd.DataFrame) -> pd.DataFrame:
         - The values in the table are sorted by the `Profile Score` column in descending order.
         - To ensure an accurate calculation, make sure all required columns are present in the DataFrame.
     """
-    df2 = df.copy()
-    df2 = df2[list(WEIGHTS.keys())]
-    df2["Profile Score"] = df2.notnull().astype('int').mul(WEIGHTS).sum(axis=1)
-    df2 = df2[["Location Name", "Profile Score"]].groupby(['Location Name']).max().reset_index()
-    df2["Tier Level"] = df2["Profile Score"].apply(lambda score: PROFILE_COMPLETION_TIERS["Tier"][2] if score >= 36 else PROFILE_COMPLETION_TIERS["Tier"][1] if score >= 21 else PROFILE_COMPLETION_TIERS["Tier"][0])
-    df2.columns = TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["columns"]
-    return df2.sort_values(by=TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["columns"][1], ascending=False).drop_duplicates().reset_index(drop=True)
+    return build_program_profile_completion_table(get_profile_scores(df))
 
 
+@memoize_table
 def create_organization_contact_information_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of organization contact information based on the provided DataFrame.
@@ -2115,11 +3359,12 @@ def create_organization_contact_information_table(df: pd.DataFrame) -> pd.DataFr
         - The column headers for the table are sourced from `text.json` using the `APPENDIX ORGANIZATION CONTACT INFORMATION` section.
         - The values in the table are sorted by the `Organization External ID` column in ascending order.
     """
-    df = df[['Organization External ID', 'Organization Contact Name', 'Organization Contact Email', 'Organization Contact Phone']]
+    df = build_entity_store(df)["organizations"][['Organization External ID', 'Organization Contact Name', 'Organization Contact Email', 'Organization Contact Phone']]
     df.columns = TEXT["APPENDIX ORGANIZATION CONTACT INFORMATION"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX ORGANIZATION CONTACT INFORMATION"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_location_contact_information_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of location contact information based on the provided DataFrame.
@@ -2157,11 +3402,12 @@ def create_location_contact_information_table(df: pd.DataFrame) -> pd.DataFrame:
         - Ensure that the provided DataFrame contains all the necessary columns and represents the relevant data.
         - The column headers for the table are sourced from `text.json` using the `APPENDIX LOCATION CONTACT INFORMATION` section.
     """
-    df = df[['Location External ID', 'Location Contact Name', 'Location Contact Email', 'Location Contact Phone']]
+    df = build_entity_store(df)["locations"][['Location External ID', 'Location Contact Name', 'Location Contact Email', 'Location Contact Phone']]
     df.columns = TEXT["APPENDIX LOCATION CONTACT INFORMATION"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX LOCATION CONTACT INFORMATION"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
     
 
+@memoize_table
 def create_program_contact_information_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of program contact information based on the provided DataFrame.
@@ -2216,6 +3462,7 @@ def create_program_contact_information_table(df: pd.DataFrame) -> pd.DataFrame:
           the `APPENDIX PROGRAM LIST` section.
         - Table column headers are pulled from `text.json`.
     """
+    df = get_entity_rows(df, ["programs", "locations"])
     program_contact_info = pd.DataFrame(columns=['Program External ID', 'Program Contact Name', 'Program Contact Email', 'Program Contact Phone'])
     unique_program_contact_info = df.loc[df['Program Use Same Contact As Location'] == False]
     unique_program_contact_info = unique_program_contact_info[['Program External ID', 'Program Contact Name', 'Program Contact Email', 'Program Contact Phone']]
@@ -2228,6 +3475,7 @@ def create_program_contact_information_table(df: pd.DataFrame) -> pd.DataFrame:
     return program_contact_info.sort_values(by=TEXT["APPENDIX PROGRAM LIST"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
     
 
+@memoize_table
 def create_program_by_program_type_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs grouped by program type based on the provided DataFrame.
@@ -2267,11 +3515,12 @@ def create_program_by_program_type_table(df: pd.DataFrame) -> pd.DataFrame:
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant data.
         - Table column headers are pulled from `text.json`.
     """
-    df = df[['Program External ID', 'Program Service Category', 'Food Program Category']]
+    df = build_entity_store(df)["programs"][['Program External ID', 'Program Service Category', 'Food Program Category']]
     df.columns = TEXT["APPENDIX PROGRAM TYPE"]["columns"]
     return df.drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_by_program_audience_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs categorized by their program audience groups based on the provided DataFrame.
@@ -2308,11 +3557,12 @@ def create_program_by_program_audience_table(df: pd.DataFrame) -> pd.DataFrame:
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant program data.
         - Table column headers are pulled from `text.json`.
     """
-    df = df[['Program External ID', 'Program Audience Groups']]
+    df = build_entity_store(df)["programs"][['Program External ID', 'Program Audience Groups']]
     df.columns = TEXT["APPENDIX PROGRAM AUDIENCE"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX PROGRAM AUDIENCE"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_by_program_languages_spoken_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs categorized by the languages spoken based on the provided DataFrame.
@@ -2350,11 +3600,12 @@ def create_program_by_program_languages_spoken_table(df: pd.DataFrame) -> pd.Dat
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant program data.
         - Table column headers are pulled from `text.json`.
     """
-    df = df[['Program External ID', 'Languages Spoken']]
+    df = build_entity_store(df)["programs"][['Program External ID', 'Languages Spoken']]
     df.columns = TEXT["APPENDIX PROGRAM LANGUAGES SPOKEN"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX PROGRAM LANGUAGES SPOKEN"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_by_program_features_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs categorized by the program features based on the provided DataFrame.
@@ -2391,11 +3642,12 @@ def create_program_by_program_features_table(df: pd.DataFrame) -> pd.DataFrame:
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant program data.
         - Table column headers are pulled from `text.json`.
     """
-    df = df[['Program External ID', 'Food Program Features']]
+    df = build_entity_store(df)["programs"][['Program External ID', 'Food Program Features']]
     df.columns = TEXT["APPENDIX PROGRAM FEATURES"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX PROGRAM FEATURES"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_by_program_items_offered_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs categorized by dietary options based on the provided DataFrame.
@@ -2434,11 +3686,12 @@ def create_program_by_program_items_offered_table(df: pd.DataFrame) -> pd.DataFr
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant program data.
         - Table column headers are pulled from `text.json`.
     """
-    df = df[['Program External ID', 'Items Offered']]
+    df = build_entity_store(df)["programs"][['Program External ID', 'Items Offered']]
     df.columns = TEXT["APPENDIX PROGRAM ITEMS OFFERED"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX PROGRAM ITEMS OFFERED"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_by_program_dietary_options_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs categorized by dietary options based on the provided DataFrame.
@@ -2477,11 +3730,12 @@ def create_program_by_program_dietary_options_table(df: pd.DataFrame) -> pd.Data
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant program data.
         - Table column headers are pulled from `text.json`.
     """
-    df = df[['Program External ID', 'Dietary Options Available']]
+    df = build_entity_store(df)["programs"][['Program External ID', 'Dietary Options Available']]
     df.columns = TEXT["APPENDIX PROGRAM DIETARY OPTIONS"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX PROGRAM DIETARY OPTIONS"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_location_hours_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of location hours based on the provided DataFrame.
@@ -2526,6 +3780,7 @@ def create_location_hours_table(df: pd.DataFrame) -> pd.DataFrame:
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant location hours data.
         - Table column headers are pulled from `text.json`.
     """
+    df = get_entity_rows(df, ["hours", "locations"], columns=['Location External ID'] + HOURS_COLUMNS)
     location_hours_one = df[['Location External ID', 'Hours Entity Type', 'Hours Open 1', 'Hours Closed 1', 'Day of Week', 'Frequency']].loc[(df['Hours Entity Type'] == 'Location')  & (df['Hours Open 1'].notna()) & (df['Hours Closed 1'].notna())].rename(columns={'Hours Open 1': 'Hours Open',
                                                                                                                                                                                                                                       'Hours Closed 1': 'Hours Closed'})
     location_hours_two = df[['Location External ID', 'Hours Entity Type', 'Hours Open 2', 'Hours Closed 2', 'Day of Week', 'Frequency']].loc[(df['Hours Entity Type'] == 'Location')  & (df['Hours Open 2'].notna()) & (df['Hours Closed 2'].notna())].rename(columns={'Hours Open 2': 'Hours Open',
@@ -2533,13 +3788,14 @@ def create_location_hours_table(df: pd.DataFrame) -> pd.DataFrame:
     location_hours_three = df[['Location External ID', 'Hours Entity Type', 'Hours Open 3', 'Hours Closed 3', 'Day of Week', 'Frequency']].loc[(df['Hours Entity Type'] == 'Location')  & (df['Hours Open 3'].notna())  & (df['Hours Closed 3'].notna())].rename(columns={'Hours Open 3': 'Hours Open',
                                                                                                                                                                                                                                       'Hours Closed 3': 'Hours Closed'})
     location_hours = pd.concat([location_hours_one, location_hours_two, location_hours_three], axis=0).drop_duplicates()
-    location_hours['Frequency'] = location_hours['Frequency'].fillna('Date Specific')
+    location_hours['Frequency'] = location_hours['Frequency'].astype(object).fillna('Date Specific')
     location_date_specific = df['Specific Date'].loc[(df['Hours Entity Type'] == 'Location')].dropna().drop_duplicates()
-    location_hours['Day of Week'] = location_hours['Day of Week'].fillna(location_date_specific)
+    location_hours['Day of Week'] = location_hours['Day of Week'].astype(object).fillna(location_date_specific)
     location_hours.columns = TEXT["APPENDIX LOCATION HOURS INFORMATION"]["columns"]
     return location_hours.sort_values(by=TEXT["APPENDIX LOCATION HOURS INFORMATION"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_hours_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of program hours based on the provided DataFrame.
@@ -2584,6 +3840,7 @@ def create_program_hours_table(df: pd.DataFrame) -> pd.DataFrame:
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant program hours data.
         - Table column headers are pulled from `text.json`.
     """
+    df = get_entity_rows(df, ["hours", "programs"], columns=['Program External ID'] + HOURS_COLUMNS)
     program_hours_one = df[['Program External ID', 'Hours Entity Type', 'Hours Open 1', 'Hours Closed 1', 'Day of Week', 'Frequency']].loc[(df['Hours Entity Type'] == 'Program')  & (df['Hours Open 1'].notna()) & (df['Hours Closed 1'].notna())].rename(columns={'Hours Open 1': 'Hours Open',
                                                                                                                                                                                                                                       'Hours Closed 1': 'Hours Closed'})
     program_hours_two = df[['Program External ID', 'Hours Entity Type', 'Hours Open 2', 'Hours Closed 2', 'Day of Week', 'Frequency']].loc[(df['Hours Entity Type'] == 'Program')  & (df['Hours Open 2'].notna()) & (df['Hours Closed 2'].notna())].rename(columns={'Hours Open 2': 'Hours Open',
@@ -2591,13 +3848,14 @@ def create_program_hours_table(df: pd.DataFrame) -> pd.DataFrame:
     program_hours_three = df[['Program External ID', 'Hours Entity Type', 'Hours Open 3', 'Hours Closed 3', 'Day of Week', 'Frequency']].loc[(df['Hours Entity Type'] == 'Program')  & (df['Hours Open 3'].notna())  & (df['Hours Closed 3'].notna())].rename(columns={'Hours Open 3': 'Hours Open',
                                                                                                                                                                                                                                       'Hours Closed 3': 'Hours Closed'})
     program_hours = pd.concat([program_hours_one, program_hours_two, program_hours_three], axis=0).drop_duplicates()
-    program_hours['Frequency'] = program_hours['Frequency'].fillna('Date Specific')
+    program_hours['Frequency'] = program_hours['Frequency'].astype(object).fillna('Date Specific')
     program_date_specific = df['Specific Date'].loc[(df['Hours Entity Type'] == 'Program')].dropna().drop_duplicates()
-    program_hours['Day of Week'] = program_hours['Day of Week'].fillna(program_date_specific)
+    program_hours['Day of Week'] = program_hours['Day of Week'].astype(object).fillna(program_date_specific)
     program_hours.columns = TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"]
     return program_hours.sort_values(by=TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_by_program_qualifications_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs categorized by qualifications based on the provided DataFrame.
@@ -2637,11 +3895,12 @@ def create_program_by_program_qualifications_table(df: pd.DataFrame) -> pd.DataF
         - Ensure that the provided DataFrame contains the necessary columns and represents the relevant program data.
         - Table column headers are pulled from `text.json`.
     """
-    df = df[['Program External ID', 'Program Qualifications']]
+    df = build_entity_store(df)["programs"][['Program External ID', 'Program Qualifications']]
     df.columns = TEXT["APPENDIX PROGRAM QUALIFICATIONS"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX PROGRAM QUALIFICATIONS"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
+@memoize_table
 def create_program_by_program_service_area_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates a table of programs categorized by service area based on the provided DataFrame.
@@ -2680,20 +3939,21 @@ def create_program_by_program_service_area_table(df: pd.DataFrame) -> pd.DataFra
         - The resulting DataFrame is sorted based on the `Program External ID` column in ascending order.
         - Table column headers are pulled from `text.json`.
     """
-    df = df[['Program External ID', 'Program Service Area']]
+    df = build_entity_store(df)["programs"][['Program External ID', 'Program Service Area']]
     df.columns = TEXT["APPENDIX PROGRAM SERVICE AREAS"]["columns"]
     return df.sort_values(by=TEXT["APPENDIX PROGRAM SERVICE AREAS"]["columns"][0], ascending=True).drop_duplicates().reset_index(drop=True)
 
 
-def create_program_sub_filter_usage_table(df: pd.DataFrame) -> pd.DataFrame:
+@memoize_table
+def create_sub_filter_matrix(df: pd.DataFrame) -> fm.FilterMatrix:
     """
-    Create a table that summarizes the usage of `sub-filters` for locations and programs.
+    Create the sparse matrix of the `sub-filter` tokens used by each location, splitting every `sub-filter` column in a single pass.
 
     Args:
         `df` (pd.DataFrame): A DataFrame containing location and program `sub-filter` data.
 
     Returns:
-        `pd.DataFrame`: A new DataFrame summarizing the usage of `sub-filters` for locations and programs.
+        `fm.FilterMatrix`: A filter matrix with one row per unique `Location External ID`, and one column per token of each `sub-filter` column.
 
     Preconditions:
         - The Pandas DataFrame must contain the location and program `sub-filter` columns, as well as a unique `Location External ID`.
@@ -2703,33 +3963,56 @@ def create_program_sub_filter_usage_table(df: pd.DataFrame) -> pd.DataFrame:
 
     Example:
         >>> data = pd.DataFrame({
-        ...     "Location External ID": [101, 101, 102, 102, 103, 101, 104],
-        ...     "Filter A": ["Option 1; Option 2", "Option 2", "Option 1; Option 3", "Option 2", ""],
-        ...     "Filter B": ["Option X", "Option Y", "Option X", "Option Y", "Option X", "Option Z", "Option Z"]
+        ...     "Location External ID": [101, 101, 102],
+        ...     "Items Offered": ["Dairy; Eggs", "Eggs", np.nan],
+        ...     "Dietary Options Available": ["Vegan", "Halal", "Vegan"]
         ... })
-        >>> result = create_program_sub_filter_usage_table(data)
-        >>> print(result)
-            Filter A                            Filter B
-        0       Option 2 - 42.9%                    Option X - 42.9%
-        1       Option 1 - 28.6%                    Option Y - 28.6%
-        2       Option 3 - 14.3%                    Option Z - 28.6%
-        3       No Filters Used - 14.3%             No Filters Used - 0%
-        4       Option 4 - 0%          
+        >>> result = create_sub_filter_matrix(data)
+        >>> print(result.get_usage_counts("Items Offered").head(3))
+        Dairy                   1
+        Eggs                    1
+        Meat                    0
+        dtype: int64
+
+    Additional Information:
+        - The vocabulary of each `sub-filter` column is seeded from `recommended_filters.csv`, so unused recommended filters are counted as 0.
+        - Locations with an empty `sub-filter` cell are counted as `No Filters Used` (see `fm.FilterMatrix.get_unused_counts`).
+        - Shared by `create_program_sub_filter_usage_table` and `create_most_used_sub_filter_table`, which only reduce the matrix.
+    """
+    new_df = get_entity_rows(df, ["programs", "locations"], columns=["Location External ID"] + RECOMMENDED_FILTERS.columns.values.tolist())
+    return fm.build_filter_matrix(new_df, "Location External ID", RECOMMENDED_FILTERS)
+
+
+def build_program_sub_filter_usage_table(filters: fm.FilterMatrix) -> pd.DataFrame:
+    """
+    Builds the sub-filter usage table from the sub-filter matrix of the locations.
+
+    Args:
+        `filters` (fm.FilterMatrix): The sub-filter tokens used by each location, as returned by `create_sub_filter_matrix`.
+
+    Returns:
+        `pd.DataFrame`: A new DataFrame summarizing the usage of each sub-filter, as a percentage of locations.
+
+    Preconditions:
+        - The filter matrix must have at least one location.
+
+    Raises:
+        None.
+
+    Example:
+        >>> build_program_sub_filter_usage_table(create_sub_filter_matrix(data))
+
+    Additional Information:
+        - The filter matrices of separate chunks of a bulk upload can be merged, then passed to this function (see `chunkedAggregator.py`).
     """
-    location_count = df["Location External ID"].drop_duplicates().shape[0]
+    location_count = len(filters.entities)
+    unused_counts = filters.get_unused_counts()
     data_dict = {}
     for column in RECOMMENDED_FILTERS.columns.values.tolist():
 
         # Assemble Values
-        temp_df = df[["Location External ID", column]].set_index(['Location External ID']).apply(lambda x: x.astype(str).str.split(';').explode()).reset_index()
-        temp_df[column] = temp_df[column].str.strip()
-        temp_df = temp_df.groupby(column)['Location External ID'].nunique().to_frame().reset_index().rename(columns={'Location External ID':'Count'})
-        temp_df[column] = temp_df[column].replace({'nan':'No Filters Used', "": "delete"})
-        temp_df = temp_df.drop(temp_df[temp_df[column] == 'delete'].index)
-        for value in RECOMMENDED_FILTERS[column].to_list() + ["No Filters Used"]:
-            if value not in temp_df[column].values and not pd.isnull(value):
-                temp_df.loc[len(temp_df)] = {column: value, 'Count': 0}
-                # temp_df = temp_df.append({column: value, "Count": 0}, ignore_index=True)          # Code supported in pandas-1.5.2
+        temp_df = filters.get_usage_counts(column).rename("Count").rename_axis(column).reset_index()
+        temp_df.loc[len(temp_df)] = {column: "No Filters Used", "Count": unused_counts[column]}
         temp_df = temp_df.sort_values(by=["Count", column], ascending=[False, True]).reset_index(drop=True)
         
         # Format Data
@@ -2759,6 +4042,7 @@ def create_program_sub_filter_usage_table(df: pd.DataFrame) -> pd.DataFrame:
     return new_df.reset_index(drop=True)
         
 
+@memoize_table
 def create_program_sub_filter_usage_table_group_a(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create a table that summarizes the usage of `Program Service Category` and `Food Program Category` for locations and programs.
@@ -2795,6 +4079,42 @@ def create_program_sub_filter_usage_table_group_a(df: pd.DataFrame) -> pd.DataFr
     return new_df[select_columns].dropna(how='all')
 
 
+@memoize_table
+def create_program_sub_filter_usage_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Create a table that summarizes the usage of `sub-filters` for locations and programs.
+
+    Args:
+        `df` (pd.DataFrame): A DataFrame containing location and program `sub-filter` data.
+
+    Returns:
+        `pd.DataFrame`: A new DataFrame summarizing the usage of `sub-filters` for locations and programs.
+
+    Preconditions:
+        - The Pandas DataFrame must contain the location and program `sub-filter` columns, as well as a unique `Location External ID`.
+
+    Raises:
+        None.
+
+    Example:
+        >>> data = pd.DataFrame({
+        ...     "Location External ID": [101, 101, 102, 102, 103, 101, 104],
+        ...     "Filter A": ["Option 1; Option 2", "Option 2", "Option 1; Option 3", "Option 2", ""],
+        ...     "Filter B": ["Option X", "Option Y", "Option X", "Option Y", "Option X", "Option Z", "Option Z"]
+        ... })
+        >>> result = create_program_sub_filter_usage_table(data)
+        >>> print(result)
+            Filter A                            Filter B
+        0       Option 2 - 42.9%                    Option X - 42.9%
+        1       Option 1 - 28.6%                    Option Y - 28.6%
+        2       Option 3 - 14.3%                    Option Z - 28.6%
+        3       No Filters Used - 14.3%             No Filters Used - 0%
+        4       Option 4 - 0%          
+    """
+    return build_program_sub_filter_usage_table(create_sub_filter_matrix(df))
+
+
+@memoize_table
 def create_program_sub_filter_usage_table_group_b(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create a table that summarizes the usage of `Location Features` and `Food Program Features` for locations and programs.
@@ -2831,6 +4151,7 @@ def create_program_sub_filter_usage_table_group_b(df: pd.DataFrame) -> pd.DataFr
     return new_df[select_columns].dropna(how='all')
 
 
+@memoize_table
 def create_program_sub_filter_usage_table_group_c(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create a table that summarizes the usage of `Items Offered` and `Dietary Options Available` for locations and programs.
@@ -2867,6 +4188,7 @@ def create_program_sub_filter_usage_table_group_c(df: pd.DataFrame) -> pd.DataFr
     return new_df[select_columns].dropna(how='all')
 
 
+@memoize_table
 def create_program_sub_filter_usage_table_group_d(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create a table that summarizes the usage of `Program Audience` and `Program Audience Groups` for locations and programs.
@@ -2903,6 +4225,7 @@ def create_program_sub_filter_usage_table_group_d(df: pd.DataFrame) -> pd.DataFr
     return new_df[select_columns].dropna(how='all')
 
 
+@memoize_table
 def create_program_sub_filter_usage_table_group_e(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create a table that summarizes the usage of `Languages Spoken Group 1` and `Languages Spoken Group 2` for locations and programs.
@@ -2939,6 +4262,47 @@ def create_program_sub_filter_usage_table_group_e(df: pd.DataFrame) -> pd.DataFr
     return new_df[select_columns].dropna(how='all')
 
 
+def build_most_used_sub_filter_table(filters: fm.FilterMatrix) -> pd.DataFrame:
+    """
+    Builds the table of the most used sub-filters from the sub-filter matrix of the locations.
+
+    Args:
+        `filters` (fm.FilterMatrix): The sub-filter tokens used by each location, as returned by `create_sub_filter_matrix`.
+
+    Returns:
+        `pd.DataFrame`: A DataFrame containing the five most used sub-filters, and their usage as a percentage of locations.
+
+    Preconditions:
+        - The filter matrix must have at least one location.
+
+    Raises:
+        None.
+
+    Example:
+        >>> build_most_used_sub_filter_table(create_sub_filter_matrix(data))
+
+    Additional Information:
+        - The filter matrices of separate chunks of a bulk upload can be merged, then passed to this function (see `chunkedAggregator.py`).
+        - Only the sub-filters used by at least one location are ranked.
+    """
+    location_count = len(filters.entities)
+    new_df = pd.DataFrame(columns=["Sub Filter", "Usage"])
+    for column in RECOMMENDED_FILTERS.columns.values.tolist():
+
+        # Assemble Values
+        temp_df = filters.get_usage_counts(column).rename("Usage").rename_axis("Sub Filter").reset_index()
+        temp_df = temp_df[temp_df["Usage"] > 0].sort_values(by="Sub Filter").reset_index(drop=True)
+        temp_df = temp_df.sort_values(by="Usage", ascending=False)
+        
+        # Merge DataFrames
+        new_df = pd.concat([new_df, temp_df])
+
+    new_df = new_df.sort_values(by="Usage", ascending=False)
+    new_df["Usage"] = (round(new_df["Usage"].astype(float) / location_count * 100), 2)[0].astype(str) + "%"
+    return new_df.head(5).reset_index(drop=True)
+
+
+@memoize_table
 def create_most_used_sub_filter_table(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create a table that summarizes the most used `sub-filters` for locations and programs.
@@ -2970,24 +4334,7 @@ def create_most_used_sub_filter_table(df: pd.DataFrame) -> pd.DataFrame:
         3       Option Z            28.6%
         4       Option 1            28.6%
     """
-    location_count = df["Location External ID"].drop_duplicates().shape[0]
-    new_df = pd.DataFrame(columns=["Sub Filter", "Usage"])
-    for column in RECOMMENDED_FILTERS.columns.values.tolist():
-
-        # Assemble Values
-        temp_df = df[["Location External ID", column]].set_index(['Location External ID']).apply(lambda x: x.astype(str).str.split(';').explode()).reset_index()
-        temp_df[column] = temp_df[column].str.strip()
-        temp_df = temp_df.groupby(column)['Location External ID'].nunique().to_frame().reset_index().rename(columns={column: 'Sub Filter', 'Location External ID':'Usage'})
-        temp_df['Sub Filter'] = temp_df['Sub Filter'].replace({'nan':'delete', "": "delete"})
-        temp_df = temp_df.drop(temp_df[temp_df['Sub Filter'] == 'delete'].index)
-        temp_df = temp_df.sort_values(by="Usage", ascending=False)
-        
-        # Merge DataFrames
-        new_df = pd.concat([new_df, temp_df])
-
-    new_df = new_df.sort_values(by="Usage", ascending=False)
-    new_df["Usage"] = (round(new_df["Usage"].astype(float) / location_count * 100), 2)[0].astype(str) + "%"
-    return new_df.head(5).reset_index(drop=True)
+    return build_most_used_sub_filter_table(create_sub_filter_matrix(df))
 
 
 
@@ -3267,14 +4614,8 @@ def calculate_current_next_month(_: any, text: dict, section: str, field: str) -
         >>> text["report_section"]["month_info"]
         'Current month: September, Next month: October'
     """
-    current_month = {day: 0 for day in pd.date_range(start=datetime.date.today().replace(day=1),
-                                                     end=(datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1), freq='D'
-                                                     ).to_pydatetime()}
-    current_month_name = calendar.month_name[int(list(current_month.keys())[0].strftime("%m"))]
-    next_month = {day: 0 for day in pd.date_range(start=(datetime.date.today().replace(day=1) + datetime.timedelta(days=32)).replace(day=1),
-                                                  end=(datetime.date.today().replace(day=1) + datetime.timedelta(days=63)).replace(day=1), freq='D'
-                                                  ).to_pydatetime()}
-    next_month_name = calendar.month_name[int(list(next_month.keys())[0].strftime("%m"))]
+    current_month_name = calendar.month_name[month_range(0)[0].month]
+    next_month_name = calendar.month_name[month_range(1)[0].month]
     text[section][field] = text[section][field].format(current_month_name, next_month_name)
     return text
 
@@ -3289,13 +4630,33 @@ if __name__ == "__main__":
     parser.add_argument("file", action="store", help="The file to validate.")
     # Add silent argument
     parser.add_argument('--silent', action='store', nargs='+', help='Name of functions to not run')
+    # Add sections argument
+    parser.add_argument('--sections', action='store', nargs='+', help='Name of report sections to load columns for')
+    # Add engine argument
+    parser.add_argument('--engine', action='store', default='c', choices=['c', 'pyarrow'], help='The CSV parser engine')
+    # Add processes argument
+    parser.add_argument('--processes', action='store', type=int, help='The number of threads and processes to compute the tables and graphs with')
+    # Add map backend argument
+    parser.add_argument('--map-backend', action='store', default='plotly', choices=['plotly', 'pil'], help='The renderer of the location maps')
+    # Add profile argument
+    parser.add_argument('--profile', action='store_true', help='Save the time and memory of each stage as profile.json')
+    # Add no cache argument
+    parser.add_argument('--no-cache', action='store_true', help='Compute every table and graph, rather than reusing the unchanged ones of an earlier run')
+    # Add vector argument
+    parser.add_argument('--vector', action='store_true', help='Save the graphs as vector images (SVG) rather than PNGs')
     # Console arguments
     args = parser.parse_args()
+    # Enable profiling
+    if args.profile:
+        sp.enable_profiling(bul, ["load_"])
+        sp.enable_profiling(sys.modules[__name__], ["create_", "graph_", "calculate_", "render_"])
     
     # Create directory name
     directory = "data_" + args.file.split("\\")[-1].replace(".csv", "")
     # Create DataFrame
-    df = pd.read_csv(args.file)
+    df = bul.load_bulk_upload(args.file, sections=args.sections, engine=args.engine)
+    # Create artifact cache
+    artifact_cache = None if args.no_cache else ac.ArtifactCache(ac.hash_values(ac.hash_file(args.file), args.sections, args.engine))
     # Create a list of graphing functions
     graphing_functions = [
         # create_map,
@@ -3370,23 +4731,28 @@ if __name__ == "__main__":
     # Create list of silenced functions
     silenced_functions = args.silent if args.silent else []
 
-    # Create valid graphing functions
-    valid_graphing_functions = [graph for graph in graphing_functions if graph.__name__ not in silenced_functions]
-    # Create valid DataFrame functions
-    valid_dataframe_functions = [dataframe for dataframe in dataframe_functions if dataframe.__name__ not in silenced_functions]
+    # Create list of requested outputs
+    outputs = [function.__name__ for function in graphing_functions + dataframe_functions] + ["create_zoomed_map"] + list(REPORT_TEXT_FIELDS.keys())
+    # Create keyword arguments of the maps
+    keywords = {"create_map": {"backend": args.map_backend}, "create_zoomed_map": {"lat_epicenter": 42.355455, "lon_epicenter": -71.063868, "backend": args.map_backend}}
+    # Create keyword arguments of the graphs
+    keywords.update({name: {"vector": True} for name in outputs if args.vector and get_node_kind(name) == "graph" and name not in keywords})
 
     # Execute functions
-    [graph(df, directory) for graph in valid_graphing_functions]
-    create_zoomed_map(df, directory, lat_epicenter=42.355455, lon_epicenter=-71.063868)
-    [dataframe(df).to_csv(directory + "/csvs/" + dataframe.__name__ + ".csv") for dataframe in valid_dataframe_functions]
-    TEXT = calculate_percent_locations_inactive(df, TEXT, "NETWORK OVERVIEW", "paragraph")
-    TEXT = calculate_locations_programs_without_contact(df, TEXT, "PUBLIC CONTACT INFORMATION", "paragraph")
-    TEXT = calculate_food_distribution_program_percent(df, TEXT, "PROGRAM TYPES", "paragraph two")
-    TEXT = calculate_least_used_programs(df, TEXT, "PROGRAM FILTER FIELDS", "paragraph")
-    TEXT = calculate_current_next_month(df, TEXT, "LOCATION HOURS PREVIEW", "paragraph")
+    results = run_report_graph(df, directory, outputs, text=TEXT, keywords=keywords, silenced=silenced_functions, processes=1 if args.profile else args.processes, cache=artifact_cache)
+    wait_for_figures()
+    [results[dataframe.__name__].to_csv(directory + "/csvs/" + dataframe.__name__ + ".csv") for dataframe in dataframe_functions if dataframe.__name__ in results]
 
     # Save State
     save_state(TEXT, TEXT_SAVE_NAME.replace('resources/', ''), directory + "/resources")
     save_state(WEIGHTS, WEIGHTS_SAVE_NAME.replace('resources/', ''), directory + "/resources")
     save_state(RECOMMENDED_FILTERS, RECOMMENDED_FILTERS_SAVE_NAME.replace('resources/', ''), directory + "/resources")
     save_state(PROFILE_COMPLETION_TIERS, PROFILE_COMPLETION_TIERS_SAVE_NAME.replace('resources/', ''), directory + "/resources")
+
+    # Save Profile
+    if args.profile:
+        sp.save_profile(directory + "/profile.json")
+
+    # Prune artifact cache
+    if artifact_cache:
+        ac.prune_artifacts()
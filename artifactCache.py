@@ -0,0 +1,423 @@
+"""
+Artifact Cache.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to reuse the tables, graphs, and text fields of a report across runs.
+This file defines an on-disk, content-addressed cache, which stores each artifact under a hash of everything the artifact is computed from.
+An artifact is reused for as long as its hash is unchanged, so re-running a report on the same bulk upload only recomputes the artifacts whose inputs changed.
+The hash of each artifact is built by the Analytics Engine (see `get_artifact_key` in `analyticsEngine.py`).
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * OS                                * Hashlib                               * Pickle
+    * Threading                         * Pandas                                * Time
+    * ImportLib                         * ArgParse
+
+Instructions:
+    1) Import the artifact cache: `import artifactCache as ac`
+    2) Create an artifact cache for a bulk upload file: `cache = ac.ArtifactCache(ac.hash_file("sample_dataset.csv"))`
+        a) (Optional) Hash the loading options along with the file, if they change the loaded DataFrame: `cache = ac.ArtifactCache(ac.hash_values(ac.hash_file("sample_dataset.csv"), "pyarrow"))`
+    3) Pass the artifact cache to the report graph: `ae.run_report_graph(df, directory, outputs, cache=cache)`
+    4) (Optional) Prune the artifact cache, deleting the artifacts unused for `ARTIFACT_MAX_AGE_DAYS` and then the least recently used beyond `ARTIFACT_MAX_SIZE_MB`: `python artifactCache.py`
+        a) (Optional) Add `--max-age-days {days}` and `--max-size-mb {megabytes}` to set the limits
+        b) (Optional) Clear the artifact cache by deleting the folder `resources/artifacts`
+
+Desired Output:
+    * A folder will be created with the name `resources/artifacts`, containing each artifact saved as `{hash prefix}/{hash}.pickle`.
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Artifact Cache - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import os                               # OS, used to read and write the cached artifacts.
+import hashlib                          # Hashlib, used to hash the bulk upload file and the inputs of each artifact.
+import pickle                           # Pickle, used to save the tables, graphs, and text fields as files.
+import threading                        # Threading, used to name the temporary file of each write uniquely.
+import pandas as pd                     # Pandas, used to hash the tables read by each artifact.
+import time                             # Time, used to find the artifacts unused for longer than the age limit.
+import importlib.metadata               # Importlib Metadata, used to hash the versions of the packages the artifacts are computed with.
+import argparse                         # Argparse, used for the Command Line Interface.
+
+# MISC CONSTANTS
+ARTIFACT_CACHE_DIRECTORY = "resources/artifacts"                                                                # Path to the artifact cache, holding each artifact saved as a pickle file.
+CACHE_VERSION = 2                                                                                               # The version of the artifact format, hashed into every artifact; increment after changing how artifacts are saved.
+HASH_CHUNK_SIZE = 1024 * 1024                                                                                   # The number of bytes of a file read at a time while hashing.
+PACKAGES = ["pandas", "numpy", "matplotlib", "pillow", "plotly", "kaleido", "pyarrow"]                          # The packages the artifacts are computed with, whose versions are hashed into every artifact.
+ARTIFACT_MAX_AGE_DAYS = 30                                                                                      # The number of days an artifact is kept without being used, when the cache is pruned.
+ARTIFACT_MAX_SIZE_MB = 2048                                                                                     # The size of the artifact cache in megabytes, past which the least recently used artifacts are deleted when the cache is pruned.
+
+
+
+
+# HELPERS
+def hash_file(filepath: str) -> str:
+    """
+    Returns the SHA-256 hash of the contents of a file.
+
+    Args:
+        `filepath` (str): The path to the file.
+
+    Returns:
+        `str`: The hexadecimal SHA-256 hash of the file.
+
+    Preconditions:
+        - The `filepath` must be a valid path to a file.
+
+    Raises:
+        `FileNotFoundError`: If the file does not exist.
+
+    Example:
+        >>> hash_file("sample_dataset.csv")
+        '3b9f0c...'
+
+    Additional Information:
+        - The file is read in chunks of `HASH_CHUNK_SIZE` bytes, so large bulk uploads are never held in memory.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_values(*values: any) -> str:
+    """
+    Returns the SHA-256 hash of a list of values.
+
+    Args:
+        `*values` (any): The values to hash, each a string or an object with a stable `repr`.
+
+    Returns:
+        `str`: The hexadecimal SHA-256 hash of the values.
+
+    Preconditions:
+        - The values must have the same `repr` on every run (no memory addresses).
+
+    Raises:
+        None.
+
+    Example:
+        >>> hash_values("graph_program_type", {"backend": "pil"})
+        '9d1e4a...'
+    """
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update(repr(value).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def hash_table(table: pd.DataFrame) -> str:
+    """
+    Returns the SHA-256 hash of the contents of a table.
+
+    Args:
+        `table` (pd.DataFrame): The table to hash, a DataFrame or Series.
+
+    Returns:
+        `str`: The hexadecimal SHA-256 hash of the table.
+
+    Preconditions:
+        - The values of the table must be hashable by `pd.util.hash_pandas_object` (no lists or dictionaries).
+
+    Raises:
+        `TypeError`: If a value of the table cannot be hashed.
+
+    Example:
+        >>> hash_table(ae.create_program_by_program_type_table(data))
+        'e3b0c4...'
+
+    Additional Information:
+        - The hash covers the values, index, column headers, and data types of the table, so two tables share a hash only if they are equal.
+    """
+    digest = hashlib.sha256()
+    columns = list(table.columns) if isinstance(table, pd.DataFrame) else [table.name]
+    dtypes = list(table.dtypes.astype(str)) if isinstance(table, pd.DataFrame) else [str(table.dtype)]
+    digest.update(repr((columns, dtypes)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(table, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def get_package_version(package: str) -> str:
+    """
+    Returns the installed version of a package.
+
+    Args:
+        `package` (str): The distribution name of the package, such as `pandas`.
+
+    Returns:
+        `str`: The version of the package, or None if it is not installed.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_package_version("pandas")
+        '2.1.4'
+    """
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def hash_code(modules: list, packages: list=PACKAGES) -> str:
+    """
+    Returns the SHA-256 hash of the code the artifacts are computed with.
+
+    Args:
+        `modules` (list): The modules the artifacts are computed with, such as the Analytics Engine and the Bulk Upload Loader.
+        `packages` (list) [kwargg]: The packages the artifacts are computed with, defaulted to `PACKAGES`.
+
+    Returns:
+        `str`: The hexadecimal SHA-256 hash of `CACHE_VERSION`, the source files of the modules, and the versions of the packages.
+
+    Preconditions:
+        - The modules must be loaded from source files.
+
+    Raises:
+        None.
+
+    Example:
+        >>> hash_code([ae, bul, rr])
+        '41c7d2...'
+
+    Additional Information:
+        - Any edit to one of the modules, or an upgrade of one of the packages, invalidates every artifact, so no artifact computed by older code is reused.
+        - Packages that are not installed are hashed as None.
+    """
+    return hash_values(
+        CACHE_VERSION,
+        [(module.__name__.split(".")[-1], hash_file(module.__file__)) for module in modules],
+        [(package, get_package_version(package)) for package in packages]
+    )
+
+
+def prune_artifacts(cache_directory: str=ARTIFACT_CACHE_DIRECTORY, max_age_days: float=ARTIFACT_MAX_AGE_DAYS, max_size_mb: float=ARTIFACT_MAX_SIZE_MB) -> dict:
+    """
+    Deletes the artifacts unused for longer than the age limit, and then the least recently used artifacts until the cache fits the size limit.
+
+    Args:
+        `cache_directory` (str) [kwargg]: The path to the artifact cache, defaulted to `ARTIFACT_CACHE_DIRECTORY`.
+        `max_age_days` (float) [kwargg]: The number of days an artifact is kept without being used, defaulted to `ARTIFACT_MAX_AGE_DAYS`; None for no age limit.
+        `max_size_mb` (float) [kwargg]: The size of the cache in megabytes, defaulted to `ARTIFACT_MAX_SIZE_MB`; None for no size limit.
+
+    Returns:
+        `dict`: A dictionary of the number of artifacts deleted and kept, and the megabytes kept.
+
+    Preconditions:
+        - No report may be reading the cache while it is pruned, as an artifact found by `contains` could be deleted before it is loaded.
+
+    Raises:
+        None.
+
+    Example:
+        >>> prune_artifacts(max_age_days=7)
+        {'deleted': 120, 'kept': 640, 'kept_mb': 212.4}
+
+    Additional Information:
+        - An artifact is used when it is saved or loaded (see `ArtifactCache.load`), so the age of an artifact is the time since it was last used.
+        - Leftover temporary files of crashed writes are deleted once they are an hour old, and emptied folders are removed.
+    """
+    artifacts = []
+    if os.path.isdir(cache_directory):
+        for root, _, filenames in os.walk(cache_directory):
+            for filename in filenames:
+                filepath = os.path.join(root, filename)
+                stat = os.stat(filepath)
+                artifacts.append((stat.st_mtime, stat.st_size, filepath))
+    artifacts.sort(reverse=True)
+    oldest = time.time() - max_age_days * 86400 if max_age_days is not None else None
+    budget = max_size_mb * 1024 * 1024 if max_size_mb is not None else None
+    deleted, kept, kept_size = 0, 0, 0
+    for modified, size, filepath in artifacts:
+        if filepath.endswith(".tmp"):
+            expired = modified < time.time() - 3600
+        else:
+            expired = (oldest is not None and modified < oldest) or (budget is not None and kept_size + size > budget)
+        if expired:
+            try:
+                os.remove(filepath)
+                deleted += 1
+            except FileNotFoundError:
+                pass
+        elif not filepath.endswith(".tmp"):
+            kept += 1
+            kept_size += size
+    for root, _, _ in sorted(os.walk(cache_directory), reverse=True):
+        if root != cache_directory and not os.listdir(root):
+            os.rmdir(root)
+    return {"deleted": deleted, "kept": kept, "kept_mb": round(kept_size / 1024 / 1024, 1)}
+
+
+
+
+# ARTIFACT CACHE CLASS
+class ArtifactCache():
+    """
+    A class representing the on-disk artifact cache of a bulk upload file.
+
+    Attributes:
+        `input_hash` (str): The hash of the bulk upload file, hashed into every artifact.
+        `cache_directory` (str): The path to the folder of the cached artifacts.
+
+    Methods:
+        `artifact_path`: Returns the path to the cached copy of an artifact.
+        `contains`: Returns True if an artifact is cached.
+        `load`: Returns a cached artifact.
+        `save`: Caches an artifact.
+    """
+
+    def __init__(self, input_hash: str, cache_directory: str=ARTIFACT_CACHE_DIRECTORY) -> None:
+        """
+        Initializes a new ArtifactCache instance.
+
+        Args:
+            `input_hash` (str): The hash of the bulk upload file, as returned by `hash_file`, optionally hashed with its loading options by `hash_values`.
+            `cache_directory` (str) [kwargg]: The path to the artifact cache, defaulted to `ARTIFACT_CACHE_DIRECTORY`.
+
+        Returns:
+            None.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> cache = ArtifactCache(hash_file("sample_dataset.csv"))
+        """
+        self.input_hash = input_hash
+        self.cache_directory = cache_directory
+        return
+
+    def artifact_path(self, key: str) -> str:
+        """
+        Returns the path to the cached copy of an artifact.
+
+        Args:
+            `key` (str): The hash of the artifact.
+
+        Returns:
+            `str`: The path to the cached copy of the artifact, whether or not it exists.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> cache.artifact_path("9d1e4a...")
+            'resources/artifacts/9d/9d1e4a....pickle'
+        """
+        return f"{self.cache_directory}/{key[:2]}/{key}.pickle"
+
+    def contains(self, key: str) -> bool:
+        """
+        Returns True if an artifact is cached, else False.
+
+        Args:
+            `key` (str): The hash of the artifact.
+
+        Returns:
+            `bool`: True if the artifact is cached, else False.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> cache.contains("9d1e4a...")
+            True
+        """
+        return os.path.isfile(self.artifact_path(key))
+
+    def load(self, key: str) -> tuple:
+        """
+        Returns a cached artifact.
+
+        Args:
+            `key` (str): The hash of the artifact.
+
+        Returns:
+            `tuple`: A tuple containing the value of the artifact, and a dictionary of the files of the artifact (keyed on the file name, holding the bytes of the file).
+
+        Preconditions:
+            - The artifact must be cached.
+
+        Raises:
+            `FileNotFoundError`: If the artifact is not cached.
+
+        Example:
+            >>> cache.load("9d1e4a...")
+            ('{directory}/images/program_by_program_type.png', {'images/program_by_program_type.png': b'\\x89PNG\\r\\n...'})
+
+        Additional Information:
+            - The modified time of the artifact is updated, so `prune_artifacts` deletes the least recently used artifacts first.
+        """
+        with open(self.artifact_path(key), "rb") as file:
+            artifact = pickle.load(file)
+        os.utime(self.artifact_path(key))
+        return artifact["value"], artifact["files"]
+
+    def save(self, key: str, value: any, files: dict=None) -> None:
+        """
+        Caches an artifact.
+
+        Args:
+            `key` (str): The hash of the artifact.
+            `value` (any): The value of the artifact, such as a table or the filled text of a text field.
+            `files` (dict) [kwargg]: A dictionary of the files of the artifact (keyed on the file name, holding the bytes of the file), defaulted to None.
+
+        Returns:
+            None.
+
+        Preconditions:
+            - The value must be picklable.
+
+        Raises:
+            None.
+
+        Example:
+            >>> cache.save("9d1e4a...", "{directory}/images/program_by_program_type.png", {"images/program_by_program_type.png": image})
+
+        Additional Information:
+            - The artifact is written to a temporary file and then moved into place, so a crashed or concurrent report never reads a partially written artifact.
+        """
+        filepath = self.artifact_path(key)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        temporary_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_filepath, "wb") as file:
+            pickle.dump({"value": value, "files": files if files else {}}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_filepath, filepath)
+        return
+
+
+
+
+# MAIN
+if __name__ == "__main__":
+    # Define console parser
+    parser = argparse.ArgumentParser(description="Prune the artifact cache")
+    # Add directory argument
+    parser.add_argument('--directory', action='store', default=ARTIFACT_CACHE_DIRECTORY, help='The path to the artifact cache')
+    # Add max age argument
+    parser.add_argument('--max-age-days', action='store', type=float, default=ARTIFACT_MAX_AGE_DAYS, help='Delete the artifacts unused for more than the given number of days')
+    # Add max size argument
+    parser.add_argument('--max-size-mb', action='store', type=float, default=ARTIFACT_MAX_SIZE_MB, help='Delete the least recently used artifacts until the cache fits the given number of megabytes')
+    # Console arguments
+    args = parser.parse_args()
+
+    # Prune artifact cache
+    print(prune_artifacts(args.directory, max_age_days=args.max_age_days, max_size_mb=args.max_size_mb))
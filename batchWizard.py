@@ -0,0 +1,243 @@
+"""
+Batch pdfWizard.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to generate the analytical reports (PDFs) of many networks from a single command.
+This file reads a manifest of networks and runs the pdfWizard for each network on a pool of worker processes.
+Each worker process imports the report libraries once and generates many reports, rather than paying the start up cost for every network.
+The file reports the status of each report as it finishes.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * Pandas                            * ArgParse                              * Time
+    * JSON                              * Concurrent Futures                    * OS
+
+Manifest:
+    * A CSV or JSON file, with one entry per network containing the fields `file`, `network_name`, `latitude`, `longitude`, and `city`.
+    * Example (CSV):
+        file,network_name,latitude,longitude,city
+        boston_upload.csv,Greater Boston Food Bank,42.355455,-71.063868,Boston
+    * Example (JSON):
+        [{"file": "boston_upload.csv", "network_name": "Greater Boston Food Bank", "latitude": 42.355455, "longitude": -71.063868, "city": "Boston"}]
+
+Instructions:
+    1) Complete the setup of the pdfWizard (see `pdfWizard.py`)
+    2) Add the bulk upload files and the manifest to the working directory
+    3) Run the following command: `python batchWizard.py "{path to manifest from root directory}"`
+        a) (Optional) Add `--processes {number}` to generate the reports with the given number of processes
+        b) (Optional) Add `--status {path}` to save the status of each report as a CSV
+        c) (Optional) Add `--engine pyarrow` to load the files with PyArrow (requires `pip install pyarrow`)
+        d) (Optional) Add `--map-backend pil` to draw the location maps from the cached map tiles with PIL, skipping Plotly and Kaleido
+        e) (Optional) Add `--profile` to save the time and memory of each stage of each report as `profile.json`
+        f) (Optional) Add `--no-cache` to compute every table and graph, rather than reusing the unchanged ones of an earlier run
+        g) (Optional) Add `--no-images`, `--vector`, `--parallel-sections`, and `--image-dpi {dpi}` to pass them to every report, as described in `pdfWizard.py`
+    4) The artifact cache is pruned once every report has finished (see `prune_artifacts` in `artifactCache.py`)
+
+Desired Output:
+    * For each network, a folder will be created with the name `data_{bulk upload file name}`, as described in `pdfWizard.py`.
+    * A line will be printed for each report as it finishes, containing its status.
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Batch pdfWizard - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import pandas as pd                     # Pandas, used to read the manifest and save the report statuses as CSVs.
+import argparse, os                     # Argparse and OS, used for the Command Line Interface and to count the CPUs.
+import json                             # JSON, used to parse JSON files and convert to Dictionary data types.
+import time                             # Time, used to time each report.
+import concurrent.futures               # Concurrent Futures, used to generate the reports on a pool of worker processes.
+
+# LOCAL FILE IMPORTS
+import pdfWizard as pw                  # pdfWizard, used to generate the analytical report of each network.
+import analyticsEngine as ae            # AnalyticsEngine, used to drop the graphs and tables a report leaves in its worker process.
+import stageProfiler as sp              # StageProfiler, used to restore the stages a profiled report leaves wrapped in its worker process.
+import artifactCache as ac              # ArtifactCache, used to prune the artifact cache once every report has finished.
+
+# MISC CONSTANTS
+MANIFEST_COLUMNS = ['file', 'network_name', 'latitude', 'longitude', 'city']                                    # The fields of each network in the manifest.
+
+
+
+
+# HELPERS
+def read_manifest(filepath: str) -> list:
+    """
+    Reads the networks of a manifest file.
+
+    Args:
+        `filepath` (str): The path to the manifest file (CSV or JSON).
+
+    Returns:
+        `list`: A list of dictionaries, one per network, containing the fields of `MANIFEST_COLUMNS`.
+
+    Preconditions:
+        - The `filepath` must be a valid path to a CSV file with a header row, or a JSON file containing a list of objects.
+
+    Raises:
+        `ValueError`: If the manifest file is not a CSV or JSON file.
+        `KeyError`: If a network of the manifest is missing a field of `MANIFEST_COLUMNS`.
+
+    Example:
+        >>> read_manifest("manifest.csv")
+        [{'file': 'boston_upload.csv', 'network_name': 'Greater Boston Food Bank', 'latitude': 42.355455, 'longitude': -71.063868, 'city': 'Boston'}]
+    """
+    if filepath.lower().endswith(".csv"):
+        jobs = pd.read_csv(filepath, dtype={'file': str, 'network_name': str, 'city': str}).to_dict('records')
+    elif filepath.lower().endswith(".json"):
+        with open(filepath) as file: jobs = json.load(file)
+    else:
+        raise ValueError(f"The manifest '{filepath}' is not a CSV or JSON file.")
+    for index, job in enumerate(jobs):
+        missing_columns = [column for column in MANIFEST_COLUMNS if column not in job]
+        if missing_columns:
+            raise KeyError(f"The network at index {index} of the manifest '{filepath}' is missing the fields {missing_columns}.")
+    return [{column: job[column] for column in MANIFEST_COLUMNS} for job in jobs]
+
+
+def run_job(job: dict, engine: str="c", map_backend: str="plotly", profile: bool=False, cache: bool=True, save_images: bool=True, vector: bool=False, parallel_sections: bool=False, image_dpi: int=None) -> dict:
+    """
+    Generates the report of a single network of the manifest, recording its status rather than raising.
+
+    Args:
+        `job` (dict): A network of the manifest, containing the fields of `MANIFEST_COLUMNS`.
+        `engine` (str) [kwargg]: The CSV parser engine, either `c` or `pyarrow`, defaulted to `c`.
+        `map_backend` (str) [kwargg]: The renderer of the location maps, either `plotly` or `pil`, defaulted to `plotly`.
+        `profile` (bool) [kwargg]: True to save the time and memory of each stage of the report as `profile.json`, defaulted to False.
+        `cache` (bool) [kwargg]: True to reuse the unchanged tables, graphs, and text fields of an earlier run, defaulted to True.
+        `save_images` (bool) [kwargg]: True to save the graphs in the `images` folder of the report, defaulted to True.
+        `vector` (bool) [kwargg]: True to draw the graphs as vector images (SVG), defaulted to False.
+        `parallel_sections` (bool) [kwargg]: True to render the appendix sections on worker processes and merge them into the report, defaulted to False.
+        `image_dpi` (int) [kwargg]: The largest resolution of the raster images of the report, defaulted to None (the resolution of each image).
+
+    Returns:
+        `dict`: A dictionary containing the `file` and `network_name` of the job, its `status` (`success` or `failed`), the path to the `report` or the `error`, and the `seconds` taken.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> run_job({'file': 'boston_upload.csv', 'network_name': 'Greater Boston Food Bank', 'latitude': 42.355455, 'longitude': -71.063868, 'city': 'Boston'})
+        {'file': 'boston_upload.csv', 'network_name': 'Greater Boston Food Bank', 'status': 'success', 'report': 'data_boston_upload/greater_boston_food_bank_analytical_report.pdf', 'error': '', 'seconds': 41.2}
+
+    Additional Information:
+        - The graphs of the report are rendered in the current process, as the reports are already spread across the worker processes.
+        - Whether the report succeeds or fails, the graphs, queued graph writes, memoized tables, and profiled stages it leaves in the process are dropped, so the next report of the worker starts clean.
+    """
+    status = {"file": job["file"], "network_name": job["network_name"], "status": "success", "report": "", "error": "", "seconds": 0}
+    start = time.perf_counter()
+    try:
+        status["report"] = pw.generate_report(job["file"], job["network_name"], float(job["latitude"]), float(job["longitude"]), job["city"], engine=engine, processes=1, map_backend=map_backend, profile=profile, cache=cache, save_images=save_images, vector=vector, parallel_sections=parallel_sections, image_dpi=image_dpi)
+    except Exception as error:
+        status["status"] = "failed"
+        status["error"] = f"{type(error).__name__}: {error}"
+    finally:
+        while ae.FIGURE_WRITES:
+            try:
+                ae.wait_for_figures()
+            except OSError as error:
+                if status["status"] == "success":
+                    status["status"] = "failed"
+                    status["error"] = f"{type(error).__name__}: {error}"
+        ae.clear_figures()
+        ae.clear_table_cache()
+        sp.disable_profiling()
+    status["seconds"] = round(time.perf_counter() - start, 1)
+    return status
+
+
+def run_batch(jobs: list, processes: int=None, engine: str="c", map_backend: str="plotly", profile: bool=False, cache: bool=True, save_images: bool=True, vector: bool=False, parallel_sections: bool=False, image_dpi: int=None) -> list:
+    """
+    Generates the reports of the networks of a manifest on a pool of worker processes, printing the status of each report as it finishes.
+
+    Args:
+        `jobs` (list): A list of the networks of the manifest, as returned by `read_manifest`.
+        `processes` (int) [kwargg]: The number of worker processes, defaulted to None (one per CPU, up to one per network).
+        `engine` (str) [kwargg]: The CSV parser engine, either `c` or `pyarrow`, defaulted to `c`.
+        `map_backend` (str) [kwargg]: The renderer of the location maps, either `plotly` or `pil`, defaulted to `plotly`.
+        `profile` (bool) [kwargg]: True to save the time and memory of each stage of each report as `profile.json`, defaulted to False.
+        `cache` (bool) [kwargg]: True to reuse the unchanged tables, graphs, and text fields of an earlier run, defaulted to True.
+        `save_images` (bool) [kwargg]: True to save the graphs in the `images` folder of the report, defaulted to True.
+        `vector` (bool) [kwargg]: True to draw the graphs as vector images (SVG), defaulted to False.
+        `parallel_sections` (bool) [kwargg]: True to render the appendix sections on worker processes and merge them into the report, defaulted to False.
+        `image_dpi` (int) [kwargg]: The largest resolution of the raster images of the report, defaulted to None (the resolution of each image).
+
+    Returns:
+        `list`: A list of the statuses of the reports, as returned by `run_job`, in the order of the manifest.
+
+    Preconditions:
+        - When called from a script, the call must be guarded by `if __name__ == "__main__":`.
+
+    Raises:
+        None.
+
+    Example:
+        >>> statuses = run_batch(read_manifest("manifest.csv"), processes=8)
+        [1/2] success   Greater Boston Food Bank (41.2s)
+        [2/2] failed    Second Harvest (3.4s) FileNotFoundError: [Errno 2] No such file or directory: 'second_harvest.csv'
+
+    Additional Information:
+        - Each worker process generates many reports, so the report libraries are only imported once per worker process.
+        - A failed report does not stop the batch, its error is recorded in its status.
+        - Two networks sharing a bulk upload file should not be in the same batch, as each report moves its file into its own folder.
+    """
+    if processes is None:
+        processes = min(len(jobs), os.cpu_count() or 1)
+    statuses = [None] * len(jobs)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max(processes, 1)) as executor:
+        futures = {executor.submit(run_job, job, engine=engine, map_backend=map_backend, profile=profile, cache=cache, save_images=save_images, vector=vector, parallel_sections=parallel_sections, image_dpi=image_dpi): index for index, job in enumerate(jobs)}
+        for finished, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+            status = future.result()
+            statuses[futures[future]] = status
+            print(f"[{finished}/{len(jobs)}] {status['status']:<9} {status['network_name']} ({status['seconds']}s) {status['error']}".rstrip())
+    return statuses
+
+
+
+
+# MAIN
+if __name__ == "__main__":
+    # Define console parser
+    parser = argparse.ArgumentParser(description="Create the analytical reports of the networks of a manifest")
+    # Add manifest argument
+    parser.add_argument("manifest", action="store", help="The manifest (CSV or JSON) of the networks to report on.")
+    # Add processes argument
+    parser.add_argument('--processes', action='store', type=int, help='The number of processes to generate the reports with')
+    # Add status argument
+    parser.add_argument('--status', action='store', help='The path to save the status of each report to (CSV)')
+    # Add engine argument
+    parser.add_argument('--engine', action='store', default='c', choices=['c', 'pyarrow'], help='The CSV parser engine')
+    # Add map backend argument
+    parser.add_argument('--map-backend', action='store', default='plotly', choices=['plotly', 'pil'], help='The renderer of the location maps')
+    # Add profile argument
+    parser.add_argument('--profile', action='store_true', help='Save the time and memory of each stage of each report as profile.json')
+    # Add no cache argument
+    parser.add_argument('--no-cache', action='store_true', help='Compute every table and graph, rather than reusing the unchanged ones of an earlier run')
+    # Add no images argument
+    parser.add_argument('--no-images', action='store_true', help='Embed the graphs in each report without saving them in the images folder')
+    # Add vector argument
+    parser.add_argument('--vector', action='store_true', help='Draw the graphs as vector images (SVG) rather than PNGs')
+    # Add parallel sections argument
+    parser.add_argument('--parallel-sections', action='store_true', help='Render the appendix sections of each report on a pool of processes and merge them into the report')
+    # Add image dpi argument
+    parser.add_argument('--image-dpi', action='store', type=int, help='Downsample the raster images of each report to the given resolution, in dots per inch')
+    # Console arguments
+    args = parser.parse_args()
+
+    # Generate reports
+    statuses = run_batch(read_manifest(args.manifest), processes=args.processes, engine=args.engine, map_backend=args.map_backend, profile=args.profile, cache=not args.no_cache, save_images=not args.no_images, vector=args.vector, parallel_sections=args.parallel_sections, image_dpi=args.image_dpi)
+
+    # Save statuses
+    if args.status:
+        pd.DataFrame(statuses).to_csv(args.status, index=False)
+    print(f"{sum(status['status'] == 'success' for status in statuses)}/{len(statuses)} reports generated")
+
+    # Prune artifact cache
+    if not args.no_cache:
+        ac.prune_artifacts()
@@ -0,0 +1,285 @@
+"""
+Benchmark Suite.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to measure the performance of the Analytics Engine and pdfWizard at several scales of bulk upload.
+This file times every create_*, graph_*, and calculate_* function of the Analytics Engine, as well as the full pdfWizard report, on synthetic bulk uploads.
+The timings are saved as a JSON results file, which can be compared against an earlier results file to find performance regressions.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * Pandas                            * JSON                                  * Time
+    * ArgParse                          * OS                                    * Shutil
+    * Copy                              * Platform
+
+Instructions:
+    1) Complete the setup of the pdfWizard (see `pdfWizard.py`)
+    2) Run the following command: `python benchmarkSuite.py "{path to save the results to}"`
+        a) (Optional) Add `--scales {scale names}` to only run the given scales (see `SCALES`)
+        b) (Optional) Add `--repeat {number}` to time each function the given number of times, keeping the fastest time
+        c) (Optional) Add `--compare {path to earlier results}` to compare the results against an earlier results file
+        d) (Optional) Add `--skip-report` to skip the full pdfWizard report
+
+Desired Output:
+    * A JSON file containing the seconds taken by each function at each scale.
+    * When comparing, a line will be printed for each function that is slower than `REGRESSION_THRESHOLD` times its earlier time.
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Benchmark Suite - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import pandas as pd                     # Pandas, used to report the versions of the libraries benchmarked.
+import numpy as np                      # NumPy, used to report the versions of the libraries benchmarked.
+import argparse, os, shutil             # Argparse, OS, and Shutil, used for File Manipulation and the Command Line Interface.
+import json                             # JSON, used to save and load the results files.
+import time                             # Time, used to time each function.
+import copy                             # Copy, used to give each calculate_* function a fresh copy of the report text.
+import platform                         # Platform, used to record the machine the benchmark ran on.
+
+# LOCAL FILE IMPORTS
+import analyticsEngine as ae            # AnalyticsEngine, the functions benchmarked.
+import bulkUploadLoader as bul          # BulkUploadLoader, used to load the synthetic bulk uploads.
+import bulkUploadGenerator as bug       # BulkUploadGenerator, used to generate the synthetic bulk uploads.
+import pdfWizard as pw                  # pdfWizard, used to benchmark the full report.
+
+# MISC CONSTANTS
+SCALES = {
+    "1k": {"organizations": 10, "locations": 100, "programs": 500, "hours": 1000},
+    "10k": {"organizations": 50, "locations": 1000, "programs": 5000, "hours": 10000},
+    "100k": {"organizations": 200, "locations": 10000, "programs": 50000, "hours": 100000},
+    "1m": {"organizations": 1000, "locations": 100000, "programs": 500000, "hours": 1000000}
+}                                                                                                               # A dictionary, used to map each scale to the entity counts of its synthetic bulk upload.
+DEFAULT_SCALES = ["1k", "10k", "100k"]                                                                          # The scales run when none are given.
+CALCULATIONS = {
+    "calculate_percent_locations_inactive": ("NETWORK OVERVIEW", "paragraph"),
+    "calculate_locations_programs_without_contact": ("PUBLIC CONTACT INFORMATION", "paragraph"),
+    "calculate_food_distribution_program_percent": ("PROGRAM TYPES", "paragraph two"),
+    "calculate_least_used_programs": ("PROGRAM FILTER FIELDS", "paragraph"),
+    "calculate_current_next_month": ("LOCATION HOURS PREVIEW", "paragraph")
+}                                                                                                               # A dictionary, used to map each calculate_* function to the section and field of the report text it fills.
+BENCHMARK_DIRECTORY = "benchmark"                                                                               # The directory holding the synthetic bulk uploads and graphs while benchmarking.
+REGRESSION_THRESHOLD = 1.2                                                                                      # The ratio to an earlier time above which a function is reported as a regression.
+MINIMUM_COMPARED_SECONDS = 0.05                                                                                 # The earlier time below which a function is too fast to compare reliably.
+
+
+
+
+# HELPERS
+def time_function(function: callable, repeat: int) -> float:
+    """
+    Times a function, keeping the fastest of its runs.
+
+    Args:
+        `function` (callable): The function to time, taking no arguments.
+        `repeat` (int): The number of times to run the function.
+
+    Returns:
+        `float`: The fastest run of the function, in seconds.
+
+    Preconditions:
+        - `repeat` must be positive.
+
+    Raises:
+        None.
+
+    Example:
+        >>> time_function(lambda: ae.create_location_table(data), 3)
+        0.0123
+
+    Additional Information:
+        - The memoized tables are cleared before each run, so each run measures the function and the tables it builds, rather than a cache hit.
+    """
+    times = []
+    for _ in range(repeat):
+        ae.clear_table_cache()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    ae.clear_table_cache()
+    return min(times)
+
+
+def get_benchmarked_functions() -> list:
+    """
+    Returns the names of the Analytics Engine functions benchmarked.
+
+    Args:
+        None.
+
+    Returns:
+        `list`: A list of the names of every create_*, graph_*, and calculate_* function of the Analytics Engine.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_benchmarked_functions()[:2]
+        ['create_map', 'create_zoomed_map']
+    """
+    return [name for name, function in vars(ae).items() if callable(function) and name.startswith(("create_", "graph_", "calculate_"))]
+
+
+def run_scale(scale: str, repeat: int, report: bool) -> dict:
+    """
+    Benchmarks the Analytics Engine and pdfWizard on the synthetic bulk upload of a scale.
+
+    Args:
+        `scale` (str): The scale, a key of `SCALES`.
+        `repeat` (int): The number of times to run each function, keeping the fastest time.
+        `report` (bool): True to benchmark the full pdfWizard report, else False.
+
+    Returns:
+        `dict`: A dictionary containing the entity counts of the scale, and the seconds taken by each function (None if it failed, with the error in `errors`).
+
+    Preconditions:
+        - Must be run from the root directory of the repository.
+
+    Raises:
+        `KeyError`: If the scale is not a key of `SCALES`.
+
+    Example:
+        >>> run_scale("1k", 1, False)["seconds"]["create_location_table"]
+        0.0041
+
+    Additional Information:
+        - The maps are drawn with the `pil` backend from an offline tile provider, so the benchmark makes no network requests.
+        - The full report is run on a copy of the bulk upload, and its output folder is removed afterwards.
+        - The full report is run without the artifact cache, as the generated bulk upload is the same on every run and would otherwise be read back from `resources/artifacts`.
+    """
+    if scale not in SCALES:
+        raise KeyError(f"The scale '{scale}' does not exist, expected one of {list(SCALES.keys())}.")
+    results = {**SCALES[scale], "seconds": {}, "errors": {}}
+    filepath = f"{BENCHMARK_DIRECTORY}/benchmark_{scale}.csv"
+    os.makedirs(BENCHMARK_DIRECTORY + "/images", exist_ok=True)
+
+    # Generate and load
+    start = time.perf_counter()
+    bug.generate_bulk_upload(**SCALES[scale], seed=0).to_csv(filepath, index=False)
+    results["seconds"]["generate_bulk_upload"] = time.perf_counter() - start
+    results["seconds"]["load_bulk_upload"] = time_function(lambda: bul.load_bulk_upload(filepath), repeat)
+    df = bul.load_bulk_upload(filepath)
+
+    # Functions
+    offline = ae.TILE_PROVIDER.offline
+    ae.TILE_PROVIDER.offline = True
+    for name in get_benchmarked_functions():
+        function = getattr(ae, name)
+        if name in ["create_map", "create_zoomed_map"]:
+            stage = lambda: function(df, BENCHMARK_DIRECTORY, backend="pil")
+        elif name.startswith("graph_"):
+            stage = lambda: function(df, BENCHMARK_DIRECTORY)
+        elif name.startswith("calculate_"):
+            stage = lambda: function(df, copy.deepcopy(ae.TEXT), *CALCULATIONS[name])
+        else:
+            stage = lambda: function(df)
+        try:
+            results["seconds"][name] = time_function(stage, repeat)
+        except Exception as error:
+            results["seconds"][name] = None
+            results["errors"][name] = f"{type(error).__name__}: {error}"
+    ae.TILE_PROVIDER.offline = offline
+
+    # Report
+    if report:
+        report_filepath = f"benchmark_report_{scale}.csv"
+        shutil.copyfile(filepath, report_filepath)
+        start = time.perf_counter()
+        try:
+            pw.generate_report(report_filepath, "Benchmark Network", *bug.NETWORK_CENTER, "Boston", map_backend="pil", cache=False)
+            results["seconds"]["generate_report"] = time.perf_counter() - start
+        except Exception as error:
+            results["seconds"]["generate_report"] = None
+            results["errors"]["generate_report"] = f"{type(error).__name__}: {error}"
+        shutil.rmtree("data_" + report_filepath.replace(".csv", ""), ignore_errors=True)
+        if os.path.isfile(report_filepath):
+            os.remove(report_filepath)
+    os.remove(filepath)
+    return results
+
+
+def compare_results(results: dict, earlier_results: dict) -> list:
+    """
+    Compares a results file against an earlier results file, finding the functions that became slower.
+
+    Args:
+        `results` (dict): The results, as saved by the benchmark suite.
+        `earlier_results` (dict): The earlier results, as saved by the benchmark suite.
+
+    Returns:
+        `list`: A list of tuples `(scale, function, earlier seconds, seconds)`, for each function slower than `REGRESSION_THRESHOLD` times its earlier time.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> compare_results(results, earlier_results)
+        [('100k', 'create_program_hours_table', 0.41, 0.93)]
+
+    Additional Information:
+        - Only the scales and functions timed in both results files are compared.
+        - Functions faster than `MINIMUM_COMPARED_SECONDS` in the earlier results are not compared, as their times are dominated by noise.
+    """
+    regressions = []
+    for scale, scale_results in results["scales"].items():
+        earlier_seconds = earlier_results.get("scales", {}).get(scale, {}).get("seconds", {})
+        for name, seconds in scale_results["seconds"].items():
+            if seconds is not None and (earlier_seconds.get(name) or 0) >= MINIMUM_COMPARED_SECONDS and seconds > earlier_seconds[name] * REGRESSION_THRESHOLD:
+                regressions.append((scale, name, earlier_seconds[name], seconds))
+    return regressions
+
+
+
+
+# MAIN
+if __name__ == "__main__":
+    # Define console parser
+    parser = argparse.ArgumentParser(description="Benchmark the Analytics Engine and pdfWizard on synthetic bulk uploads")
+    # Add results argument
+    parser.add_argument("results", action="store", help="The path to save the results to (JSON).")
+    # Add scales argument
+    parser.add_argument('--scales', action='store', nargs='+', default=DEFAULT_SCALES, choices=list(SCALES.keys()), help='The scales to benchmark')
+    # Add repeat argument
+    parser.add_argument('--repeat', action='store', type=int, default=1, help='The number of times to time each function')
+    # Add compare argument
+    parser.add_argument('--compare', action='store', help='The path to an earlier results file to compare against')
+    # Add skip report argument
+    parser.add_argument('--skip-report', action='store_true', help='Skip the full pdfWizard report')
+    # Console arguments
+    args = parser.parse_args()
+
+    # Benchmark
+    results = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "repeat": args.repeat,
+        "scales": {}
+    }
+    for scale in args.scales:
+        results["scales"][scale] = run_scale(scale, args.repeat, not args.skip_report)
+        print(f"{scale}: {sum(seconds for seconds in results['scales'][scale]['seconds'].values() if seconds is not None):.2f}s, {len(results['scales'][scale]['errors'])} errors")
+    shutil.rmtree(BENCHMARK_DIRECTORY, ignore_errors=True)
+
+    # Save results
+    with open(args.results, "w") as file:
+        json.dump(results, file, indent=4)
+
+    # Compare results
+    if args.compare:
+        with open(args.compare) as file:
+            earlier_results = json.load(file)
+        regressions = compare_results(results, earlier_results)
+        for scale, name, earlier_seconds, seconds in regressions:
+            print(f"REGRESSION {scale} {name}: {earlier_seconds:.3f}s -> {seconds:.3f}s ({seconds / earlier_seconds:.2f}x)")
+        print(f"{len(regressions)} regressions")
@@ -0,0 +1,368 @@
+"""
+Bulk Upload Generator.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to generate synthetic network bulk upload files for benchmarking the Analytics Engine and pdfWizard at scale.
+This file generates every column of the bulk upload schema, with tunable counts of organizations, locations, programs, and hours rows.
+The density of the multi-value filter columns and the mix of hours frequencies are also tunable.
+The generated data is deterministic, the same arguments always generate the same bulk upload.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * Pandas                            * NumPy                                 * DateTime
+    * ArgParse                          * JSON
+
+Instructions:
+    1) Import the generator: `import bulkUploadGenerator as bug`
+    2) Generate a bulk upload: `df = bug.generate_bulk_upload(organizations=100, locations=1000, programs=5000, hours=10000)`
+    3) Or, from the command line: `python bulkUploadGenerator.py "{path to save the file to}" --hours 100000`
+        a) (Optional) Add `--organizations {number}`, `--locations {number}`, and `--programs {number}` to set the entity counts
+        b) (Optional) Add `--filter-density {0 to 1}` to set the share of sub-filters selected in each multi-value filter column
+        c) (Optional) Add `--seed {number}` to generate a different bulk upload
+        d) (Optional) Add `--frequency-mix "weekly=0.6,day of month=0.3,specific date=0.1"` (or a JSON object) to set the share of each hours frequency
+
+Desired Output:
+    * A DataFrame (or CSV) with one row per hours record, containing every column of the bulk upload schema.
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Bulk Upload Generator - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import pandas as pd                     # Pandas, used to represent CSVs and large data sets as a DataFrame.
+import numpy as np                      # NumPy, adds Arrays to python and enables large arithmatic operations.
+import datetime                         # Datetime, used to place the specific date hours around the reference date.
+import argparse                         # Argparse, used for the Command Line Interface.
+import json                             # JSON, used to parse a frequency mix given as a JSON object.
+
+# LOCAL FILE IMPORTS
+import resourceRegistry as rr           # ResourceRegistry, used to share the resource files with the Analytics Engine and pdfWizard.
+
+# IMPORT CONSTANTS
+SCHEMA_SAVE_NAME = "sample_output/sample_dataset.csv"                                                           # Path to the sample bulk upload (CSV), whose header defines the bulk upload schema.
+BULK_UPLOAD_COLUMNS = pd.read_csv(SCHEMA_SAVE_NAME, nrows=0).columns.tolist()                                   # BULK_UPLOAD_COLUMNS, used to order the generated columns as in the bulk upload schema.
+RECOMMENDED_FILTERS_SAVE_NAME = 'resources/recommended_filters.csv'                                             # Path to Recommended Filters (CSV).
+RECOMMENDED_FILTERS = rr.get_resource(RECOMMENDED_FILTERS_SAVE_NAME)                                          # RECOMMENDED_FILTERS, used as the pool of sub-filters of each filter column, stored in the file, 'resources/recommended_filters.csv'
+
+# MISC CONSTANTS
+SINGLE_VALUE_FILTER_COLUMNS = ['Program Service Category', 'Program Audience', 'Food Program Category']         # Filter columns holding a single sub-filter.
+DEFAULT_FREQUENCY_MIX = {"Weekly": 0.5, "Every Other Week": 0.1, "Week of Month": 0.1, "Day of Month": 0.1,
+                         "Call for Information": 0.05, "Specific Date": 0.15}                                   # The default share of each hours frequency; `Specific Date` rows have no frequency.
+DAYS_OF_WEEK = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']                   # The values of the `Day of Week` column.
+NETWORK_CENTER = (42.355455, -71.063868)                                                                        # The latitude and longitude the generated locations are spread around.
+NETWORK_RADIUS = 0.5                                                                                            # The spread of the generated locations, in degrees.
+STATUS_RATE = 0.9                                                                                               # The share of approved and active organizations, locations, and programs.
+
+
+
+
+# HELPERS
+def join_tokens(rng: np.random.Generator, pool: list, count: int, density: float) -> np.ndarray:
+    """
+    Generates the values of a multi-value filter column, selecting each sub-filter of the pool with a probability of `density`.
+
+    Args:
+        `rng` (np.random.Generator): The random generator.
+        `pool` (list): The sub-filters of the filter column.
+        `count` (int): The number of values to generate.
+        `density` (float): The probability of selecting each sub-filter, between 0 and 1.
+
+    Returns:
+        `np.ndarray`: An array of `count` values, each a `; ` separated list of sub-filters, or NaN if no sub-filter was selected.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> join_tokens(np.random.default_rng(0), ['Dairy', 'Eggs', 'Meat'], 2, 0.5)
+        array(['Dairy; Meat', 'Eggs'], dtype=object)
+    """
+    pool = np.array(pool, dtype=object)
+    selected = rng.random((count, len(pool))) < density
+    return np.array(["; ".join(pool[row]) if row.any() else np.nan for row in selected], dtype=object)
+
+
+def generate_entity_table(rng: np.random.Generator, prefix: str, count: int, ids: np.ndarray, completeness: float) -> pd.DataFrame:
+    """
+    Generates the columns of an entity (organization, location, or program) that are not generated elsewhere.
+
+    Args:
+        `rng` (np.random.Generator): The random generator.
+        `prefix` (str): The prefix of the columns of the entity, `Organization`, `Location`, or `Program`.
+        `count` (int): The number of entities.
+        `ids` (np.ndarray): The external IDs of the entities.
+        `completeness` (float): The share of optional fields filled in, between 0 and 1.
+
+    Returns:
+        `pd.DataFrame`: A DataFrame with one row per entity, containing its columns of the bulk upload schema.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> generate_entity_table(np.random.default_rng(0), "Organization", 2, np.array([1, 2]), 0.8)[["Organization External ID", "Organization Name"]]
+            Organization External ID    Organization Name
+        0       1                           Organization 1
+        1       2                           Organization 2
+
+    Additional Information:
+        - The text fields are placeholders, as only their presence is read by the report.
+        - Each optional field is left blank with a probability of `1 - completeness`.
+    """
+    labels = pd.Series(ids).astype(str).values
+    table = pd.DataFrame({prefix + " External ID": ids})
+    for column in [column for column in BULK_UPLOAD_COLUMNS if column.startswith(prefix + " ") and column != prefix + " External ID"]:
+        if column.endswith("Internal ID"):
+            table[column] = np.nan
+        elif column.endswith("Name"):
+            table[column] = prefix + " " + labels
+        elif column.endswith("Approval Status") or column.endswith("Active Status"):
+            table[column] = rng.random(count) < STATUS_RATE
+        elif column.endswith("Indicator") or column.endswith("Same Contact As Location"):
+            table[column] = rng.random(count) < 0.5
+        else:
+            table[column] = np.where(rng.random(count) < completeness, column + " " + labels, None)
+    return table
+
+
+def parse_frequency_mix(text: str) -> dict:
+    """
+    Parses a frequency mix from the command line.
+
+    Args:
+        `text` (str): The share of each hours frequency, as a JSON object or as comma separated `frequency=share` pairs.
+
+    Returns:
+        `dict`: The share of each hours frequency, keyed on the frequencies of `DEFAULT_FREQUENCY_MIX`.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `ValueError`: If the text cannot be parsed, a frequency is not a key of `DEFAULT_FREQUENCY_MIX`, a share is negative, or the shares do not sum to more than zero.
+
+    Example:
+        >>> parse_frequency_mix("weekly=0.6,day of month=0.3,specific date=0.1")
+        {'Weekly': 0.6, 'Day of Month': 0.3, 'Specific Date': 0.1}
+        >>> parse_frequency_mix('{"Weekly": 1}')
+        {'Weekly': 1.0}
+
+    Additional Information:
+        - The frequencies are matched regardless of case, and of underscores or hyphens standing in for spaces.
+        - Frequencies left out of the mix are never generated.
+        - Only `ValueError` is raised, so the command line can report a bad mix as a usage error.
+    """
+    if text.strip().startswith("{"):
+        pairs = json.loads(text).items()
+    else:
+        pairs = [pair.split("=", 1) for pair in text.split(",") if pair.strip()]
+        if any(len(pair) != 2 for pair in pairs):
+            raise ValueError(f"The frequency mix '{text}' must be a JSON object or comma separated frequency=share pairs.")
+    names = {frequency.lower(): frequency for frequency in DEFAULT_FREQUENCY_MIX}
+    frequency_mix = {}
+    for frequency, share in pairs:
+        name = str(frequency).strip().lower().replace("_", " ").replace("-", " ")
+        if name not in names:
+            raise ValueError(f"The frequency '{frequency}' does not exist, expected one of {list(DEFAULT_FREQUENCY_MIX.keys())}.")
+        frequency_mix[names[name]] = float(share)
+    shares = list(frequency_mix.values())
+    if any(share < 0 for share in shares) or not sum(shares) > 0:
+        raise ValueError(f"The shares of the frequency mix must be non-negative and sum to more than zero, got {frequency_mix}.")
+    return frequency_mix
+
+
+def generate_hours_table(rng: np.random.Generator, count: int, frequency_mix: dict, reference_date: datetime.date) -> pd.DataFrame:
+    """
+    Generates the hours columns of the bulk upload.
+
+    Args:
+        `rng` (np.random.Generator): The random generator.
+        `count` (int): The number of hours rows.
+        `frequency_mix` (dict): The share of each hours frequency, keyed on the frequencies of `DEFAULT_FREQUENCY_MIX`.
+        `reference_date` (datetime.date): The date the specific date hours are placed around.
+
+    Returns:
+        `pd.DataFrame`: A DataFrame with one row per hours record, containing the hours columns of the bulk upload schema.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `KeyError`: If a frequency of `frequency_mix` is not a key of `DEFAULT_FREQUENCY_MIX`.
+        `ValueError`: If a share of `frequency_mix` is negative, or the shares do not sum to more than zero.
+
+    Example:
+        >>> generate_hours_table(np.random.default_rng(0), 2, DEFAULT_FREQUENCY_MIX, datetime.date(2023, 7, 1))[["Day of Week", "Hours Open 1", "Frequency"]]
+            Day of Week     Hours Open 1    Frequency
+        0   Thursday            9:30            Weekly
+        1   NaN                 14:00           NaN
+
+    Additional Information:
+        - The specific dates are spread over the two months before and after the reference date, so the hours preview graphs have data.
+    """
+    unknown_frequencies = [frequency for frequency in frequency_mix if frequency not in DEFAULT_FREQUENCY_MIX]
+    if unknown_frequencies:
+        raise KeyError(f"The frequencies {unknown_frequencies} do not exist, expected one of {list(DEFAULT_FREQUENCY_MIX.keys())}.")
+    frequencies = np.array(list(frequency_mix.keys()), dtype=object)
+    shares = np.array(list(frequency_mix.values()), dtype=float)
+    if (shares < 0).any() or not shares.sum() > 0:
+        raise ValueError(f"The shares of the frequency mix must be non-negative and sum to more than zero, got {frequency_mix}.")
+    frequency = frequencies[rng.choice(len(frequencies), size=count, p=shares / shares.sum())]
+    specific = frequency == "Specific Date"
+    hours = pd.DataFrame({"Hours Entity Type": np.where(rng.random(count) < 0.5, "Location", "Program")})
+    hours["Day of Week"] = np.where(specific, None, np.array(DAYS_OF_WEEK, dtype=object)[rng.integers(0, 7, count)])
+    opens = rng.integers(14, 24, count) * 30
+    for slot in [1, 2, 3]:
+        filled = np.ones(count, dtype=bool) if slot == 1 else rng.random(count) < 0.3 / (slot - 1)
+        closes = opens + rng.integers(2, 7, count) * 30
+        hours["Hours Open " + str(slot)] = np.where(filled, pd.Series(opens // 60).astype(str).values + ":" + pd.Series(opens % 60).astype(str).str.zfill(2).values, None)
+        hours["Hours Closed " + str(slot)] = np.where(filled, pd.Series(closes // 60).astype(str).values + ":" + pd.Series(closes % 60).astype(str).str.zfill(2).values, None)
+        opens = closes + 60
+    hours["Hours Note"] = np.where(rng.random(count) < 0.1, "Seniors Only", None)
+    hours["Week of Month"] = np.where(frequency == "Week of Month", rng.integers(1, 5, count), np.nan)
+    hours["Day of Month"] = np.where(frequency == "Day of Month", rng.integers(1, 5, count), np.nan)
+    hours["Frequency"] = np.where(specific, None, frequency)
+    dates = pd.Series(pd.Timestamp(reference_date) + pd.to_timedelta(rng.integers(-60, 60, count), unit="D")).dt.strftime("%Y-%m-%d").values
+    hours["Specific Date"] = np.where(specific, dates, None)
+    hours["Specific Date Closed Indicator"] = np.where(specific, np.where(rng.random(count) < 0.5, "CLOSED", "OPEN"), None)
+    hours["Specific Date Reason"] = np.where(specific, "Holiday Hours", None)
+    return hours
+
+
+def assign_parents(rng: np.random.Generator, count: int, parents: int) -> np.ndarray:
+    """
+    Assigns each child entity to a parent entity, giving every parent at least one child where possible.
+
+    Args:
+        `rng` (np.random.Generator): The random generator.
+        `count` (int): The number of child entities.
+        `parents` (int): The number of parent entities.
+
+    Returns:
+        `np.ndarray`: An array of `count` parent positions, sorted so the children of a parent are adjacent.
+
+    Preconditions:
+        - `parents` must be positive.
+
+    Raises:
+        None.
+
+    Example:
+        >>> assign_parents(np.random.default_rng(0), 5, 2)
+        array([0, 0, 1, 1, 1])
+    """
+    assigned = np.concatenate([np.arange(min(count, parents)), rng.integers(0, parents, max(count - parents, 0))])
+    return np.sort(assigned)
+
+
+
+
+# GENERATOR
+def generate_bulk_upload(organizations: int=10, locations: int=50, programs: int=200, hours: int=1000, filter_density: float=0.3, frequency_mix: dict=None, completeness: float=0.8, seed: int=0, reference_date: datetime.date=None) -> pd.DataFrame:
+    """
+    Generates a synthetic bulk upload, containing every column of the bulk upload schema.
+
+    Args:
+        `organizations` (int) [kwargg]: The number of organizations, defaulted to 10.
+        `locations` (int) [kwargg]: The number of locations, defaulted to 50.
+        `programs` (int) [kwargg]: The number of programs, defaulted to 200.
+        `hours` (int) [kwargg]: The number of hours rows (the number of rows of the bulk upload), defaulted to 1000.
+        `filter_density` (float) [kwargg]: The probability of selecting each sub-filter of a multi-value filter column, defaulted to 0.3.
+        `frequency_mix` (dict) [kwargg]: The share of each hours frequency, defaulted to None (`DEFAULT_FREQUENCY_MIX`).
+        `completeness` (float) [kwargg]: The share of optional fields filled in, defaulted to 0.8.
+        `seed` (int) [kwargg]: The seed of the random generator, defaulted to 0.
+        `reference_date` (datetime.date) [kwargg]: The date the specific date hours are placed around, defaulted to None (the first day of the current month).
+
+    Returns:
+        `pd.DataFrame`: A DataFrame with one row per hours record, containing every column of the bulk upload schema, in schema order.
+
+    Preconditions:
+        - `organizations <= locations <= programs <= hours`, so every entity appears in the bulk upload.
+
+    Raises:
+        `ValueError`: If the entity counts are not positive and increasing, or the shares of `frequency_mix` are negative or do not sum to more than zero.
+        `KeyError`: If a frequency of `frequency_mix` is not a key of `DEFAULT_FREQUENCY_MIX`.
+
+    Example:
+        >>> df = generate_bulk_upload(organizations=100, locations=1000, programs=5000, hours=100000)
+        >>> df.shape
+        (100000, 90)
+
+    Additional Information:
+        - Each location belongs to one organization, each program to one location, and each hours row to one program, as in the bulk upload.
+        - The same arguments always generate the same bulk upload; pass a `reference_date` to also fix the specific dates across months.
+        - The sub-filters are drawn from `resources/recommended_filters.csv`.
+    """
+    if not 0 < organizations <= locations <= programs <= hours:
+        raise ValueError(f"The entity counts must be positive and increasing, got {organizations} organizations, {locations} locations, {programs} programs, and {hours} hours.")
+    if reference_date is None:
+        reference_date = datetime.date.today().replace(day=1)
+    rng = np.random.default_rng(seed)
+
+    # Entities
+    organization_table = generate_entity_table(rng, "Organization", organizations, np.arange(100000, 100000 + organizations), completeness)
+    location_table = generate_entity_table(rng, "Location", locations, np.arange(1, 1 + locations), completeness)
+    location_table["Location Latitude"] = np.round(NETWORK_CENTER[0] + rng.uniform(-NETWORK_RADIUS, NETWORK_RADIUS, locations), 6)
+    location_table["Location Longitude"] = np.round(NETWORK_CENTER[1] + rng.uniform(-NETWORK_RADIUS, NETWORK_RADIUS, locations), 6)
+    location_table["Location Features"] = join_tokens(rng, RECOMMENDED_FILTERS["Location Features"].dropna().tolist(), locations, filter_density)
+    program_table = generate_entity_table(rng, "Program", programs, np.array(["PROGRAM" + str(id) for id in range(1, 1 + programs)], dtype=object), completeness)
+    for column in [column for column in RECOMMENDED_FILTERS.columns if column != "Location Features"]:
+        pool = RECOMMENDED_FILTERS[column].dropna().tolist()
+        if column in SINGLE_VALUE_FILTER_COLUMNS:
+            program_table[column] = np.array(pool, dtype=object)[rng.integers(0, len(pool), programs)]
+        else:
+            program_table[column] = join_tokens(rng, pool, programs, filter_density)
+
+    # Rows
+    location_organization = assign_parents(rng, locations, organizations)
+    program_location = assign_parents(rng, programs, locations)
+    hours_program = assign_parents(rng, hours, programs)
+    hours_location = program_location[hours_program]
+    df = pd.concat([
+        organization_table.iloc[location_organization[hours_location]].reset_index(drop=True),
+        location_table.iloc[hours_location].reset_index(drop=True),
+        program_table.iloc[hours_program].reset_index(drop=True),
+        generate_hours_table(rng, hours, DEFAULT_FREQUENCY_MIX if frequency_mix is None else frequency_mix, reference_date)
+    ], axis=1)
+    return df[BULK_UPLOAD_COLUMNS]
+
+
+
+
+# MAIN
+if __name__ == "__main__":
+    # Define console parser
+    parser = argparse.ArgumentParser(description="Generate a synthetic bulk upload file")
+    # Add file argument
+    parser.add_argument("file", action="store", help="The path to save the bulk upload file to (CSV).")
+    # Add entity count arguments
+    parser.add_argument('--organizations', action='store', type=int, default=10, help='The number of organizations')
+    parser.add_argument('--locations', action='store', type=int, default=50, help='The number of locations')
+    parser.add_argument('--programs', action='store', type=int, default=200, help='The number of programs')
+    parser.add_argument('--hours', action='store', type=int, default=1000, help='The number of hours rows')
+    # Add filter density argument
+    parser.add_argument('--filter-density', action='store', type=float, default=0.3, help='The probability of selecting each sub-filter of a multi-value filter column')
+    # Add completeness argument
+    parser.add_argument('--completeness', action='store', type=float, default=0.8, help='The probability of filling in each optional field')
+    # Add frequency mix argument
+    parser.add_argument('--frequency-mix', action='store', help='The share of each hours frequency, as "weekly=0.6,day of month=0.3,..." or a JSON object (defaults to DEFAULT_FREQUENCY_MIX)')
+    # Add seed argument
+    parser.add_argument('--seed', action='store', type=int, default=0, help='The seed of the random generator')
+    # Console arguments
+    args = parser.parse_args()
+    try:
+        frequency_mix = parse_frequency_mix(args.frequency_mix) if args.frequency_mix else None
+    except ValueError as error:
+        parser.error(f"argument --frequency-mix: {error}")
+
+    # Generate bulk upload
+    generate_bulk_upload(organizations=args.organizations, locations=args.locations, programs=args.programs, hours=args.hours, filter_density=args.filter_density, frequency_mix=frequency_mix, completeness=args.completeness, seed=args.seed).to_csv(args.file, index=False)
@@ -0,0 +1,315 @@
+"""
+Bulk Upload Loader.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to load a network bulk upload file (CSV) into a DataFrame for the Analytics Engine and pdfWizard.
+This file defines the schema of the bulk upload file, typing each column as it is read rather than inferring every column as an object.
+The file only reads the columns used by the selected report sections, pruning any columns the report never reads.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * Pandas                            * DateTime                              * Typing
+    * NumPy                             * Importlib
+
+Optional Package Imports:
+    * PyArrow (used as a faster CSV engine when requested)
+
+Instructions:
+    1) Package Imports:
+        a) Create a new terminal
+        b) Run `pip install -r requirements.txt`
+        c) (Optional) Run `pip install pyarrow`
+    2) Import the loader: `import bulkUploadLoader as bul`
+    3) Load every report section: `df = bul.load_bulk_upload("{path to file from root directory}")`
+    4) Load selected report sections: `df = bul.load_bulk_upload("{path to file from root directory}", sections=["MAP", "HOURS"])`
+    5) Load with PyArrow: `df = bul.load_bulk_upload("{path to file from root directory}", engine="pyarrow")`
+    6) Load in chunks of rows: `for chunk in bul.load_bulk_upload_chunks("{path to file from root directory}", chunksize=100000):`
+
+Desired Output:
+    * A DataFrame containing the report columns of the bulk upload file, with categorical, nullable boolean, and float columns typed by the schema.
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Bulk Upload Loader - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import pandas as pd                     # Pandas, used to represent CSVs and large data sets as a DataFrame.
+import numpy as np                      # NumPy, adds Arrays to python and enables large arithmatic operations.
+import importlib.util                   # Importlib, used to check if the optional PyArrow engine is installed.
+import datetime                         # Datetime, used to restore the times and dates parsed by the PyArrow engine to text.
+from typing import Iterator             # Typing, used to annotate the generator of chunks.
+
+# LOCAL FILE IMPORTS
+import resourceRegistry as rr           # ResourceRegistry, used to share the resource files with the Analytics Engine and pdfWizard.
+
+# IMPORT CONSTANTS
+WEIGHTS_SAVE_NAME = "resources/weights.json"                                                                    # Path to WEIGHTS save file (JSON).
+WEIGHTS = rr.get_resource(WEIGHTS_SAVE_NAME)                                                                    # WEIGHTS, used for the weightage of each column in the profile completion grades; stored in the file, 'resources/weights.json'.
+RECOMMENDED_FILTERS_SAVE_NAME = 'resources/recommended_filters.csv'                                             # Path to Recommended Filters (CSV).
+RECOMMENDED_FILTER_COLUMNS = rr.get_resource(RECOMMENDED_FILTERS_SAVE_NAME).columns.tolist()                  # RECOMMENDED_FILTER_COLUMNS, used to store the sub-filter columns of the recommended filters, stored in the file, 'resources/recommended_filters.csv'
+
+# SCHEMA
+CATEGORY_COLUMNS = ['Hours Entity Type', 'Day of Week', 'Frequency', 'Specific Date Closed Indicator']          # Low cardinality columns, read as categories.
+STATUS_COLUMNS = ['Organization Approval Status', 'Organization Active Status', 'Location Approval Status',
+                  'Location Active Status', 'Program Approval Status', 'Program Active Status']                 # Approval and Active flags, read as nullable booleans with blank flags set to False.
+BOOLEAN_COLUMNS = ['Location Automated Website Enabled Indicator', 'Location SMS Enabled Indicator',
+                   'Program Use Same Contact As Location']                                                      # Indicator flags, read as nullable booleans with blank flags left as NA.
+FLOAT_COLUMNS = ['Location Latitude', 'Location Longitude', 'Week of Month', 'Day of Month']                    # Numeric columns, read as floats.
+TEXT_COLUMNS = ['Hours Open 1', 'Hours Closed 1', 'Hours Open 2', 'Hours Closed 2', 'Hours Open 3',
+                'Hours Closed 3', 'Specific Date']                                                              # Time and date columns, kept as text as written in the bulk upload.
+TRUE_VALUES = ['TRUE', 'True', 'true']                                                                          # Values parsed as True in the boolean columns.
+FALSE_VALUES = ['FALSE', 'False', 'false']                                                                      # Values parsed as False in the boolean columns.
+CHUNK_SIZE = 100000                                                                                             # The number of rows read at a time when loading a bulk upload in chunks.
+
+# SECTIONS
+ID_COLUMNS = ['Organization External ID', 'Location External ID', 'Program External ID']                         # Columns read by every report section.
+SECTION_COLUMNS = {
+    "MAP": ['Location Latitude', 'Location Longitude'] + STATUS_COLUMNS,
+    "NETWORK OVERVIEW": ['Organization Name', 'Organization Address 1', 'Location Name', 'Location Address 1', 'Program Name'] + STATUS_COLUMNS,
+    "PROFILE COMPLETION": list(WEIGHTS.keys()),
+    "CONTACT INFORMATION": ['Organization Contact Phone', 'Organization Contact Email', 'Organization Contact Name',
+                            'Location Contact Phone', 'Location Contact Email', 'Location Contact Name',
+                            'Program Use Same Contact As Location', 'Program Contact Phone', 'Program Contact Email', 'Program Contact Name'],
+    "PROGRAM FILTERS": RECOMMENDED_FILTER_COLUMNS + ['Program Qualifications', 'Program Service Area'],
+    "HOURS": ['Hours Entity Type', 'Day of Week', 'Hours Open 1', 'Hours Closed 1', 'Hours Open 2', 'Hours Closed 2', 'Hours Open 3', 'Hours Closed 3',
+              'Week of Month', 'Day of Month', 'Frequency', 'Specific Date', 'Specific Date Closed Indicator', 'Specific Date Reason']
+}                                                                                                               # A dictionary, used to map each report section to the bulk upload columns it reads.
+
+
+
+
+# HELPERS
+def get_section_columns(sections: list=None) -> list:
+    """
+    Returns the bulk upload columns read by the given report sections.
+
+    Args:
+        `sections` (list) [kwargg]: A list of report sections (keys of `SECTION_COLUMNS`), defaulted to None (every report section).
+
+    Returns:
+        `list`: A list of the column names read by the report sections, without duplicates.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `KeyError`: If a section is not a key of `SECTION_COLUMNS`.
+
+    Example:
+        >>> get_section_columns(["MAP"])
+        ['Organization External ID', 'Location External ID', 'Program External ID', 'Location Latitude', 'Location Longitude', 'Organization Approval Status', ...]
+    """
+    if sections is None:
+        sections = list(SECTION_COLUMNS.keys())
+    columns = list(ID_COLUMNS)
+    for section in sections:
+        if section not in SECTION_COLUMNS:
+            raise KeyError(f"The report section '{section}' does not exist, expected one of {list(SECTION_COLUMNS.keys())}.")
+        columns += [column for column in SECTION_COLUMNS[section] if column not in columns]
+    return columns
+
+
+
+def format_text_value(value: any) -> any:
+    """
+    Restores a time or date parsed by the PyArrow engine to the text written in the bulk upload.
+
+    Args:
+        `value` (any): A value of a `TEXT_COLUMNS` column.
+
+    Returns:
+        `any`: The value as text if it is a time or date, else the unchanged value.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> format_text_value(datetime.time(11, 30))
+        '11:30'
+        >>> format_text_value(datetime.date(2023, 7, 2))
+        '2023-07-02'
+        >>> format_text_value('9:30')
+        '9:30'
+
+    Additional Information:
+        - PyArrow only parses times with two digit hours and dates written as `%Y-%m-%d`, so formatting the value restores the original text.
+    """
+    if isinstance(value, datetime.time):
+        return value.strftime('%H:%M') if value.second == 0 else value.strftime('%H:%M:%S')
+    if isinstance(value, datetime.date):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def get_column_types(usecols: list) -> dict:
+    """
+    Returns the data types of the bulk upload columns typed by the schema.
+
+    Args:
+        `usecols` (list): A list of the columns read from the bulk upload file.
+
+    Returns:
+        `dict`: A dictionary of the data type of each column of `usecols` typed by the schema, keyed on the column name.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_column_types(["Location External ID", "Location Latitude", "Frequency"])
+        {'Frequency': 'category', 'Location Latitude': 'float64'}
+    """
+    dtype = {column: "category" for column in CATEGORY_COLUMNS if column in usecols}
+    dtype.update({column: "boolean" for column in STATUS_COLUMNS + BOOLEAN_COLUMNS if column in usecols})
+    dtype.update({column: "float64" for column in FLOAT_COLUMNS if column in usecols})
+    return dtype
+
+
+
+
+def get_id_types(filepath: str, usecols: list, chunksize: int=CHUNK_SIZE) -> dict:
+    """
+    Returns the data types of the External ID columns of a bulk upload file, as inferred when loading the whole file.
+
+    Args:
+        `filepath` (str): The path to the bulk upload file (CSV).
+        `usecols` (list): A list of the columns read from the bulk upload file.
+        `chunksize` (int) [kwargg]: The number of rows read at a time, defaulted to `CHUNK_SIZE`.
+
+    Returns:
+        `dict`: A dictionary of the data type of each column of `ID_COLUMNS` in `usecols`; `int64` if every ID is an integer, `float64` if every ID is numeric but some are missing or decimal, else `str`.
+
+    Preconditions:
+        - The `filepath` must be a valid path to a bulk upload file (CSV) with a header row.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_id_types("sample_dataset.csv", ["Organization External ID", "Program External ID"])
+        {'Organization External ID': 'int64', 'Program External ID': <class 'str'>}
+
+    Additional Information:
+        - Only the External ID columns are read, in chunks, so the types are inferred without holding the bulk upload in memory.
+        - The types match those the `c` engine infers for the whole file, so zero-padded numeric IDs (`001`) read as the same ID as their unpadded form (`1`).
+    """
+    id_columns = [column for column in ID_COLUMNS if column in usecols]
+    numeric = dict.fromkeys(id_columns, True)
+    decimal = dict.fromkeys(id_columns, False)
+    with pd.read_csv(filepath, usecols=id_columns, dtype=str, chunksize=chunksize) as reader:
+        for df in reader:
+            for column in id_columns:
+                if not numeric[column]:
+                    continue
+                try:
+                    decimal[column] |= df[column].isna().any() or pd.to_numeric(df[column].dropna()).dtype.kind != "i"
+                except (ValueError, TypeError):
+                    numeric[column] = False
+    return {column: ("float64" if decimal[column] else "int64") if numeric[column] else str for column in id_columns}
+
+
+
+
+# LOADERS
+def load_bulk_upload(filepath: str, sections: list=None, engine: str="c") -> pd.DataFrame:
+    """
+    Loads a bulk upload file into a DataFrame, typing the columns by the bulk upload schema and pruning columns not read by the report sections.
+
+    Args:
+        `filepath` (str): The path to the bulk upload file (CSV).
+        `sections` (list) [kwargg]: A list of report sections (keys of `SECTION_COLUMNS`) to read columns for, defaulted to None (every report section).
+        `engine` (str) [kwargg]: The CSV parser engine, either `c` or `pyarrow`, defaulted to `c`.
+
+    Returns:
+        `pd.DataFrame`: A DataFrame containing the columns of the bulk upload file read by the report sections, in file order.
+
+    Preconditions:
+        - The `filepath` must be a valid path to a bulk upload file (CSV) with a header row.
+
+    Raises:
+        `KeyError`: If a section is not a key of `SECTION_COLUMNS`.
+        `ImportError`: If the `pyarrow` engine is requested but PyArrow is not installed.
+
+    Example:
+        >>> df = load_bulk_upload("sample_output/sample_dataset.csv", sections=["HOURS"])
+        >>> df.dtypes
+        Organization External ID             int64
+        Location External ID                 int64
+        Program External ID                 object
+        Hours Entity Type                 category
+        Day of Week                       category
+        ...
+
+    Additional Information:
+        - Columns missing from the bulk upload file are skipped rather than raising an error.
+        - `CATEGORY_COLUMNS` are read as categories, with the categories inferred from the file so no values are lost.
+        - `STATUS_COLUMNS` are read as nullable booleans, and a blank status is read as False (not approved or active).
+        - `BOOLEAN_COLUMNS` are read as nullable booleans, and a blank indicator is left as NA.
+        - `TEXT_COLUMNS` are kept as text with either engine, and missing values are read as NaN with either engine.
+        - The remaining columns are inferred by pandas.
+    """
+    if engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None:
+        raise ImportError("The 'pyarrow' engine requires PyArrow, run `pip install pyarrow` or use the 'c' engine.")
+    section_columns = get_section_columns(sections)
+    header = pd.read_csv(filepath, nrows=0).columns.tolist()
+    usecols = [column for column in header if column in section_columns]
+    df = pd.read_csv(filepath, usecols=usecols, dtype=get_column_types(usecols), true_values=TRUE_VALUES, false_values=FALSE_VALUES, engine=engine)
+    for column in STATUS_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].fillna(False)
+    if engine == "pyarrow":
+        for column in df.columns[df.dtypes == object]:
+            if column in TEXT_COLUMNS:
+                df[column] = df[column].map(format_text_value)
+            df[column] = df[column].where(df[column].notna(), np.nan)
+    return df
+
+
+def load_bulk_upload_chunks(filepath: str, chunksize: int=CHUNK_SIZE, sections: list=None) -> Iterator[pd.DataFrame]:
+    """
+    Loads a bulk upload file in chunks of rows, typing the columns by the bulk upload schema and pruning columns not read by the report sections.
+
+    Args:
+        `filepath` (str): The path to the bulk upload file (CSV).
+        `chunksize` (int) [kwargg]: The number of rows of each chunk, defaulted to `CHUNK_SIZE`.
+        `sections` (list) [kwargg]: A list of report sections (keys of `SECTION_COLUMNS`) to read columns for, defaulted to None (every report section).
+
+    Returns:
+        `generator`: A generator of DataFrames, each containing the next `chunksize` rows of the bulk upload file, typed as by `load_bulk_upload`.
+
+    Preconditions:
+        - The `filepath` must be a valid path to a bulk upload file (CSV) with a header row.
+        - `chunksize` must be positive.
+
+    Raises:
+        `KeyError`: If a section is not a key of `SECTION_COLUMNS`.
+
+    Example:
+        >>> sum(len(chunk) for chunk in load_bulk_upload_chunks("sample_output/sample_dataset.csv", chunksize=1000))
+        4219
+
+    Additional Information:
+        - Only one chunk is held in memory at a time, so bulk upload files larger than memory can be read.
+        - `ID_COLUMNS` are typed up front by `get_id_types`, so an External ID reads the same in every chunk and as in `load_bulk_upload` (a column of numeric IDs may otherwise be read as integers in one chunk and as text in another).
+        - The categories of `CATEGORY_COLUMNS` are inferred separately for each chunk.
+        - Chunks are read with the `c` engine, as the PyArrow engine does not read in chunks.
+    """
+    section_columns = get_section_columns(sections)
+    header = pd.read_csv(filepath, nrows=0).columns.tolist()
+    usecols = [column for column in header if column in section_columns]
+    dtype = get_column_types(usecols)
+    dtype.update(get_id_types(filepath, usecols, chunksize=chunksize))
+    with pd.read_csv(filepath, usecols=usecols, dtype=dtype, true_values=TRUE_VALUES, false_values=FALSE_VALUES, chunksize=chunksize) as reader:
+        for df in reader:
+            for column in STATUS_COLUMNS:
+                if column in df.columns:
+                    df[column] = df[column].fillna(False)
+            yield df
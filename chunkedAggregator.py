@@ -0,0 +1,313 @@
+"""
+Chunked Aggregator.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to compute the summary tables of a bulk upload file too large to load into memory at once.
+This file reads the bulk upload in chunks of rows, folding each chunk into mergeable accumulators for the network overview counts, hour type usage, contact information, sub-filter usage, and profile scores.
+The accumulators hold one entry per organization, location, program, or sub-filter rather than one per row, so the memory used is bounded by the size of the network rather than the size of the file.
+The tables built from the accumulators match those of the Analytics Engine, and the graphs and text fields reading only those tables are rendered from them.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * Pandas                            * NumPy                                 * ArgParse
+    * OS                                * Glob                                  * Shutil
+
+Instructions:
+    1) Complete the setup of the Analytics Engine (see `analyticsEngine.py`)
+    2) Run the following command: `python chunkedAggregator.py "{path to file from root directory}"`
+        a) (Optional) Add `--chunksize {number}` to read the given number of rows at a time
+        b) (Optional) Add `--processes {number}` to render the graphs with the given number of processes
+    3) (Optional) Aggregate from another script: `tables = ca.aggregate_bulk_upload("{path to file from root directory}")`
+
+Desired Output:
+    * A folder will be created with the name `data_{bulk upload file name}`, containing the directories `csvs`, `images`, and `resources`.
+    * Within `csvs`, a copy of each table of `CHUNKED_TABLES` will be stored in CSV format.
+    * Within `images`, a copy of each graph reading only those tables will be stored in PNG format.
+    * Within `resources`, the text filled from those tables will be stored in JSON format.
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Chunked Aggregator - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import pandas as pd                     # Pandas, used to represent each chunk and accumulator as a DataFrame.
+import numpy as np                      # NumPy, used to merge the External IDs of each chunk.
+import argparse, os, glob, shutil       # Argparse, OS, Glob, and Shutil, used for File Manipulation and the Command Line Interface.
+
+# LOCAL FILE IMPORTS
+import analyticsEngine as ae            # AnalyticsEngine, used to aggregate each chunk and build the tables from the accumulators.
+import bulkUploadLoader as bul          # BulkUploadLoader, used to read the bulk upload file in chunks.
+
+# MISC CONSTANTS
+CONTACT_TABLES = ["create_organization_contact_information_table", "create_location_contact_information_table",
+                  "create_program_contact_information_table"]                                                  # The contact information tables, accumulated as the distinct contact rows of each chunk.
+CHUNKED_TABLES = ["create_network_overview_table", "create_hour_type_usage_table", "create_program_sub_filter_usage_table",
+                  "create_most_used_sub_filter_table", "create_program_profile_completion_table"] + CONTACT_TABLES    # The tables of the report built from the accumulators.
+
+
+
+
+# HELPERS
+def get_chunked_outputs() -> list:
+    """
+    Returns the nodes of the report graph computable from the chunked tables alone.
+
+    Args:
+        None.
+
+    Returns:
+        `list`: A list of the names of `CHUNKED_TABLES`, and of the nodes of `ae.REPORT_CONTENT_NODES` reading only those tables (directly or through each other).
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_chunked_outputs()[-3:]
+        ['graph_missing_program_contact_info', 'calculate_percent_locations_inactive', 'calculate_locations_programs_without_contact']
+    """
+    outputs = list(CHUNKED_TABLES)
+    for name in ae.REPORT_GRAPH.keys():
+        if name in ae.REPORT_CONTENT_NODES and all(dependency in outputs for dependency in ae.REPORT_GRAPH[name]):
+            outputs.append(name)
+    return outputs
+
+
+
+
+# REPORT ACCUMULATOR CLASS
+class ReportAccumulator():
+    """
+    A class representing the mergeable accumulators of the summary tables of a bulk upload.
+
+    Attributes:
+        `rows` (int): The number of bulk upload rows accumulated.
+        `overview_ids` (dict): The unique External IDs of the active, inactive, and total organizations, locations, and programs, as returned by `ae.get_network_overview_ids`.
+        `hour_type_usage` (pd.DataFrame): The hour type usage table, summed over the chunks.
+        `contact_information` (dict): The distinct rows of each contact information table, keyed on the name of each table function.
+        `filters` (fm.FilterMatrix): The sub-filter tokens used by each location.
+        `profile_scores` (pd.DataFrame): The maximum profile score of each location name.
+
+    Methods:
+        `update`: Folds a chunk of a bulk upload into the accumulators.
+        `merge`: Folds another accumulator into the accumulators.
+        `get_tables`: Builds the tables of `CHUNKED_TABLES` from the accumulators.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new, empty ReportAccumulator instance.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> accumulator = ReportAccumulator()
+        """
+        self.rows = 0
+        self.overview_ids = None
+        self.hour_type_usage = None
+        self.contact_information = {}
+        self.filters = None
+        self.profile_scores = None
+        return
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Folds a chunk of a bulk upload into the accumulators.
+
+        Args:
+            `df` (pd.DataFrame): The chunk, as read by `bul.load_bulk_upload_chunks`.
+
+        Returns:
+            None.
+
+        Preconditions:
+            - The chunk must contain the columns of every report section.
+
+        Raises:
+            `KeyError`: If a column weighted in `ae.WEIGHTS` is missing from the chunk.
+
+        Example:
+            >>> for chunk in bul.load_bulk_upload_chunks("sample_dataset.csv"):
+            ...     accumulator.update(chunk)
+
+        Additional Information:
+            - Each chunk is aggregated by the functions of the Analytics Engine, and its memoized tables are released afterwards.
+        """
+        other = ReportAccumulator()
+        other.rows = len(df)
+        other.overview_ids = ae.get_network_overview_ids(df)
+        other.hour_type_usage = ae.create_hour_type_usage_table(df)
+        other.contact_information = {name: getattr(ae, name)(df) for name in CONTACT_TABLES}
+        other.filters = ae.create_sub_filter_matrix(df)
+        other.profile_scores = ae.get_profile_scores(df).groupby(["Location Name"]).max().reset_index()
+        ae.clear_table_cache(df)
+        self.merge(other)
+        return
+
+    def merge(self, other: "ReportAccumulator") -> None:
+        """
+        Folds another accumulator into the accumulators, as if its chunks had been read by this accumulator.
+
+        Args:
+            `other` (ReportAccumulator): The accumulator to merge, such as the accumulator of another chunk or another bulk upload file.
+
+        Returns:
+            None.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> accumulator.merge(other_accumulator)
+
+        Additional Information:
+            - The External IDs and contact rows are deduplicated and the filter matrices are merged by location, and the profile scores are reduced to their maximum, so the accumulators never grow beyond one entry per entity.
+            - The rows of `other` are treated as following the rows of this accumulator.
+        """
+        if other.rows == 0:
+            return
+        if self.rows == 0:
+            self.__dict__.update(other.__dict__)
+            return
+        self.rows += other.rows
+        self.overview_ids = {status: [pd.unique(np.concatenate([ids, other_ids])) for ids, other_ids in zip(self.overview_ids[status], other.overview_ids[status])] for status in self.overview_ids.keys()}
+        self.hour_type_usage = self.hour_type_usage.copy()
+        self.hour_type_usage.iloc[:, 1:] = self.hour_type_usage.iloc[:, 1:].values + other.hour_type_usage.iloc[:, 1:].values
+        self.contact_information = {name: pd.concat([table, other.contact_information[name]]).drop_duplicates().reset_index(drop=True) for name, table in self.contact_information.items()}
+        self.filters = self.filters.merge(other.filters)
+        self.profile_scores = pd.concat([self.profile_scores, other.profile_scores]).groupby(["Location Name"]).max().reset_index()
+        return
+
+    def get_tables(self) -> dict:
+        """
+        Builds the tables of `CHUNKED_TABLES` from the accumulators.
+
+        Args:
+            None.
+
+        Returns:
+            `dict`: A dictionary of the tables, keyed on the name of each table function.
+
+        Preconditions:
+            - At least one chunk must be accumulated.
+
+        Raises:
+            `ValueError`: If no chunk is accumulated.
+
+        Example:
+            >>> accumulator.get_tables()["create_network_overview_table"]
+                Level               Active  Inactive  Total
+            0       Organizations       2         1      3
+            1       Locations           3         2      3
+            2       Programs            2         1      3
+
+        Additional Information:
+            - The tables match those of the Analytics Engine on the whole bulk upload, except that contact rows sharing an External ID may be listed in another order.
+            - The External IDs hold the data type inferred when loading the whole bulk upload, as the chunks are typed up front (see `bul.get_id_types`).
+        """
+        if self.rows == 0:
+            raise ValueError("No chunks were accumulated, the bulk upload file is empty.")
+        tables = {
+            "create_network_overview_table": ae.build_network_overview_table(*[[len(ids) for ids in self.overview_ids[status]] for status in ["active", "inactive", "total"]]),
+            "create_hour_type_usage_table": self.hour_type_usage.copy(),
+            "create_program_sub_filter_usage_table": ae.build_program_sub_filter_usage_table(self.filters),
+            "create_most_used_sub_filter_table": ae.build_most_used_sub_filter_table(self.filters),
+            "create_program_profile_completion_table": ae.build_program_profile_completion_table(self.profile_scores)
+        }
+        for name, table in self.contact_information.items():
+            tables[name] = table.sort_values(by=table.columns[0], ascending=True).drop_duplicates().reset_index(drop=True)
+        return tables
+
+
+
+
+# AGGREGATION
+def aggregate_bulk_upload(filepath: str, chunksize: int=bul.CHUNK_SIZE) -> dict:
+    """
+    Computes the tables of `CHUNKED_TABLES` for a bulk upload file, reading it in chunks of rows.
+
+    Args:
+        `filepath` (str): The path to the bulk upload file (CSV).
+        `chunksize` (int) [kwargg]: The number of rows read at a time, defaulted to `bul.CHUNK_SIZE`.
+
+    Returns:
+        `dict`: A dictionary of the tables, keyed on the name of each table function.
+
+    Preconditions:
+        - The `filepath` must be a valid path to a bulk upload file (CSV) with a header row.
+
+    Raises:
+        `ValueError`: If the bulk upload file is empty.
+
+    Example:
+        >>> aggregate_bulk_upload("sample_dataset.csv", chunksize=1000)["create_hour_type_usage_table"]
+            Hour Type               Location Usage      Program Usage
+        0   Weekly                      103                 542
+        ...
+
+    Additional Information:
+        - Only one chunk, and the accumulators, are held in memory at a time.
+        - To aggregate a network split over several bulk upload files, merge their accumulators (see `ReportAccumulator.merge`).
+    """
+    accumulator = ReportAccumulator()
+    for chunk in bul.load_bulk_upload_chunks(filepath, chunksize=chunksize):
+        accumulator.update(chunk)
+    return accumulator.get_tables()
+
+
+
+
+# MAIN
+if __name__ == "__main__":
+    # Define console parser
+    parser = argparse.ArgumentParser(description="Aggregate a bulk upload file in chunks")
+    # Add file argument
+    parser.add_argument("file", action="store", help="The file to aggregate.")
+    # Add chunksize argument
+    parser.add_argument('--chunksize', action='store', type=int, default=bul.CHUNK_SIZE, help='The number of rows to read at a time')
+    # Add processes argument
+    parser.add_argument('--processes', action='store', type=int, help='The number of processes to render the graphs with')
+    # Console arguments
+    args = parser.parse_args()
+
+    # Create directory name
+    directory = "data_" + os.path.basename(args.file).replace(".csv", "")
+    # Create directory within project folder
+    for folder in ["", "/resources", "/resources/images", "/csvs", "/images"]:
+        os.makedirs(directory + folder, exist_ok=True)
+    # Move resource images to directory
+    for image in glob.iglob("resources/images/*png"):
+        shutil.copyfile(image, directory + "/resources/images/" + os.path.basename(image))
+
+    # Aggregate the bulk upload
+    tables = aggregate_bulk_upload(args.file, chunksize=args.chunksize)
+    # Stand in for the bulk upload, serving the aggregated tables from the table cache
+    df = pd.DataFrame(columns=bul.get_section_columns())
+    ae.get_table_cache_entry(df)["tables"].update(tables)
+
+    # Execute functions
+    results = ae.run_report_graph(df, directory, get_chunked_outputs(), text=ae.TEXT, processes=args.processes)
+    ae.wait_for_figures()
+    [results[name].to_csv(directory + "/csvs/" + name + ".csv") for name in CHUNKED_TABLES if name in results]
+
+    # Save State
+    ae.save_state(ae.TEXT, ae.TEXT_SAVE_NAME.replace('resources/', ''), directory + "/resources")
@@ -0,0 +1,350 @@
+"""
+Filter Matrix.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to parse the multi-value sub-filter columns of a bulk upload once, rather than each time they are queried.
+This file defines a sparse, compressed sparse row (CSR) matrix of entities by sub-filter tokens, holding a 1 wherever an entity uses a token.
+The vocabulary of each column is seeded from the recommended filters, so the tokens of the recommended filters are listed even when unused.
+Usage counts, "No Filters Used" counts, and co-occurrence counts are then reductions over the matrix rather than splits and explodes of strings.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * Pandas                            * NumPy
+
+Instructions:
+    1) Import the filter matrix: `import filterMatrix as fm`
+    2) Build a filter matrix from the rows of a bulk upload: `filters = fm.build_filter_matrix(df, "Location External ID", ae.RECOMMENDED_FILTERS)`
+    3) Query the filter matrix:
+        a) Count the entities using each token of a column: `filters.get_usage_counts("Location Features")`
+        b) Count the entities missing a value in each column: `filters.get_unused_counts()`
+        c) Count the entities using each pair of tokens of two columns: `filters.get_co_occurrence("Items Offered", "Dietary Options Available")`
+    4) (Optional) Combine the filter matrices of separate chunks of a bulk upload: `filters = filters.merge(other_filters)`
+
+Desired Output:
+    * A FilterMatrix, from which the sub-filter tables of the Analytics Engine are built (see `create_sub_filter_matrix` in `analyticsEngine.py`).
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Filter Matrix - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import pandas as pd                     # Pandas, used to factorize the entities and cells, and to label the query results.
+import numpy as np                      # NumPy, used to store and reduce the sparse matrix.
+
+# MISC CONSTANTS
+DELIMITER = ";"                                                                                                 # The delimiter between the tokens of a multi-value cell.
+
+
+
+
+# FILTER MATRIX CLASS
+class FilterMatrix():
+    """
+    A class representing the sub-filter tokens used by each entity, as a sparse matrix of entities by tokens.
+
+    Attributes:
+        `entities` (np.ndarray): The External ID of each row of the matrix.
+        `columns` (list): The names of the sub-filter columns.
+        `tokens` (np.ndarray): The token of each column of the matrix (the vocabulary).
+        `offsets` (np.ndarray): The positions of the vocabulary of each sub-filter column; the tokens of `columns[i]` are `tokens[offsets[i]:offsets[i + 1]]`.
+        `indptr` (np.ndarray): The CSR row pointers; the tokens used by row `i` are `indices[indptr[i]:indptr[i + 1]]`.
+        `indices` (np.ndarray): The CSR column indices, sorted within each row.
+        `missing` (np.ndarray): A boolean array of entities by sub-filter columns, True where an entity has a row without a value in the column.
+
+    Methods:
+        `get_coordinates`: Returns the row and column of each entry of the matrix.
+        `get_usage_counts`: Returns the number of entities using each token of a sub-filter column.
+        `get_unused_counts`: Returns the number of entities missing a value in each sub-filter column.
+        `get_co_occurrence`: Returns the number of entities using each pair of tokens of two sub-filter columns.
+        `merge`: Returns the filter matrix of the entities of this and another filter matrix.
+        `copy`: Returns a copy of the filter matrix.
+    """
+
+    def __init__(self, entities: np.ndarray, columns: list, tokens: np.ndarray, offsets: np.ndarray, rows: np.ndarray, indices: np.ndarray, missing: np.ndarray) -> None:
+        """
+        Initializes a new FilterMatrix instance from the coordinates of its entries.
+
+        Args:
+            `entities` (np.ndarray): The External ID of each row.
+            `columns` (list): The names of the sub-filter columns.
+            `tokens` (np.ndarray): The token of each column of the matrix.
+            `offsets` (np.ndarray): The positions of the vocabulary of each sub-filter column, of length `len(columns) + 1`.
+            `rows` (np.ndarray): The row of each entry, sorted.
+            `indices` (np.ndarray): The column of each entry, sorted within each row.
+            `missing` (np.ndarray): A boolean array of entities by sub-filter columns, True where an entity has a row without a value in the column.
+
+        Returns:
+            None.
+
+        Preconditions:
+            - The entries must be distinct.
+
+        Raises:
+            None.
+
+        Example:
+            >>> FilterMatrix(np.array([101, 102]), ["Items Offered"], np.array(["Dairy", "Eggs"]), np.array([0, 2]), np.array([0, 0, 1]), np.array([0, 1, 1]), np.zeros((2, 1), dtype=bool))
+        """
+        self.entities = entities
+        self.columns = list(columns)
+        self.tokens = tokens
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=len(entities)))]).astype(np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.missing = missing
+        return
+
+    def get_coordinates(self) -> tuple:
+        """
+        Returns the row and column of each entry of the matrix.
+
+        Args:
+            None.
+
+        Returns:
+            `tuple`: A tuple containing an array of the row of each entry, and an array of the column of each entry.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> filters.get_coordinates()
+            (array([0, 0, 1]), array([0, 1, 1]))
+        """
+        return np.repeat(np.arange(len(self.entities)), np.diff(self.indptr)), self.indices
+
+    def get_usage_counts(self, column: str) -> pd.Series:
+        """
+        Returns the number of entities using each token of a sub-filter column.
+
+        Args:
+            `column` (str): The name of the sub-filter column.
+
+        Returns:
+            `pd.Series`: The number of entities using each token, indexed by token, in order of the vocabulary of the column.
+
+        Preconditions:
+            None.
+
+        Raises:
+            `ValueError`: If the column is not a sub-filter column of the matrix.
+
+        Example:
+            >>> filters.get_usage_counts("Items Offered")
+            Dairy     1
+            Eggs      2
+            Meat      0
+            dtype: int64
+
+        Additional Information:
+            - The counts are the column sums of the matrix, so the seeded tokens that no entity uses are counted as 0.
+        """
+        start, end = self.offsets[self.columns.index(column)], self.offsets[self.columns.index(column) + 1]
+        counts = np.bincount(self.indices, minlength=len(self.tokens))
+        return pd.Series(counts[start:end], index=pd.Index(self.tokens[start:end], dtype=object), dtype=np.int64)
+
+    def get_unused_counts(self) -> pd.Series:
+        """
+        Returns the number of entities missing a value in each sub-filter column.
+
+        Args:
+            None.
+
+        Returns:
+            `pd.Series`: The number of entities with at least one row without a value in each column, indexed by column.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> filters.get_unused_counts()
+            Items Offered    1
+            dtype: int64
+        """
+        return pd.Series(self.missing.sum(axis=0), index=self.columns, dtype=np.int64)
+
+    def get_co_occurrence(self, column: str, other_column: str=None) -> pd.DataFrame:
+        """
+        Returns the number of entities using each pair of tokens of two sub-filter columns.
+
+        Args:
+            `column` (str): The name of the sub-filter column of the rows of the result.
+            `other_column` (str) [kwargg]: The name of the sub-filter column of the columns of the result, defaulted to None (`column`).
+
+        Returns:
+            `pd.DataFrame`: The number of entities using both tokens, indexed by the tokens of `column`, with a column for each token of `other_column`.
+
+        Preconditions:
+            None.
+
+        Raises:
+            `ValueError`: If a column is not a sub-filter column of the matrix.
+
+        Example:
+            >>> filters.get_co_occurrence("Items Offered")
+                    Dairy   Eggs    Meat
+            Dairy       1      1       0
+            Eggs        1      2       0
+            Meat        0      0       0
+
+        Additional Information:
+            - The pairs of tokens are counted from the entries of each entity, never expanding the matrix into a dense block of entities by tokens; memory grows with the number of token pairs the entities use, and the tokens by tokens result.
+            - The diagonal of the co-occurrence of a column with itself is its usage counts.
+        """
+        other_column = column if other_column is None else other_column
+        rows, indices = self.get_coordinates()
+        entries = []
+        for name in [column, other_column]:
+            start, end = self.offsets[self.columns.index(name)], self.offsets[self.columns.index(name) + 1]
+            selected = (indices >= start) & (indices < end)
+            entries.append((rows[selected], indices[selected] - start, self.tokens[start:end]))
+        (rows, codes, tokens), (other_rows, other_codes, other_tokens) = entries
+        # Pair each entry of the first column with the entries of the same entity in the other column (a contiguous run, as the rows are sorted)
+        first, last = np.searchsorted(other_rows, rows, side="left"), np.searchsorted(other_rows, rows, side="right")
+        lengths = last - first
+        pairs = np.repeat(first - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        counts = np.bincount(np.repeat(codes, lengths) * len(other_tokens) + other_codes[pairs], minlength=len(tokens) * len(other_tokens)).reshape(len(tokens), len(other_tokens))
+        return pd.DataFrame(counts, index=pd.Index(tokens, dtype=object), columns=pd.Index(other_tokens, dtype=object))
+
+    def merge(self, other: "FilterMatrix") -> "FilterMatrix":
+        """
+        Returns the filter matrix of the entities of this and another filter matrix, as if their rows had been read together.
+
+        Args:
+            `other` (FilterMatrix): The filter matrix to merge, such as the filter matrix of another chunk of the bulk upload.
+
+        Returns:
+            `FilterMatrix`: A new filter matrix, with one row per distinct entity of the two matrices.
+
+        Preconditions:
+            None.
+
+        Raises:
+            `ValueError`: If the two matrices do not share the same sub-filter columns.
+
+        Example:
+            >>> filters.merge(other_filters).get_usage_counts("Items Offered")
+
+        Additional Information:
+            - An entity of both matrices uses the tokens it uses in either, and misses a value in a column if it misses one in either.
+            - The vocabulary of each column keeps the tokens of this matrix first, followed by the new tokens of `other`.
+        """
+        if self.columns != other.columns:
+            raise ValueError(f"The filter matrices have different sub-filter columns, {self.columns} and {other.columns}.")
+        entity_codes, entities = pd.factorize(pd.Series(np.concatenate([self.entities, other.entities]), dtype=object), use_na_sentinel=False)
+        tokens, offsets, self_map, other_map = [], [0], [], []
+        for index in range(len(self.columns)):
+            vocabulary = {}
+            for matrix, token_map in [(self, self_map), (other, other_map)]:
+                for token in matrix.tokens[matrix.offsets[index]:matrix.offsets[index + 1]]:
+                    token_map.append(vocabulary.setdefault(token, offsets[-1] + len(vocabulary)))
+            tokens.extend(vocabulary.keys())
+            offsets.append(offsets[-1] + len(vocabulary))
+        self_rows, self_indices = self.get_coordinates()
+        other_rows, other_indices = other.get_coordinates()
+        rows = np.concatenate([entity_codes[:len(self.entities)][self_rows], entity_codes[len(self.entities):][other_rows]])
+        indices = np.concatenate([np.array(self_map, dtype=np.int64)[self_indices], np.array(other_map, dtype=np.int64)[other_indices]])
+        keys = np.unique(rows * max(len(tokens), 1) + indices)
+        missing = np.zeros((len(entities), len(self.columns)), dtype=bool)
+        missing[entity_codes[:len(self.entities)]] = self.missing
+        missing[entity_codes[len(self.entities):]] |= other.missing
+        return FilterMatrix(np.asarray(entities, dtype=object), self.columns, np.array(tokens, dtype=object), np.array(offsets), keys // max(len(tokens), 1), keys % max(len(tokens), 1), missing)
+
+    def copy(self) -> "FilterMatrix":
+        """
+        Returns a copy of the filter matrix.
+
+        Args:
+            None.
+
+        Returns:
+            `FilterMatrix`: A new filter matrix holding copies of the arrays of this matrix.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> filters.copy()
+        """
+        rows, indices = self.get_coordinates()
+        return FilterMatrix(self.entities.copy(), self.columns, self.tokens.copy(), self.offsets.copy(), rows, indices.copy(), self.missing.copy())
+
+
+
+
+# HELPERS
+def build_filter_matrix(df: pd.DataFrame, id_column: str, vocabulary: pd.DataFrame, delimiter: str=DELIMITER) -> FilterMatrix:
+    """
+    Builds the filter matrix of the sub-filter columns of a DataFrame.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame containing the entity and sub-filter columns.
+        `id_column` (str): The name of the column holding the External ID of each entity, one row of the matrix per distinct ID.
+        `vocabulary` (pd.DataFrame): A DataFrame with a column for each sub-filter column, holding the tokens seeded into its vocabulary (such as the recommended filters).
+        `delimiter` (str) [kwargg]: The delimiter between the tokens of a cell, defaulted to `DELIMITER`.
+
+    Returns:
+        `FilterMatrix`: The filter matrix, with one row per distinct ID and one column per token of each sub-filter column.
+
+    Preconditions:
+        - The DataFrame `df` must contain `id_column` and every column of `vocabulary`.
+
+    Raises:
+        `KeyError`: If a column of `vocabulary` is missing from `df`.
+
+    Example:
+        >>> data = pd.DataFrame({
+        ...     "Location External ID": [101, 101, 102],
+        ...     "Items Offered": ["Dairy; Eggs", np.nan, "Eggs;"]
+        ... })
+        >>> filters = build_filter_matrix(data, "Location External ID", pd.DataFrame({"Items Offered": ["Dairy", "Eggs", "Meat"]}))
+        >>> filters.get_usage_counts("Items Offered").to_dict(), filters.get_unused_counts().to_dict()
+        ({'Dairy': 1, 'Eggs': 2, 'Meat': 0}, {'Items Offered': 1})
+
+    Additional Information:
+        - Each distinct cell is split once, however many rows share it, and the tokens are stripped of surrounding whitespace; blank tokens are dropped.
+        - The vocabulary of each column holds the seeded tokens, followed by the other tokens found in order of first appearance.
+        - A missing ID is kept as an entity of its own.
+    """
+    entity_codes, entities = pd.factorize(df[id_column], use_na_sentinel=False)
+    columns = vocabulary.columns.values.tolist()
+    tokens, offsets, rows, indices = [], [0], [], []
+    missing = np.zeros((len(entities), len(columns)), dtype=bool)
+    for index, column in enumerate(columns):
+        cell_codes, cells = pd.factorize(df[column])
+        missing[entity_codes[cell_codes == -1], index] = True
+
+        # Split each distinct cell into token IDs
+        column_vocabulary = {}
+        for token in vocabulary[column].dropna():
+            column_vocabulary.setdefault(token, offsets[-1] + len(column_vocabulary))
+        cell_tokens = [sorted({column_vocabulary.setdefault(token, offsets[-1] + len(column_vocabulary)) for token in (token.strip() for token in str(cell).split(delimiter)) if token}) for cell in cells]
+        tokens.extend(column_vocabulary.keys())
+        offsets.append(offsets[-1] + len(column_vocabulary))
+
+        # Gather the token IDs of each distinct entity and cell
+        cell_lengths = np.array([len(ids) for ids in cell_tokens], dtype=np.int64)
+        cell_starts = np.concatenate([[0], np.cumsum(cell_lengths)[:-1]]).astype(np.int64)
+        cell_indices = np.array([token_id for ids in cell_tokens for token_id in ids], dtype=np.int64)
+        pairs = np.unique(entity_codes[cell_codes != -1].astype(np.int64) * max(len(cells), 1) + cell_codes[cell_codes != -1])
+        pair_entities, pair_cells = pairs // max(len(cells), 1), pairs % max(len(cells), 1)
+        lengths = cell_lengths[pair_cells]
+        positions = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths) + np.repeat(cell_starts[pair_cells], lengths)
+        rows.append(np.repeat(pair_entities, lengths))
+        indices.append(cell_indices[positions])
+
+    width = max(len(tokens), 1)
+    keys = np.unique(np.concatenate(rows + [np.zeros(0, dtype=np.int64)]) * width + np.concatenate(indices + [np.zeros(0, dtype=np.int64)]))
+    return FilterMatrix(np.asarray(entities, dtype=object), columns, np.array(tokens, dtype=object), np.array(offsets), keys // width, keys % width, missing)
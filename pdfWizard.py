@@ -39,6 +39,15 @@ Instructions:
         d) Clear MatPlotLib font cache by deleting the cache file (fontlist.json, likely stored in `Users/{user}/.matplotlib`)
     4) Add a bulk upload file to the working directory
     5) Run the following command: `python pdfWizard.py "{path to file from root directory}", "{name of network}", "{center point latitude}", "{center point longitude}", "{center point city name}"`
+        a) (Optional) Add `--engine pyarrow` to load the file with PyArrow (requires `pip install pyarrow`)
+        b) (Optional) Add `--processes {number}` to compute the tables and graphs with the given number of threads and processes
+        c) (Optional) Add `--map-backend pil` to draw the location maps from the cached map tiles with PIL, skipping Plotly and Kaleido
+        d) (Optional) Add `--profile` to save the time and memory of each stage of the report as `profile.json`
+        e) (Optional) Add `--no-cache` to compute every table and graph, rather than reusing the unchanged ones of an earlier run
+        f) (Optional) Add `--no-images` to embed the graphs in the report without saving them in the `images` folder
+        g) (Optional) Add `--vector` to draw the graphs as vector images (SVG), for a smaller report that stays sharp at any zoom
+        h) (Optional) Add `--parallel-sections` to render the appendix sections on a pool of processes and merge them into the report (requires `pip install pypdf`); appendices under 1000 pages are rendered in one process
+        i) (Optional) Add `--image-dpi {dpi}` to downsample the raster images of the report to the given resolution, for a smaller report
     -----
     6) POTENTIAL FONT ERROR: `findfont: Font family `Roobert Medium` not found`.
         a) Navigate to the MatPlotLib font cache file (fontlist.json, likely stored in `Users/{user}/.matplotlib`)
@@ -72,7 +81,7 @@ Instructions:
 Desired Output:
     * A folder will be created with the name `data_{bulk upload file name}`, containing the directories `csvs`, `images`, and `resources`, as well as the bulk upload file and the generated report.
     * Within `csvs`, a copy of all dataframes generated will be stored in CSV format.
-    * Within `images`, a copy of all graphs generated will be stored in PNG format.
+    * Within `images`, a copy of all graphs generated will be stored in PNG format (unless `--no-images` is given).
     * Within `resources`, a copy of all generation data will be stored in CSV/JSON format.
 
 Still have questions? Send an email to `arman@vivery.org` with the subject line `pdfWizard - {question}`. 
@@ -80,27 +89,39 @@ Still have questions? Send an email to `arman@vivery.org` with the subject line
 
 
 # PACKAGE IMPORTS
-from fpdf import FPDF                   # FPDF, a class containing methods used to create PDFs.
 import pandas as pd                     # Pandas, used to represent CSVs and large data sets as a DataFrame.
+import numpy as np                      # NumPy, used to hold the formatted cells and alignments of the tables.
 import argparse, os, glob, shutil       # Argparse, OS, Glob, and Shutil, used for File Manipulation and the Command Line Interface
-import json                             # JSON, used to parse JSON files and convert to Dictionary data types.
-import math                             # Math, used for basic mathematical operations.
 import datetime, calendar               # Datetime and Calendar, used to handle date related tasks and allows python to have access to real world calendar data.
-from PIL import Image                   # Image, used to handle varius tasks with Image files like PNGs.
+import io                               # IO, used to read the rendered PDF fragments and the downsampled images in memory.
+import hashlib                          # Hashlib, used to hash the images of the report, so each image is embedded once.
+import concurrent.futures               # Concurrent Futures, used to render the appendix fragments on a pool of worker processes.
+import copy                             # Copy, used to hand each PDF its own copy of a parsed font.
 import re                               # Regex, used to parse, format, and select text from strings.
+import warnings                         # Warnings, used to warn when parallel sections fall back to rendering the appendix in one process.
 
 # LOCAL FILE IMPORTS
 import analyticsEngine as ae            # AnalyticsEngine, used as an API to parse and process the Bulk Upload Data File into small chunks of information.
+import bulkUploadLoader as bul          # BulkUploadLoader, used to load the Bulk Upload Data File with a typed and pruned schema.
+import stageProfiler as sp              # StageProfiler, used to measure the time and memory of each stage of the report.
+import artifactCache as ac              # ArtifactCache, used to reuse the unchanged tables, graphs, and text fields of an earlier run.
+import resourceRegistry as rr           # ResourceRegistry, used to defer the PDF and image imports and to share the resource files with the Analytics Engine.
+
+# LAZY PACKAGE IMPORTS (imported on first use)
+FPDF = rr.LazyImport("fpdf", "FPDF")                                                                            # FPDF, a class containing methods used to create PDFs.
+Image = rr.LazyImport("PIL.Image")                                                                              # Image, used to downsample the raster images of the report.
+FPDF_VERSION = rr.LazyImport("fpdf", "FPDF_VERSION")                                                            # The version of FPDF, hashed into the font cache.
+pypdf = rr.LazyImport("pypdf")                                                                                  # PyPDF, used to merge the appendix fragments into the report (optional, `pip install pypdf`).
 
 # IMPORT CONSTANTS
 TEXT_SAVE_NAME = "resources/text.json"                                                                          # Path to TEXT save file (JSON).
-with open(TEXT_SAVE_NAME) as file: TEXT = json.load(file)                                                       # TEXT, used for all of the text in the PDF report; stored in the file, 'resources/text.json'.
+TEXT = rr.copy_resource(TEXT_SAVE_NAME)                                                                         # TEXT, used for all of the text in the PDF report; stored in the file, 'resources/text.json'.
 WEIGHTS_SAVE_NAME = "resources/weights.json"                                                                    # Path to WEIGHTS save file (JSON).
-with open(WEIGHTS_SAVE_NAME) as file: WEIGHTS = json.load(file)                                                 # WEIGHTS, used for the weightage of each column in the profile completion grades; stored in the file, 'resources/weights.json'.
+WEIGHTS = rr.get_resource(WEIGHTS_SAVE_NAME)                                                                    # WEIGHTS, used for the weightage of each column in the profile completion grades; stored in the file, 'resources/weights.json'.
 RECOMMENDED_FILTERS_SAVE_NAME = 'resources/recommended_filters.csv'                                             # Path to Recommended Filters (CSV).
-RECOMMENDED_FILTERS = pd.read_csv(RECOMMENDED_FILTERS_SAVE_NAME)                                                # RECOMMENDED_FILTERS, used to store the recommended filters for locations and programs, stored in the file, 'resources/recommended_filters.csv'
+RECOMMENDED_FILTERS = rr.get_resource(RECOMMENDED_FILTERS_SAVE_NAME)                                            # RECOMMENDED_FILTERS, used to store the recommended filters for locations and programs, stored in the file, 'resources/recommended_filters.csv'
 PROFILE_COMPLETION_TIERS_SAVE_NAME = 'resources/profile_completion_tiers.csv'                                   # Path to Profile Completion Tiers (CSV).
-PROFILE_COMPLETION_TIERS = pd.read_csv(PROFILE_COMPLETION_TIERS_SAVE_NAME)                                      # PROFILE_COMPLETION_TIERS, used to store the profile completion tiers for locations, stored in the file, 'resources/profile_completion_tiers.csv'
+PROFILE_COMPLETION_TIERS = rr.get_resource(PROFILE_COMPLETION_TIERS_SAVE_NAME)                                  # PROFILE_COMPLETION_TIERS, used to store the profile completion tiers for locations, stored in the file, 'resources/profile_completion_tiers.csv'
 
 # MISC CONSTANTS
 PAGE_WIDTH = 8.5                                                                # The width of the page in inches.
@@ -112,9 +133,45 @@ SUBTITLE_TEXT_SIZE = 10
 TABLE_TEXT_SIZE = 10                                                            # The table text font size.
 APPENDIX_LINES_PER_PAGE = 25                                                    # The number of rows per page for appendix pages.
 FIRST_APPENDIX_PAGE = 17                                                        # The first page of the appendix
+PARALLEL_SECTIONS_MIN_PAGES = 1000                                              # The smallest appendix rendered on a pool of processes; shorter appendices are rendered in one process.
 PORTRAIT_TABLE_CHAR_PER_CELL = {1: 100, 2: 45, 3: 28, 4: 20, 5: 12, 6: 10}      # A dictionary used to map the number of characters per cell in a portrait table.
 LANDSCAPE_TABLE_CHAR_PER_CELL = {2: 60, 4: 35}                                  # A dictionary used the number of characters per cell in a landscape table.
 
+# APPENDIX
+APPENDIX_SECTIONS = [                                                           # A list of the appendix tables, in the order of the appendix; each the name of a table function and the TEXT section titling it.
+    ("create_organization_table", "APPENDIX ORGANIZATION LIST"),
+    ("create_location_table", "APPENDIX LOCATION LIST"),
+    ("create_program_table", "APPENDIX PROGRAM LIST"),
+    ("create_program_profile_completion_table", "APPENDIX PROGRAM PROFILE COMPLETION LIST"),
+    ("create_organization_contact_information_table", "APPENDIX ORGANIZATION CONTACT INFORMATION"),
+    ("create_location_contact_information_table", "APPENDIX LOCATION CONTACT INFORMATION"),
+    ("create_program_contact_information_table", "APPENDIX PROGRAM CONTACT INFORMATION"),
+    ("create_program_by_program_type_table", "APPENDIX PROGRAM TYPE"),
+    ("create_program_by_program_audience_table", "APPENDIX PROGRAM AUDIENCE"),
+    ("create_program_by_program_languages_spoken_table", "APPENDIX PROGRAM LANGUAGES SPOKEN"),
+    ("create_program_by_program_features_table", "APPENDIX PROGRAM FEATURES"),
+    ("create_program_by_program_items_offered_table", "APPENDIX PROGRAM ITEMS OFFERED"),
+    ("create_program_by_program_dietary_options_table", "APPENDIX PROGRAM DIETARY OPTIONS"),
+    # ("create_recommended_program_filters_table", "APPENDIX PROGRAM FILTERS AVAILABLE"),
+    ("create_location_hours_table", "APPENDIX LOCATION HOURS INFORMATION"),
+    ("create_program_hours_table", "APPENDIX PROGRAM HOURS INFORMATION"),
+    ("create_program_by_program_qualifications_table", "APPENDIX PROGRAM QUALIFICATIONS"),
+    ("create_program_by_program_service_area_table", "APPENDIX PROGRAM SERVICE AREAS")
+]
+
+# FONTS
+FONTS = [                                                                       # A list of the fonts of the report; each the family, the style, and the path to the TTF file.
+    ('Roobert Medium', '', 'resources\Roobert Font Suite\TTF\Roobert-Medium.ttf'),
+    ('Roobert Light Italic', '', 'resources\Roobert Font Suite\TTF\Roobert-LightItalic.ttf'),
+    ('Roobert Light', '', 'resources\Roobert Font Suite\TTF\Roobert-Light.ttf'),
+    ('Roobert Regular', '', 'resources\Roobert Font Suite\TTF\Roobert-Regular.ttf'),
+    ('Roobert Regular', 'B', 'resources\Roobert Font Suite\TTF\Roobert-SemiBold.ttf'),
+    ('Roobert Bold', '', 'resources\Roobert Font Suite\TTF\Roobert-Bold.ttf')
+]
+
+# CACHES
+FONT_CACHE = {}                                                                 # A dictionary, used to hold each font as added by FPDF; keyed on the version of FPDF, the hash of the font file, the family, the style, and the page number alias.
+
 # COLOURS
 
 
@@ -137,10 +194,15 @@ class pdfConstructor:
         directory (str): The directory where the PDF will be saved.
         filename (str): The filename for the PDF.
         network_name (str): The name of the network associated with the PDF.
+        appendix_plan (dict): A dictionary of the layout of each appendix section, keyed on the name of its table function (see `plan_appendix`).
         appendix_page_numbers (dict): A dictionary to store page numbers for appendix sections.
+        page_offset (int): The number of pages before the first page of the PDF, added to the printed page numbers of a fragment of the report.
+        fragments (list): A list of the appendix fragments rendered on worker processes, each the first page, the page count, and the PDF; merged into the PDF when saved.
+        image_dpi (int): The largest resolution of the raster images of the PDF, in dots per inch; None to embed the images at their own resolution.
+        images (dict): The image registry, a dictionary of the images embedded in the PDF keyed on the hash of their bytes (and the size they are downsampled to).
 
     Methods:
-        __init__(self, new_df: pd.DataFrame, new_directory: str, new_filename: str, new_network_name: str) -> None:
+        __init__(self, new_df: pd.DataFrame, new_directory: str, new_filename: str, new_network_name: str, new_appendix_plan: dict=None, new_page_offset: int=0, new_image_dpi: int=None) -> None:
             Initializes the pdfConstructor class.
 
         add_cover_page(self) -> None:
@@ -158,6 +220,9 @@ class pdfConstructor:
         add_landscape_page(self) -> None:
             Adds a new landscape page to the PDF document.
 
+        get_image(self, image: io.BytesIO, width: float, size: tuple=None) -> io.BytesIO:
+            Returns an image from the image registry, to be embedded in the PDF document.
+
         add_image(self, filepath: str, height: int, pagenumber: int=-2) -> None:
             Adds an image to the PDF document.
 
@@ -185,6 +250,12 @@ class pdfConstructor:
         add_appendix(self, function, title: str) -> None:
             Adds an appendix section to the PDF document using the specified function to process the DataFrame.
 
+        add_table_rows(self, cells: np.ndarray, width: float, alignments: np.ndarray) -> None:
+            Draws the formatted rows of a table to the PDF document.
+
+        add_appendix_fragments(self, processes: int=None) -> None:
+            Renders the appendix and back cover on a pool of worker processes, to be merged into the PDF document when saved.
+
         add_portrait_h2_text(self, header_row: list, pagenumber: int=-2, padding=True) -> None:
             Adds heading level 2 (H2) text to the PDF document.
 
@@ -211,12 +282,13 @@ class pdfConstructor:
         # Initializes the pdfConstructor object with the provided DataFrame and filenames.
 
     Additional Information:
+        - The `appendix_plan` attribute lays out the appendix once, and is read by both the table of contents links (`appendix_page_numbers`) and `add_appendix`.
         - The `appendix_page_numbers` attribute is used to store the page numbers for different appendix sections.
         - The class uses various functions to create different sections and elements in the PDF document.
         - It also defines font families and styles for text used in the PDF.
         - The class is designed to facilitate the creation of a structured and organized PDF report based on the provided data.
     """
-    def __init__(self, new_df: pd.DataFrame, new_directory: str,new_filename: str,new_network_name: str) -> None:
+    def __init__(self, new_df: pd.DataFrame, new_directory: str,new_filename: str,new_network_name: str, new_appendix_plan: dict=None, new_page_offset: int=0, new_image_dpi: int=None) -> None:
         """
         Initializes the pdfConstructor class.
 
@@ -225,6 +297,9 @@ class pdfConstructor:
             new_directory (str): The directory where the PDF will be saved.
             new_filename (str): The filename for the PDF.
             new_network_name (str): The name of the network associated with the PDF.
+            new_appendix_plan (dict, optional): The layout of the appendix sections, as returned by `plan_appendix`. Defaults to None (planned from `new_df`).
+            new_page_offset (int, optional): The number of pages before the first page of the PDF, for a fragment of a report. Defaults to 0.
+            new_image_dpi (int, optional): The largest resolution of the raster images of the PDF, in dots per inch. Defaults to None (the resolution of each image).
 
         Preconditions:
             - The `new_df` must be a valid Pandas DataFrame containing the data to be used in the PDF.
@@ -250,52 +325,27 @@ class pdfConstructor:
 
         Additional Information:
             - The method initializes various attributes of the pdfConstructor class, such as `df`, `directory`, `filename`, `network_name`.
-            - It calculates the page numbers for appendix sections based on the provided DataFrame and predefined values.
+            - It plans the appendix once with `plan_appendix`, and derives the page numbers for appendix sections from the plan.
+            - The planned tables are kept in `appendix_plan`, so `add_appendix` renders them without building them again.
             - The method also sets up the PDF object and adds font families to be used in the PDF.
+            - The fonts are added from the font cache by `add_font`, so each font file is parsed once rather than once per PDF.
         """
         # Initialize class variables
         self.df = new_df
         self.directory = new_directory
         self.filename = new_filename
         self.network_name = new_network_name
-        self.appendix_page_numbers = {}
-
-        # Appendix Page Numbers
-        current_page = FIRST_APPENDIX_PAGE
-        self.appendix_page_numbers[TEXT["APPENDIX ORGANIZATION LIST"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_organization_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX LOCATION LIST"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_location_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM LIST"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_profile_completion_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX ORGANIZATION CONTACT INFORMATION"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_organization_contact_information_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX LOCATION CONTACT INFORMATION"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_location_contact_information_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM CONTACT INFORMATION"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_contact_information_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM TYPE"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_by_program_type_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM AUDIENCE"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_by_program_audience_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM LANGUAGES SPOKEN"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_by_program_languages_spoken_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM FEATURES"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_by_program_features_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM ITEMS OFFERED"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_by_program_items_offered_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM DIETARY OPTIONS"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_by_program_dietary_options_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX LOCATION HOURS INFORMATION"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_location_hours_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_hours_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM QUALIFICATIONS"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_by_program_qualifications_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
-        self.appendix_page_numbers[TEXT["APPENDIX PROGRAM SERVICE AREAS"]["title"]] = current_page
-        current_page += max(math.ceil(len(ae.create_program_by_program_service_area_table(df).dropna(thresh=2))/APPENDIX_LINES_PER_PAGE), 1)
+
+        self.page_offset = new_page_offset
+        self.fragments = []
+
+        # Image Registry
+        self.image_dpi = new_image_dpi
+        self.images = {}
+
+        # Appendix Plan
+        self.appendix_plan = plan_appendix(self.df) if new_appendix_plan is None else new_appendix_plan
+        self.appendix_page_numbers = {section["title"]: section["start_page"] for section in self.appendix_plan.values()}
 
         # Add network name to TEXT
         TEXT["FILE"]["network name"] = new_network_name
@@ -308,12 +358,8 @@ class pdfConstructor:
         self.pdf.set_right_margin(1)
 
         # Add font family
-        self.pdf.add_font('Roobert Medium', '', fname='resources\Roobert Font Suite\TTF\Roobert-Medium.ttf')
-        self.pdf.add_font('Roobert Light Italic', '', fname='resources\Roobert Font Suite\TTF\Roobert-LightItalic.ttf')
-        self.pdf.add_font('Roobert Light', '', fname='resources\Roobert Font Suite\TTF\Roobert-Light.ttf')
-        self.pdf.add_font('Roobert Regular', '', fname='resources\Roobert Font Suite\TTF\Roobert-Regular.ttf')
-        self.pdf.add_font('Roobert Regular', 'B', fname='resources\Roobert Font Suite\TTF\Roobert-SemiBold.ttf')
-        self.pdf.add_font('Roobert Bold', '', fname='resources\Roobert Font Suite\TTF\Roobert-Bold.ttf')
+        for family, style, filepath in FONTS:
+            add_font(self.pdf, family, style, filepath)
         return
     
 
@@ -354,7 +400,7 @@ class pdfConstructor:
         self.pdf.set_auto_page_break(0)
         self.pdf.set_left_margin(0)
         self.pdf.set_right_margin(0)
-        self.pdf.image("resources\images\cover.png", 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
+        self.pdf.image(self.get_image(ae.get_figure("resources\images\cover.png"), PAGE_WIDTH), 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
 
         # Set Date Font
         self.pdf.set_xy(0.6, 8.5)
@@ -416,7 +462,7 @@ class pdfConstructor:
         self.pdf.set_auto_page_break(0)
         self.pdf.set_left_margin(0)
         self.pdf.set_right_margin(0)
-        self.pdf.image("resources\images\\table_of_contents.png", 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
+        self.pdf.image(self.get_image(ae.get_figure("resources\images\\table_of_contents.png"), PAGE_WIDTH), 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
 
         # Add Header
         self.pdf.set_xy(0.3, 1)
@@ -606,7 +652,7 @@ class pdfConstructor:
         self.pdf.set_auto_page_break(0)
         self.pdf.set_left_margin(0)
         self.pdf.set_right_margin(0)
-        self.pdf.image("resources\images\\appendix_cover.png", 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
+        self.pdf.image(self.get_image(ae.get_figure("resources\images\\appendix_cover.png"), PAGE_WIDTH), 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
 
         # Add Title
         self.pdf.set_xy(0.5, 8.75)
@@ -694,12 +740,12 @@ class pdfConstructor:
             - Finally, the method resets the right margin and returns.
         """
         self.pdf.add_page()
-        if self.pdf.page_no() > 1:
+        if self.pdf.page_no() + self.page_offset > 1:
             self.pdf.set_right_margin(0.5)
             self.pdf.set_y(PAGE_HEIGHT - 0.5)
             self.pdf.set_text_color(0, 72, 61)
             self.pdf.set_font('Roobert Light', '', 10)
-            self.pdf.cell(0, 0, '%s' % self.pdf.page_no(), align='R')
+            self.pdf.cell(0, 0, '%s' % (self.pdf.page_no() + self.page_offset), align='R')
             self.pdf.set_y(1)
             self.pdf.set_right_margin(1)
         return
@@ -740,12 +786,12 @@ class pdfConstructor:
             - Finally, the method resets the right margin and returns.
         """
         self.pdf.add_page(orientation="L")
-        if self.pdf.page_no() > 1:
+        if self.pdf.page_no() + self.page_offset > 1:
             self.pdf.set_right_margin(0.5)
             self.pdf.set_y(PAGE_WIDTH - 0.5)
             self.pdf.set_text_color(0, 72, 61)
             self.pdf.set_font('Roobert Light', '', 10)
-            self.pdf.cell(0, 0, '%s' % self.pdf.page_no(), align='R')
+            self.pdf.cell(0, 0, '%s' % (self.pdf.page_no() + self.page_offset), align='R')
             self.pdf.set_y(1)
             self.pdf.set_right_margin(1)
         return
@@ -780,20 +826,64 @@ class pdfConstructor:
             # The PDF document is saved to the specified directory.
 
         Additional Information:
-            - The method uses the `output` method of the `pdf` attribute to save the PDF.
-            - It then attempts to move the saved PDF to the specified directory using `shutil.move`.
-            - If an `OSError` occurs during the move (e.g., the file already exists in the directory), it deletes the existing file and moves the new PDF again.
+            - The method uses the `output` method of the `pdf` attribute to save the PDF straight into the specified directory, replacing any previous copy.
+            - If the appendix was rendered by `add_appendix_fragments`, the fragments are merged onto their placeholder pages first (see `merge_pdf_fragments`).
             - No value is returned.
         """
-        self.pdf.output(self.filename)
-        try:
-            shutil.move(self.filename, self.directory)
-        except OSError:
-            os.remove(self.directory + '/' + self.filename)
-            shutil.move(self.filename, self.directory)
+        if self.fragments:
+            merge_pdf_fragments(bytes(self.pdf.output()), self.fragments, self.directory + '/' + self.filename)
+        else:
+            self.pdf.output(self.directory + '/' + self.filename)
         return
     
 
+    def get_image(self, image: io.BytesIO, width: float, size: tuple=None) -> io.BytesIO:
+        """
+        Returns an image from the image registry, to be embedded in the PDF document.
+
+        This method hashes the bytes of the image, and returns the registered copy of the image if the same bytes were added before,
+        downsampling a new raster image to the `image_dpi` resolution at the given width first.
+
+        Args:
+            image (io.BytesIO): The image, as returned by `ae.get_figure`.
+            width (float): The width the image is drawn at, in inches.
+            size (tuple, optional): The width and height of the image, as returned by `ae.get_figure_size`. Defaults to None (read from the image when needed).
+
+        Preconditions:
+            - The `image` must be an SVG, or an image PIL can read.
+
+        Raises:
+            None
+
+        Returns:
+            io.BytesIO: The image to pass to the `image` method of the `pdf` attribute.
+
+        Example:
+            >>> pdf = pdfConstructor(data, "pdf_output", "example_report.pdf", "Sample Network", new_image_dpi=150)
+            >>> pdf.get_image(ae.get_figure("resources/images/image.png"), 5.5)
+            <_io.BytesIO object at 0x...>
+            # Returns the image downsampled to 825 pixels wide.
+
+        Additional Information:
+            - FPDF embeds an image once for every distinct set of bytes, so returning the same registered copy embeds each image once, however many times and under whatever paths it is added.
+            - The images are downsampled with a Lanczos filter and saved as optimized PNGs; images at or below the `image_dpi` resolution are kept as they are.
+            - SVG graphs are vector images, so they are never downsampled.
+            - An image drawn at more than one width is registered once for each width it is downsampled to.
+            - Callers that already read the size of the image pass it as `size`, so the image is not read again.
+        """
+        key = hashlib.md5(image.getvalue()).hexdigest()
+        if self.image_dpi and not image.getvalue().startswith(b"<"):
+            real_width, real_height = size if size else ae.get_figure_size(image)
+            if real_width > width * self.image_dpi:
+                size = (round(width * self.image_dpi), round(real_height * width * self.image_dpi / real_width))
+                key = (key, size)
+                if key not in self.images:
+                    downsampled = io.BytesIO()
+                    Image.open(image).resize(size, Image.LANCZOS).save(downsampled, format="png", optimize=True)
+                    self.images[key] = downsampled
+        return self.images.setdefault(key, image)
+
+
     def add_image(self, filepath: str, height: int, pagenumber: int=-2) -> None:
         """
         Adds an image to the PDF document.
@@ -811,7 +901,7 @@ class pdfConstructor:
             - The `PAGE_WIDTH` attribute represents the width of the PDF page.
             - The `FPDF.get_y()` method returns the current Y position in the PDF document.
             - The `height` argument must be a positive integer representing the desired image height in points.
-            - The `filepath` must be a valid path to an existing image file.
+            - The `filepath` must be the path to a graph held in `ae.FIGURE_STORE`, or a valid path to an existing image file.
 
         Raises:
             None
@@ -827,22 +917,26 @@ class pdfConstructor:
             # Adds the image located at "resources/images/image.png" to the PDF document with a height of 200 points.
 
         Additional Information:
-            - The method uses the Python Imaging Library (PIL) to get the real width and height of the image.
+            - The image is read from memory by `ae.get_figure`, so the graphs are embedded without being read back from disk.
+            - The image is taken from the image registry by `get_image`, so an image added more than once is embedded once.
+            - The method uses `ae.get_figure_size` to get the real width and height of the image; SVG graphs are embedded as vector graphics.
             - It calculates the appropriate width to maintain the image's aspect ratio based on the provided height.
             - If the `pagenumber` argument is given, the method creates a link for the image to the specified page.
             - The `add_link()` method of the `pdf` attribute is used to create the link.
             - The image is then added to the PDF using the `image` method of the `pdf` attribute, and the link is attached.
             - Finally, the `ln()` method of the `pdf` attribute is used to move the cursor to the next line after the image.
         """
-        real_width, real_height = Image.open(filepath).size
+        image = ae.get_figure(filepath)
+        real_width, real_height = ae.get_figure_size(image)
         width = (real_width * height)/real_height
+        image = self.get_image(image, width, (real_width, real_height))
 
         if pagenumber > -2:
             pagelink = self.pdf.add_link()
             self.pdf.set_link(pagelink, page=pagenumber)
         else:
             pagelink = None
-        self.pdf.image(filepath, (PAGE_WIDTH - width)/2, FPDF.get_y(self.pdf), h=height, link=pagelink)
+        self.pdf.image(image, (PAGE_WIDTH - width)/2, FPDF.get_y(self.pdf), h=height, link=pagelink)
         self.pdf.ln(height)
         return
     
@@ -866,7 +960,7 @@ class pdfConstructor:
             - The `PAGE_WIDTH` attribute represents the width of the PDF page.
             - The `FPDF.get_y()` method returns the current Y position in the PDF document.
             - The `height` argument must be a positive integer representing the desired image height in points.
-            - The `filepath_one` and `filepath_two` must be valid paths to existing image files.
+            - The `filepath_one` and `filepath_two` must be the paths to graphs held in `ae.FIGURE_STORE`, or valid paths to existing image files.
 
         Raises:
             None
@@ -883,15 +977,20 @@ class pdfConstructor:
             # side by side to the PDF document with a height of 200 points.
 
         Additional Information:
-            - The method uses the Python Imaging Library (PIL) to get the real width and height of the images.
+            - The images are read from memory by `ae.get_figure`, so the graphs are embedded without being read back from disk.
+            - The images are taken from the image registry by `get_image`, so an image added more than once is embedded once.
+            - The method uses `ae.get_figure_size` to get the real width and height of the images; SVG graphs are embedded as vector graphics.
             - It calculates the appropriate width to maintain the images' aspect ratios based on the provided height.
             - If the `pagenumber_one` and/or `pagenumber_two` arguments are given, the method creates links for the images to the specified pages.
             - The `add_link()` method of the `pdf` attribute is used to create the links.
             - The images are then added to the PDF using the `image` method of the `pdf` attribute, and the links are attached.
             - Finally, the `ln()` method of the `pdf` attribute is used to move the cursor to the next line after the images.
         """
-        real_width, real_height = Image.open(filepath_one).size
+        image_one = ae.get_figure(filepath_one)
+        real_width, real_height = ae.get_figure_size(image_one)
         width = (real_width * height)/real_height
+        image_one = self.get_image(image_one, width, (real_width, real_height))
+        image_two = self.get_image(ae.get_figure(filepath_two), width)
 
         if pagenumber_one > -2:
             pagelink_one = self.pdf.add_link()
@@ -904,8 +1003,8 @@ class pdfConstructor:
         else:
             pagelink_two = None
         current_y = FPDF.get_y(self.pdf)
-        self.pdf.image(filepath_one, (PAGE_WIDTH - width*2)/2, current_y, h=height, link=pagelink_one)
-        self.pdf.image(filepath_two, ((PAGE_WIDTH - width*2)/2) + width, current_y, h=height, link=pagelink_two)
+        self.pdf.image(image_one, (PAGE_WIDTH - width*2)/2, current_y, h=height, link=pagelink_one)
+        self.pdf.image(image_two, ((PAGE_WIDTH - width*2)/2) + width, current_y, h=height, link=pagelink_two)
         self.pdf.ln(height)
         return
 
@@ -1133,21 +1232,20 @@ class pdfConstructor:
             # Generates a portrait table in the PDF based on the provided DataFrame returned by the function.
 
         Additional Information:
-            - The method first creates an iterable data structure from the provided DataFrame returned by the function.
+            - The method first formats every cell of the DataFrame returned by the function at once (see `format_table_cells`).
             - The number of columns in the DataFrame is calculated.
             - The header row is added to the table with bold text and custom colors using the column names from the DataFrame.
-            - The data rows are added to the table with regular text and appropriate formatting based on the cell contents.
+            - The data rows are drawn by `add_table_rows`, with missing values shown as "null".
             - If a cell value is too long, it will be truncated with an ellipsis (...) to fit within the specified character limit.
             - The resulting table is saved as a CSV file in the specified directory with a filename derived from the function name.
         """
         # Create iterable data
-        df_copy = self.df.copy()
-        df_copy = function(df_copy)
-        list_of_lists = df_copy.values
+        df_copy = function(self.df)
 
         # Define number of columns
         num_of_columns = len(list(df_copy.columns))
         char_limit = PORTRAIT_TABLE_CHAR_PER_CELL[num_of_columns]
+        cells, alignments = format_table_cells(df_copy, char_limit, missing="null")
         
         # Header Row
         self.pdf.set_fill_color(0, 72, 61)
@@ -1162,18 +1260,7 @@ class pdfConstructor:
         self.pdf.set_text_color(0, 72, 61)
         self.pdf.set_font('Roobert Regular', '', TABLE_TEXT_SIZE)
         self.pdf.set_fill_color(162, 195, 168)
-        fill_flag = False
-        for row in list_of_lists:
-            for datum in row:
-                if str(datum) == "nan":
-                    datum = "null"
-                if len(str(datum)) > char_limit:
-                    self.pdf.cell((PAGE_WIDTH-2)/num_of_columns, self.pdf.font_size + 0.2, str(datum)[:char_limit] + "...", align='C', fill=fill_flag)
-                else:
-                    self.pdf.cell((PAGE_WIDTH-2)/num_of_columns, self.pdf.font_size + 0.2, str(datum), align='C', fill=fill_flag)
-            self.pdf.ln(self.pdf.font_size + 0.2)
-            self.pdf.set_x(1)
-            fill_flag = not fill_flag
+        self.add_table_rows(cells, (PAGE_WIDTH-2)/num_of_columns, alignments)
         
         # Save
         df_copy.to_csv(self.directory + "/csvs/" + function.__name__ + ".csv")
@@ -1211,20 +1298,19 @@ class pdfConstructor:
             # Generates a landscape table in the PDF based on the provided DataFrame returned by the function.
 
         Additional Information:
-            - The method first creates an iterable data structure from the provided DataFrame returned by the function.
+            - The method first formats every cell of the DataFrame returned by the function at once (see `format_table_cells`).
             - The number of columns in the DataFrame is calculated.
             - The header row is added to the table with bold text and custom colors using the column names from the DataFrame.
-            - The data rows are added to the table with regular text and appropriate formatting based on the cell contents.
+            - The data rows are drawn by `add_table_rows`; percentages are centered, and the other cells are indented and left aligned.
             - If a cell value is too long, it will be truncated with an ellipsis (...) to fit within the specified character limit.
             - The resulting table is saved as a CSV file in the specified directory with a filename derived from the function name.
         """
-        df_copy = self.df.copy()
-        df_copy = function(df_copy)
-        list_of_lists = df_copy.values
+        df_copy = function(self.df)
 
         # Define number of columns
         num_of_columns = len(list(df_copy.columns))
         char_limit = LANDSCAPE_TABLE_CHAR_PER_CELL[num_of_columns]
+        cells, alignments = format_table_cells(df_copy, char_limit, align='L', prefix="        ", centre_percentages=True)
         
         # Header Row
         if header:
@@ -1240,20 +1326,7 @@ class pdfConstructor:
         self.pdf.set_text_color(0, 72, 61)
         self.pdf.set_font('Roobert Regular', '', TABLE_TEXT_SIZE)
         self.pdf.set_fill_color(162, 195, 168)
-        fill_flag = False
-        for row in list_of_lists:
-            for datum in row:
-                if str(datum) == "nan":
-                    datum = ""
-                if "%" in str(datum):
-                    self.pdf.cell((PAGE_HEIGHT-2)/num_of_columns, self.pdf.font_size + 0.2, str(datum), align='C', fill=fill_flag)
-                elif len(str(datum)) > char_limit:
-                    self.pdf.cell((PAGE_HEIGHT-2)/num_of_columns, self.pdf.font_size + 0.2, "        " + str(datum)[:char_limit] + "...", align='L', fill=fill_flag)
-                else:
-                    self.pdf.cell((PAGE_HEIGHT-2)/num_of_columns, self.pdf.font_size + 0.2, "        " + str(datum), align='L', fill=fill_flag)
-            self.pdf.ln(self.pdf.font_size + 0.2)
-            self.pdf.set_x(1)
-            fill_flag = not fill_flag
+        self.add_table_rows(cells, (PAGE_HEIGHT-2)/num_of_columns, alignments)
         
         # Save
         df_copy.to_csv(self.directory + "/csvs/" + function.__name__ + ".csv")
@@ -1293,23 +1366,23 @@ class pdfConstructor:
             # Generates an appendix table in the PDF based on the provided DataFrame returned by the function.
 
         Additional Information:
-            - The method first creates an iterable data structure from the provided DataFrame returned by the function.
+            - The method reads the table, page row ranges, and character limit of the function from `appendix_plan`, planning the table only if it is not part of the plan.
+            - Every cell of the table is formatted at once (see `format_table_cells`), and the rows of each page are drawn by `add_table_rows`.
             - If the DataFrame contains NaN values only, the method will display a message indicating "All values NaN" on a separate page.
-            - The number of columns in the DataFrame is calculated.
-            - For each group of rows based on `APPENDIX_LINES_PER_PAGE`, a new page is added to the PDF.
+            - For each planned range of rows (`APPENDIX_LINES_PER_PAGE` per page), a new page is added to the PDF.
             - The header row is added to each page with bold text and custom colors using the column names from the DataFrame.
             - The data rows are added to each page with regular text and appropriate formatting based on the cell contents.
             - If a cell value is too long, it will be truncated with an ellipsis (...) to fit within the specified character limit.
             - The resulting appendix table is saved as a CSV file in the specified directory with a filename derived from the function name.
         """
-        # Create iterable data
-        df_copy = self.df.copy()
-        df_copy = function(df_copy)
-        df_copy = df_copy.dropna(thresh=2)
-        list_of_lists = df_copy.values
+        # Read planned section
+        section = self.appendix_plan.get(function.__name__)
+        if section is None:
+            section = plan_appendix_section(function(self.df), title, FIRST_APPENDIX_PAGE)
+        df_copy = section["table"]
 
         # Catch NaN Tables
-        if len(list_of_lists) == 0:
+        if not section["rows"]:
             self.add_h1_text(title)
             self.add_portrait_h2_text(df_copy.columns)
             self.add_vertical_space(0.25)
@@ -1319,10 +1392,10 @@ class pdfConstructor:
 
         # Define number of columns
         num_of_columns = len(list(df_copy.columns))
-        char_limit = PORTRAIT_TABLE_CHAR_PER_CELL[num_of_columns]
+        cells, alignments = format_table_cells(df_copy, section["char_limit"])
         
         # Header Row
-        for i in range(math.ceil(len(list_of_lists)/APPENDIX_LINES_PER_PAGE)):
+        for start, end in section["rows"]:
             self.add_h1_text(title)
             self.pdf.set_fill_color(0, 72, 61)
             self.pdf.set_text_color(250, 249, 246)
@@ -1336,18 +1409,7 @@ class pdfConstructor:
             self.pdf.set_text_color(0, 72, 61)
             self.pdf.set_font('Roobert Regular', '', TABLE_TEXT_SIZE)
             self.pdf.set_fill_color(162, 195, 168)
-            fill_flag = False
-            for row in list_of_lists[i*APPENDIX_LINES_PER_PAGE:(i+1)*APPENDIX_LINES_PER_PAGE]:
-                for datum in row:
-                    if str(datum) == "nan":
-                        datum = ""
-                    if len(str(datum)) > char_limit:
-                        self.pdf.cell((PAGE_WIDTH-2)/num_of_columns, self.pdf.font_size + 0.2, str(datum)[:char_limit] + "...", align='C', fill=fill_flag)
-                    else:
-                        self.pdf.cell((PAGE_WIDTH-2)/num_of_columns, self.pdf.font_size + 0.2, str(datum), align='C', fill=fill_flag)
-                self.pdf.ln(self.pdf.font_size + 0.2)
-                self.pdf.set_x(1)
-                fill_flag = not fill_flag
+            self.add_table_rows(cells[start:end], (PAGE_WIDTH-2)/num_of_columns, alignments[start:end])
             self.add_portrait_page()
         
         # Save
@@ -1355,6 +1417,108 @@ class pdfConstructor:
         return
 
 
+    def add_table_rows(self, cells: np.ndarray, width: float, alignments: np.ndarray) -> None:
+        """
+        Draws the formatted rows of a table to the PDF document.
+
+        This method draws the rows of a table in bulk, placing the text of each cell directly rather than laying out a cell for every datum.
+        The rows are filled in alternating colours, starting with an unfilled row.
+
+        Args:
+            cells (np.ndarray): The formatted text of each cell, as returned by `format_table_cells`.
+            width (float): The width of each column in inches.
+            alignments (np.ndarray): The alignment of each cell, `C` (centered) or `L` (left), as returned by `format_table_cells`.
+
+        Preconditions:
+            - The `pdf` attribute must be properly configured with content for the PDF.
+            - The font, text colour, and fill colour of the rows must be set.
+
+        Raises:
+            None
+
+        Returns:
+            None. The rows are added to the PDF document.
+
+        Example:
+            >>> cells, alignments = format_table_cells(table, 28)
+            >>> pdf.add_table_rows(cells, (PAGE_WIDTH-2)/3, alignments)
+            # Draws the rows of the three column table below the cursor.
+
+        Additional Information:
+            - The width of each distinct text is measured once per table, as tables repeat many of their values (such as days and hours).
+            - The text is placed exactly where the `cell` method of the `pdf` attribute would place it, and a filled row is drawn as a single rectangle.
+            - A new page is started when a row does not fit on the current page, as the `cell` method does.
+        """
+        height = self.pdf.font_size + 0.2
+        text_widths = {text: self.pdf.get_string_width(text) for text in pd.unique(cells.ravel())}
+        fill_flag = False
+        for row, row_alignments in zip(cells, alignments):
+            if self.pdf.will_page_break(height):
+                x = self.pdf.x
+                self.pdf.add_page(same=True)
+                self.pdf.set_x(x)
+            x, y = self.pdf.x, self.pdf.y
+            if fill_flag:
+                self.pdf.rect(x, y, width * len(row), height, style='F')
+            baseline = y + 0.5 * height + 0.3 * self.pdf.font_size
+            for column, (text, alignment) in enumerate(zip(row, row_alignments)):
+                if text:
+                    offset = (width - text_widths[text]) / 2 if alignment == 'C' else self.pdf.c_margin
+                    self.pdf.text(x + column * width + offset, baseline, text)
+            self.pdf.ln(height)
+            self.pdf.set_x(1)
+            fill_flag = not fill_flag
+        return
+
+
+    def add_appendix_fragments(self, processes: int=None) -> None:
+        """
+        Renders the appendix and back cover on a pool of worker processes, to be merged into the PDF document when saved.
+
+        This method splits the planned appendix sections into runs of consecutive sections, renders each run into a separate PDF on a worker process,
+        and fills the rest of the PDF document with blank placeholder pages, onto which `save_pdf` merges the rendered runs.
+
+        Args:
+            processes (int, optional): The number of worker processes. Defaults to None (one per CPU).
+
+        Preconditions:
+            - The appendix cover must be the last page added to the PDF document.
+            - PyPDF must be installed (`pip install pypdf`) to save the PDF document.
+
+        Raises:
+            None
+
+        Returns:
+            None. The fragments are held in the `fragments` attribute.
+
+        Example:
+            >>> pdf.add_appendix_cover()
+            >>> pdf.add_appendix_fragments(processes=4)
+            >>> pdf.save_pdf()
+            # Saves the report with the appendix rendered on four processes.
+
+        Additional Information:
+            - Replaces `add_portrait_page`, the `add_appendix` calls, and `add_back_cover` at the end of a report.
+            - Each run is assigned its first page up front from `appendix_plan`, so the page numbers printed on its pages match the sequential report.
+            - The placeholder pages keep the links to the appendix (such as those of `add_image`) valid, as the fragments are merged onto the pages they point to.
+            - The runs are split to hold about the same number of pages each.
+        """
+        processes = (os.cpu_count() or 1) if processes is None else processes
+        first_page = self.pdf.page_no() + 1
+        runs = split_appendix_plan(self.appendix_plan, processes)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(runs)) as executor:
+            futures = []
+            for index, run in enumerate(runs):
+                back_cover = index == len(runs) - 1
+                page_count = sum(section["pages"] for section in run.values()) + back_cover
+                futures.append((first_page, page_count, executor.submit(render_appendix_fragment, self.directory, self.filename, self.network_name, run, first_page - 1, back_cover, self.image_dpi)))
+                first_page += page_count
+            self.fragments = [(start_page, page_count, future.result()) for start_page, page_count, future in futures]
+        while self.pdf.page_no() < first_page - 1:
+            self.pdf.add_page()
+        return
+
+
     def add_portrait_h2_text(self, header_row: list, pagenumber: int=-2, padding=True) -> None:
         """
         Adds an H2 level header to a portrait page in the PDF document.
@@ -1525,35 +1689,389 @@ class pdfConstructor:
 
 
 
-# MAIN
-if __name__ == "__main__":
-    # Define console parser
-    parser = argparse.ArgumentParser(description="Create data visualizations for a Pre-Validated file")
-    # Add file argument
-    parser.add_argument("file", action="store", help="The file to validate.")
-    # Add network name argument
-    parser.add_argument("network_name", action="store", help="To name the PDF and customize to the specific Network")
-    # Add latitude argument
-    parser.add_argument("latitude", action="store", help="The latitude of the center of the Network")
-    # Add longitude argument
-    parser.add_argument("longitude", action="store", help="The longitude of the center of the Network")
-    # Add longitude argument
-    parser.add_argument("city", action="store", help="The central city of the Network")
-    # Console arguments
-    args = parser.parse_args()
-    
+# FONT CACHE
+def get_font(family: str, style: str, filepath: str, alias: str) -> dict:
+    """
+    Returns a font as added by `FPDF.add_font`, adding it to a blank PDF on first use and sharing it for the rest of the process.
+
+    Args:
+        `family` (str): The family of the font, such as `Roobert Light`.
+        `style` (str): The style of the font, `''` or `'B'`.
+        `filepath` (str): The path to the TTF file.
+        `alias` (str): The page number alias of the PDF the font is for, which FPDF adds to the characters of each font.
+
+    Returns:
+        `dict`: The entry `FPDF.add_font` made for the font in `FPDF.fonts`; the same dictionary on every call.
+
+    Preconditions:
+        - The returned dictionary is shared, and must not be modified; `add_font` hands each PDF its own copy.
+
+    Raises:
+        `FileNotFoundError`: If the file does not exist.
+
+    Example:
+        >>> get_font("Roobert Light", "", "resources/Roobert Font Suite/TTF/Roobert-Light.ttf", "{nb}")["name"]
+        'RoobertLight'
+
+    Additional Information:
+        - The font is keyed on the version of FPDF and the hash of the font file, so an upgraded FPDF or an edited font is added again rather than served from the cache.
+        - The font is held in memory only, as the entry holds the path to the font file and the objects of the installed FPDF.
+    """
+    key = (FPDF_VERSION.resolve(), ac.hash_file(filepath), family, style, alias)
+    if key not in FONT_CACHE:
+        pdf = FPDF()
+        pdf.alias_nb_pages(alias)
+        pdf.add_font(family, style, fname=filepath)
+        FONT_CACHE[key] = pdf.fonts[f"{family.lower()}{style}"]
+    return FONT_CACHE[key]
+
+
+def add_font(pdf, family: str, style: str, filepath: str) -> None:
+    """
+    Adds a font to a PDF from the font cache.
+
+    Args:
+        `pdf` (FPDF): The PDF to add the font to.
+        `family` (str): The family of the font, such as `Roobert Light`.
+        `style` (str): The style of the font, `''` or `'B'`.
+        `filepath` (str): The path to the TTF file.
+
+    Returns:
+        None.
+
+    Preconditions:
+        - The font must not be added to the PDF already.
+
+    Raises:
+        `FileNotFoundError`: If the file does not exist.
+
+    Example:
+        >>> add_font(pdf, "Roobert Light", "", "resources/Roobert Font Suite/TTF/Roobert-Light.ttf")
+        >>> pdf.set_font("Roobert Light", "", 10)
+
+    Additional Information:
+        - Stands in for `FPDF.add_font`, copying the font FPDF added to a blank PDF rather than parsing the font file again.
+        - Each PDF gets a deep copy of the font, as FPDF modifies its descriptor and character subset while saving the PDF.
+        - If the font cannot be read from the cache, it is added with `FPDF.add_font` instead.
+        - The font file is still read when the PDF is saved, to embed the characters used.
+    """
+    try:
+        font = copy.deepcopy(get_font(family, style, filepath, pdf.str_alias_nb_pages))
+    except Exception:
+        pdf.add_font(family, style, fname=filepath)
+        return
+    font["i"] = len(pdf.fonts) + 1
+    pdf.fonts[f"{family.lower()}{style}"] = font
+    return
+
+
+
+
+# TABLE FORMATTING
+def format_table_cells(table: pd.DataFrame, char_limit: int, missing: str="", align: str='C', prefix: str="", centre_percentages: bool=False) -> tuple:
+    """
+    Formats every cell of a table for the pdfConstructor, a column at a time.
+
+    Args:
+        `table` (pd.DataFrame): The table to format.
+        `char_limit` (int): The number of characters shown in a cell, beyond which the cell is truncated with an ellipsis (...).
+        `missing` (str) [kwargg]: The text shown for missing (NaN) values, defaulted to "".
+        `align` (str) [kwargg]: The alignment of the cells, `C` (centered) or `L` (left), defaulted to `C`.
+        `prefix` (str) [kwargg]: The text placed before each cell (such as an indent), defaulted to "".
+        `centre_percentages` (bool) [kwargg]: True to center the cells holding a percentage, without truncating or prefixing them, defaulted to False.
+
+    Returns:
+        `tuple`: A tuple of two arrays, shaped like the table; the text of each cell, and the alignment of each cell.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> format_table_cells(pd.DataFrame({"Name": ["Food Bank of the Greater Boston Area"], "Phone": [np.nan]}), 28)[0]
+        array([['Food Bank of the Greater Bos...', '']], dtype=object)
+
+    Additional Information:
+        - Each cell is shown as `str` of its value, as it would be when printed.
+        - The missing values are replaced before the cells are truncated.
+    """
+    cells = pd.DataFrame(table.values, dtype=object).map(str)
+    cells = cells.mask(cells == "nan", missing)
+    lengths = cells.apply(lambda column: column.str.len())
+    text = cells.where(lengths <= char_limit, cells.apply(lambda column: column.str[:char_limit]) + "...")
+    text = prefix + text if prefix else text
+    alignments = np.full(cells.shape, align, dtype=object)
+    if centre_percentages:
+        percentages = cells.apply(lambda column: column.str.contains("%", regex=False)).values
+        text = text.where(~percentages, cells)
+        alignments[percentages] = 'C'
+    return text.values, alignments
+
+
+
+
+# APPENDIX PLANNER
+def plan_appendix_section(table: pd.DataFrame, title: str, start_page: int) -> dict:
+    """
+    Lays out a single appendix table.
+
+    Args:
+        `table` (pd.DataFrame): The appendix table, as returned by its table function.
+        `title` (str): The title of the appendix section.
+        `start_page` (int): The page the section starts on.
+
+    Returns:
+        `dict`: A dictionary of the layout of the section; the `title`, the `table` without its empty rows, the `start_page`, the `rows` (a list of the start and end row of each page), the `pages` spanned, and the `char_limit` of its cells.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `KeyError`: If the table has rows and more columns than `PORTRAIT_TABLE_CHAR_PER_CELL` lays out.
+
+    Example:
+        >>> plan_appendix_section(ae.create_organization_table(data), "Organization List", 17)["rows"]
+        [(0, 25), (25, 31)]
+
+    Additional Information:
+        - Rows with fewer than two values are dropped, matching the rows rendered by `add_appendix`.
+        - A section with no rows still spans one page, holding the "All values NaN" message.
+        - Cells longer than `char_limit` are truncated with an ellipsis when rendered.
+    """
+    table = table.dropna(thresh=2)
+    rows = [(start, min(start + APPENDIX_LINES_PER_PAGE, len(table))) for start in range(0, len(table), APPENDIX_LINES_PER_PAGE)]
+    char_limit = PORTRAIT_TABLE_CHAR_PER_CELL[len(table.columns)] if rows else None
+    return {"title": title, "table": table, "start_page": start_page, "rows": rows, "pages": max(len(rows), 1), "char_limit": char_limit}
+
+
+def plan_appendix(df: pd.DataFrame, sections: list=None, first_page: int=FIRST_APPENDIX_PAGE) -> dict:
+    """
+    Lays out the appendix of a report, building each appendix table once.
+
+    Args:
+        `df` (pd.DataFrame): The DataFrame of the report.
+        `sections` (list) [kwargg]: A list of the appendix sections, each the name of a table function and the TEXT section titling it, defaulted to None (`APPENDIX_SECTIONS`).
+        `first_page` (int) [kwargg]: The page the appendix starts on, defaulted to `FIRST_APPENDIX_PAGE`.
+
+    Returns:
+        `dict`: A dictionary of the layout of each section (see `plan_appendix_section`), keyed on the name of its table function, in the order of the appendix.
+
+    Preconditions:
+        - The table functions must be defined in the Analytics Engine.
+
+    Raises:
+        `AttributeError`: If a table function is not defined in the Analytics Engine.
+
+    Example:
+        >>> {name: section["start_page"] for name, section in plan_appendix(data).items()}
+        {'create_organization_table': 17, 'create_location_table': 19, ...}
+
+    Additional Information:
+        - The tables are read from the table cache when `ae.run_report_graph` has already computed them.
+        - Each section starts on the page after the last page of the section before it.
+    """
+    sections = APPENDIX_SECTIONS if sections is None else sections
+    plan = {}
+    current_page = first_page
+    for name, text_section in sections:
+        plan[name] = plan_appendix_section(getattr(ae, name)(df), TEXT[text_section]["title"], current_page)
+        current_page += plan[name]["pages"]
+    return plan
+
+
+def split_appendix_plan(plan: dict, parts: int) -> list:
+    """
+    Splits the appendix plan into runs of consecutive sections holding about the same number of pages.
+
+    Args:
+        `plan` (dict): The layout of the appendix sections, as returned by `plan_appendix`.
+        `parts` (int): The largest number of runs.
+
+    Returns:
+        `list`: A list of the runs, each a dictionary of sections like `plan`, in the order of the appendix.
+
+    Preconditions:
+        - The `plan` must hold at least one section.
+
+    Raises:
+        None.
+
+    Example:
+        >>> [list(run) for run in split_appendix_plan(plan_appendix(data), 2)]
+        [['create_organization_table', ..., 'create_program_by_program_type_table'], ['create_program_by_program_audience_table', ...]]
+
+    Additional Information:
+        - A section is never split across runs, so a run may hold more pages than the others if a single section is long.
+    """
+    target = sum(section["pages"] for section in plan.values()) / max(parts, 1)
+    runs = [{}]
+    pages = 0
+    for name, section in plan.items():
+        if runs[-1] and pages + section["pages"] / 2 > target * len(runs) and len(runs) < parts:
+            runs.append({})
+        runs[-1][name] = section
+        pages += section["pages"]
+    return runs
+
+
+def render_appendix_fragment(directory: str, filename: str, network_name: str, sections: dict, page_offset: int, back_cover: bool, image_dpi: int=None) -> bytes:
+    """
+    Renders a run of appendix sections into a PDF fragment, on a worker process.
+
+    Args:
+        `directory` (str): The directory of the report.
+        `filename` (str): The filename of the report.
+        `network_name` (str): The name of the network of the report.
+        `sections` (dict): The run of appendix sections to render, as returned by `split_appendix_plan`.
+        `page_offset` (int): The number of pages of the report before the fragment.
+        `back_cover` (bool): True to end the fragment with the back cover of the report.
+        `image_dpi` (int) [kwargg]: The largest resolution of the raster images of the fragment, defaulted to None (the resolution of each image).
+
+    Returns:
+        `bytes`: The PDF fragment.
+
+    Preconditions:
+        - The tables of the sections must be held in the plan.
+
+    Raises:
+        None.
+
+    Example:
+        >>> render_appendix_fragment("data_sample_dataset", "sample_network_analytical_report.pdf", "Sample Network", run, 16, True)
+        b'%PDF-1.3...'
+
+    Additional Information:
+        - The fragment starts with a new page, as `generate_report` does after the appendix cover, and ends with the page following the last section (the back cover, if `back_cover`).
+        - The tables of the sections are saved as CSVs by `add_appendix`, as in the sequential report.
+    """
+    constructor = pdfConstructor(pd.DataFrame(), directory, filename, network_name, new_appendix_plan=sections, new_page_offset=page_offset, new_image_dpi=image_dpi)
+    constructor.add_portrait_page()
+    for name, section in sections.items():
+        constructor.add_appendix(getattr(ae, name), section["title"])
+    if back_cover:
+        constructor.add_back_cover()
+    return bytes(constructor.pdf.output())
+
+
+def merge_pdf_fragments(body: bytes, fragments: list, filepath: str) -> None:
+    """
+    Merges the PDF fragments onto the placeholder pages of the body of a report, and saves the report.
+
+    Args:
+        `body` (bytes): The body of the report, holding a blank placeholder page for every page of the fragments.
+        `fragments` (list): A list of the fragments, each the first page it is merged onto, its page count, and the PDF fragment.
+        `filepath` (str): The path to save the report to.
+
+    Returns:
+        None.
+
+    Preconditions:
+        - PyPDF must be installed (`pip install pypdf`).
+
+    Raises:
+        `ModuleNotFoundError`: If PyPDF is not installed.
+
+    Example:
+        >>> merge_pdf_fragments(body, [(17, 120, fragment)], "data_sample_dataset/sample_network_analytical_report.pdf")
+
+    Additional Information:
+        - The contents and resources of each fragment page replace those of its placeholder page, rather than the page being inserted, so the links of the body pointing to the placeholder pages stay valid.
+        - The placeholder pages are blank, so their contents are replaced rather than merged; merging (`PageObject.merge_page`) would parse and rewrite every content stream.
+        - Each fragment page brings its own resource dictionary, so the fonts and images named in its contents resolve to the objects of its fragment, whatever names the body gives its own.
+        - The pages of a fragment beyond its page count (the page following its last section) are dropped.
+        - Identical objects, such as the images and font descriptors shared by the fragments, are written once, and the replaced contents of the placeholder pages are dropped.
+    """
+    writer = pypdf.PdfWriter(clone_from=io.BytesIO(body))
+    for first_page, page_count, fragment in fragments:
+        reader = pypdf.PdfReader(io.BytesIO(fragment))
+        for index in range(page_count):
+            page = writer.pages[first_page - 1 + index]
+            for key in ("/Contents", "/Resources"):
+                page[pypdf.generic.NameObject(key)] = reader.pages[index].raw_get(key).clone(writer)
+    writer.compress_identical_objects()
+    with open(filepath, "wb") as file:
+        writer.write(file)
+    return
+
+
+
+
+# REPORT
+def generate_report(filepath: str, network_name: str, latitude: float, longitude: float, city: str, engine: str="c", processes: int=None, map_backend: str="plotly", profile: bool=False, cache: bool=True, save_images: bool=True, vector: bool=False, parallel_sections: bool=False, image_dpi: int=None) -> str:
+    """
+    Generates the analytical report (PDF) of a network bulk upload file.
+
+    Args:
+        `filepath` (str): The path to the bulk upload file (CSV).
+        `network_name` (str): The name of the network, used to name and customize the report.
+        `latitude` (float): The latitude of the center of the network.
+        `longitude` (float): The longitude of the center of the network.
+        `city` (str): The central city of the network.
+        `engine` (str) [kwargg]: The CSV parser engine, either `c` or `pyarrow`, defaulted to `c`.
+        `processes` (int) [kwargg]: The number of threads and processes to compute the tables and graphs with, defaulted to None (one per CPU).
+        `map_backend` (str) [kwargg]: The renderer of the location maps, either `plotly` or `pil`, defaulted to `plotly`.
+        `profile` (bool) [kwargg]: True to save the time and memory of each stage of the report as `profile.json`, defaulted to False.
+        `cache` (bool) [kwargg]: True to reuse the unchanged tables, graphs, and text fields of an earlier run of the same bulk upload, defaulted to True.
+        `save_images` (bool) [kwargg]: True to also save the graphs in the `images` folder of the report, defaulted to True.
+        `vector` (bool) [kwargg]: True to draw the graphs as vector images (SVG) rather than PNGs, defaulted to False.
+        `parallel_sections` (bool) [kwargg]: True to render the appendix sections on `processes` worker processes and merge them into the report, defaulted to False.
+        `image_dpi` (int) [kwargg]: The largest resolution of the raster images of the report, in dots per inch, defaulted to None (the resolution of each image).
+
+    Returns:
+        `str`: The path to the generated report, from the root directory.
+
+    Preconditions:
+        - The `filepath` must be a valid path to a bulk upload file (CSV).
+
+    Raises:
+        `ImportError`: If the `pyarrow` engine is requested but PyArrow is not installed.
+        `ValueError`: If the map backend is not `plotly` or `pil`.
+        `ModuleNotFoundError`: If `parallel_sections` is requested but PyPDF is not installed.
+
+    Example:
+        >>> generate_report("sample_dataset.csv", "Sample Network", 42.355455, -71.063868, "Boston")
+        'data_sample_dataset/sample_network_analytical_report.pdf'
+
+    Additional Information:
+        - The bulk upload file is moved into the folder `data_{bulk upload file name}`, alongside the report and its assets.
+        - `TEXT` is reset to a fresh copy of `resources/text.json` before each report, so reports generated in the same process do not share formatted text.
+        - The tables, graphs, and text fields are computed up front by `ae.run_report_graph`, each once and in dependency order, so the pdfConstructor reads the tables from the table cache.
+        - The appendix is laid out once by `plan_appendix`; the same plan numbers the links of the report and renders the appendix tables.
+        - With `parallel_sections`, the appendix and back cover are rendered by `pdfConstructor.add_appendix_fragments`, the long tail of large reports.
+        - Appendices shorter than `PARALLEL_SECTIONS_MIN_PAGES` are rendered in one process with a warning, as their fragments would merge slower than they render.
+        - When profiling, the graphs are rendered in the current process so their stages are measured, and the profile is saved in the report folder.
+        - The tables, graphs, and text fields are cached in `resources/artifacts` (see `artifactCache.py`), keyed on everything they are computed from.
+        - The graphs and text fields are also cached on the tables they read, so on a new bulk upload of a network only those whose tables changed are rendered again.
+        - The graphs are rendered into memory and embedded in the report from there; saving them in the `images` folder happens on a background thread while the report is built.
+        - With `vector`, the bar and pie graphs are embedded as vector graphics; the location maps are always drawn as PNGs.
+    """
+    # Reset text
+    TEXT.clear()
+    TEXT.update(rr.copy_resource(TEXT_SAVE_NAME))
+    # Enable profiling
+    if profile:
+        sp.enable_profiling(bul, ["load_"])
+        sp.enable_profiling(ae, ["create_", "graph_", "calculate_", "render_"])
+        sp.enable_profiling(pdfConstructor, ["add_", "save_"])
+        sp.clear_profile()
+        processes = 1
+
     # Create directory name
-    directory = "data_" + args.file.split("\\")[-1].replace(".csv", "")
-    # Create network name
-    network_name = args.network_name
-    # Create latitude
-    latitude = float(args.latitude)
-    # Create longitude
-    longitude = float(args.longitude)
-    # Create city
-    city = args.city
+    directory = "data_" + filepath.split("\\")[-1].replace(".csv", "")
     # Create DataFrame
-    df = pd.read_csv(args.file)
+    df = bul.load_bulk_upload(filepath, engine=engine)
+    # Lay out appendix
+    appendix_plan = None
+    if parallel_sections:
+        appendix_plan = plan_appendix(df)
+        appendix_pages = sum(section["pages"] for section in appendix_plan.values())
+        if appendix_pages < PARALLEL_SECTIONS_MIN_PAGES:
+            warnings.warn(f"The appendix holds {appendix_pages} pages, under the {PARALLEL_SECTIONS_MIN_PAGES} of parallel sections; rendering it in one process.", stacklevel=2)
+            parallel_sections = False
+    # Create artifact cache
+    artifact_cache = ac.ArtifactCache(ac.hash_values(ac.hash_file(filepath), engine)) if cache else None
 
     # Create directory within project folder
     if not os.path.isdir(directory):
@@ -1567,14 +2085,69 @@ if __name__ == "__main__":
     if not os.path.isdir(directory + "/images"):
         os.mkdir(directory + "/images")
     # Move file to directory
-    if args.file.split("\\")[0] != directory:
-        shutil.move(args.file, directory)
+    if filepath.split("\\")[0] != directory:
+        shutil.move(filepath, directory)
     # Move resource images to directory
     for image in glob.iglob("resources/images/*png"):
         shutil.copyfile(image, directory + "/resources/images/" + image.split("\\")[1])
 
+    # Create a list of report outputs
+    outputs = [
+        "create_map",
+        "create_zoomed_map",
+        "graph_profile_grade",
+        "graph_missing_organization_contact_info",
+        "graph_missing_location_contact_info",
+        "graph_missing_program_contact_info",
+        "graph_program_type",
+        "graph_food_program_breakdown",
+        "graph_program_filter_usage",
+        "graph_network_hours_overview",
+        "graph_sample_location_hours_current_month",
+        "graph_sample_location_hours_next_month",
+        "graph_sample_program_hours_current_month",
+        "graph_sample_program_hours_next_month",
+        "graph_program_qualifications",
+        "graph_program_service_areas",
+        "calculate_percent_locations_inactive",
+        "calculate_locations_programs_without_contact",
+        "calculate_food_distribution_program_percent",
+        "calculate_current_next_month",
+        "create_network_overview_table",
+        "create_high_low_graded_profiles_table",
+        "create_most_used_sub_filter_table",
+        "create_program_sub_filter_usage_table_group_a",
+        "create_program_sub_filter_usage_table_group_b",
+        "create_program_sub_filter_usage_table_group_c",
+        "create_program_sub_filter_usage_table_group_e",
+        "create_hour_type_usage_table",
+        "create_organization_table",
+        "create_location_table",
+        "create_program_table",
+        "create_program_profile_completion_table",
+        "create_organization_contact_information_table",
+        "create_location_contact_information_table",
+        "create_program_contact_information_table",
+        "create_program_by_program_type_table",
+        "create_program_by_program_audience_table",
+        "create_program_by_program_languages_spoken_table",
+        "create_program_by_program_features_table",
+        "create_program_by_program_items_offered_table",
+        "create_program_by_program_dietary_options_table",
+        "create_location_hours_table",
+        "create_program_hours_table",
+        "create_program_by_program_qualifications_table",
+        "create_program_by_program_service_area_table"
+    ]
+    # Create keyword arguments of the maps
+    keywords = {"create_map": {"backend": map_backend}, "create_zoomed_map": {"lat_epicenter": latitude, "lon_epicenter": longitude, "backend": map_backend}}
+    # Create keyword arguments of the graphs
+    keywords.update({name: {"vector": True} for name in outputs if vector and ae.get_node_kind(name) == "graph" and name not in keywords})
+    # Compute report graph
+    graphs = ae.run_report_graph(df, directory, outputs, text=TEXT, keywords=keywords, processes=processes, cache=artifact_cache, save_figures=save_images)
+
     # Create pdfConstructor instance
-    constructor = pdfConstructor(df, directory, network_name.replace(" ", "_").lower() + TEXT["FILE"]["filename"], network_name)
+    constructor = pdfConstructor(df, directory, network_name.replace(" ", "_").lower() + TEXT["FILE"]["filename"], network_name, new_appendix_plan=appendix_plan, new_image_dpi=image_dpi)
 
     # Cover Page
     constructor.add_portrait_page()
@@ -1587,13 +2160,12 @@ if __name__ == "__main__":
     # Location Map
     constructor.add_portrait_page()
     constructor.add_h1_text(TEXT["LOCATION MAP"]["title"])
-    constructor.add_image(ae.create_map(df, directory), 3.05, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION LIST"]["title"]])
+    constructor.add_image(graphs["create_map"], 3.05, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION LIST"]["title"]])
     constructor.add_vertical_space(0.1)
-    constructor.add_image(ae.create_zoomed_map(df, directory, latitude, longitude), 3.05, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION LIST"]["title"]])
+    constructor.add_image(graphs["create_zoomed_map"], 3.05, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION LIST"]["title"]])
     TEXT["LOCATION MAP"]["subtitle"] = TEXT["LOCATION MAP"]["subtitle"].format(city)
     constructor.add_subtitle_text(TEXT["LOCATION MAP"]["subtitle"])
     constructor.add_vertical_space(0.05)
-    TEXT = ae.calculate_percent_locations_inactive(df, TEXT, "NETWORK OVERVIEW", "paragraph")
     constructor.add_normal_text(TEXT["NETWORK OVERVIEW"]["paragraph"], pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION LIST"]["title"]])
 
     # Network Overview
@@ -1606,7 +2178,7 @@ if __name__ == "__main__":
     constructor.add_h1_text(TEXT["PROFILE COMPLETENESS"]["title"])
     constructor.add_horizontal_line()
     constructor.add_normal_text(TEXT["PROFILE COMPLETENESS"]["paragraph"])
-    constructor.add_image(ae.graph_profile_grade(df, directory), 3.75, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["title"]])
+    constructor.add_image(graphs["graph_profile_grade"], 3.75, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["title"]])
     constructor.add_subtitle_text(TEXT["PROFILE COMPLETENESS"]["subtitle"])
 
     # Highest Lowest Profile Grades
@@ -1621,39 +2193,37 @@ if __name__ == "__main__":
     constructor.add_h1_text(TEXT["VIVERY CONTACT INFORMATION"]["title"])
     constructor.add_horizontal_line()
     constructor.add_normal_text(TEXT["VIVERY CONTACT INFORMATION"]["paragraph"])
-    constructor.add_image(ae.graph_missing_organization_contact_info(df, directory), 3.75, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX ORGANIZATION CONTACT INFORMATION"]["title"]])
+    constructor.add_image(graphs["graph_missing_organization_contact_info"], 3.75, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX ORGANIZATION CONTACT INFORMATION"]["title"]])
 
     # Public Contact Information
     constructor.add_h1_text(TEXT["PUBLIC CONTACT INFORMATION"]["title"])
     constructor.add_horizontal_line()
-    TEXT = ae.calculate_locations_programs_without_contact(df, TEXT, "PUBLIC CONTACT INFORMATION", "paragraph")
     constructor.add_normal_text(TEXT["PUBLIC CONTACT INFORMATION"]["paragraph"])
     constructor.add_vertical_space(0.075)
     constructor.add_portrait_h2_text(TEXT["PUBLIC CONTACT INFORMATION"]["subtitle"], padding=False)
     constructor.add_vertical_space(0.01)
-    constructor.add_two_images(ae.graph_missing_location_contact_info(df, directory), ae.graph_missing_program_contact_info(df, directory), 2.25, pagenumber_one=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION CONTACT INFORMATION"]["title"]], pagenumber_two=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM CONTACT INFORMATION"]["title"]])
+    constructor.add_two_images(graphs["graph_missing_location_contact_info"], graphs["graph_missing_program_contact_info"], 2.25, pagenumber_one=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION CONTACT INFORMATION"]["title"]], pagenumber_two=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM CONTACT INFORMATION"]["title"]])
 
     # Program Types
     constructor.add_portrait_page()
     constructor.add_h1_text(TEXT["PROGRAM TYPES"]["title"])
     constructor.add_horizontal_line()
     constructor.add_normal_text(TEXT["PROGRAM TYPES"]["paragraph one"])
-    constructor.add_image(ae.graph_program_type(df, directory), 3.25, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM TYPE"]["title"]])
+    constructor.add_image(graphs["graph_program_type"], 3.25, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM TYPE"]["title"]])
     constructor.add_horizontal_line()
     constructor.add_vertical_space(0.1)
-    TEXT = ae.calculate_food_distribution_program_percent(df, TEXT, "PROGRAM TYPES", "paragraph two")
     constructor.add_normal_text(TEXT["PROGRAM TYPES"]["paragraph two"])
     constructor.add_vertical_space(0.075)
     constructor.add_portrait_h2_text(TEXT["PROGRAM TYPES"]["subtitle"], padding=False)
     constructor.add_vertical_space(0.01)
-    constructor.add_image(ae.graph_food_program_breakdown(df, directory), 3.25, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM TYPE"]["title"]])
+    constructor.add_image(graphs["graph_food_program_breakdown"], 3.25, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM TYPE"]["title"]])
 
     # Filter Fields
     constructor.add_portrait_page()
     constructor.add_h1_text(TEXT["PROGRAM FILTER FIELDS"]["title"])
     constructor.add_horizontal_line()
     constructor.add_normal_text(TEXT["PROGRAM FILTER FIELDS"]["paragraph"])
-    constructor.add_image(ae.graph_program_filter_usage(df, directory), 3.75, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM AUDIENCE"]["title"]])
+    constructor.add_image(graphs["graph_program_filter_usage"], 3.75, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM AUDIENCE"]["title"]])
 
     # # Recommended Filter Options
     constructor.add_h1_text(TEXT["MOST USED SUB FILTERS"]["title"])
@@ -1688,7 +2258,7 @@ if __name__ == "__main__":
     constructor.add_h1_text(TEXT["NETWORK HOURS OVERVIEW"]["title"])
     constructor.add_horizontal_line()
     constructor.add_normal_text(TEXT["NETWORK HOURS OVERVIEW"]["paragraph"])
-    constructor.add_image(ae.graph_network_hours_overview(df, directory), 3.25, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION HOURS INFORMATION"]["title"]])
+    constructor.add_image(graphs["graph_network_hours_overview"], 3.25, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION HOURS INFORMATION"]["title"]])
 
     # Network Hour Type Usage
     constructor.add_h1_text(TEXT["NETWORK HOUR TYPE USAGE"]["title"])
@@ -1703,19 +2273,18 @@ if __name__ == "__main__":
     constructor.add_portrait_page()
     constructor.add_h1_text(TEXT["LOCATION HOURS PREVIEW"]["title"])
     constructor.add_horizontal_line()
-    TEXT = ae.calculate_current_next_month(df, TEXT, "LOCATION HOURS PREVIEW", "paragraph")
     constructor.add_normal_text(TEXT["LOCATION HOURS PREVIEW"]["paragraph"])
     constructor.add_vertical_space(0.1)
-    constructor.add_portrait_h2_text(TEXT["LOCATION HOURS PREVIEW"]["subtitle"], padding=ae.graph_sample_location_hours_current_month(df, directory) != "resources\images\\null_graph.png")
-    constructor.add_image(ae.graph_sample_location_hours_current_month(df, directory), 3.65, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION HOURS INFORMATION"]["title"]])
-    constructor.add_image(ae.graph_sample_location_hours_next_month(df, directory), 3.65, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION HOURS INFORMATION"]["title"]])
+    constructor.add_portrait_h2_text(TEXT["LOCATION HOURS PREVIEW"]["subtitle"], padding=graphs["graph_sample_location_hours_current_month"] != "resources\images\\null_graph.png")
+    constructor.add_image(graphs["graph_sample_location_hours_current_month"], 3.65, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION HOURS INFORMATION"]["title"]])
+    constructor.add_image(graphs["graph_sample_location_hours_next_month"], 3.65, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX LOCATION HOURS INFORMATION"]["title"]])
 
     # Program Hours Preview
     constructor.add_portrait_page()
     constructor.add_h1_text(TEXT["PROGRAM HOURS PREVIEW"]["title"])
-    constructor.add_portrait_h2_text(TEXT["PROGRAM HOURS PREVIEW"]["subtitle"], padding=ae.graph_sample_program_hours_current_month(df, directory) != "resources\images\\null_graph.png")
-    constructor.add_image(ae.graph_sample_program_hours_current_month(df, directory), 3.65, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["title"]])
-    constructor.add_image(ae.graph_sample_program_hours_next_month(df, directory), 3.65, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["title"]])
+    constructor.add_portrait_h2_text(TEXT["PROGRAM HOURS PREVIEW"]["subtitle"], padding=graphs["graph_sample_program_hours_current_month"] != "resources\images\\null_graph.png")
+    constructor.add_image(graphs["graph_sample_program_hours_current_month"], 3.65, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["title"]])
+    constructor.add_image(graphs["graph_sample_program_hours_next_month"], 3.65, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["title"]])
     constructor.add_horizontal_line()
     constructor.add_normal_text(TEXT["PROGRAM HOURS PREVIEW"]["paragraph"])
 
@@ -1724,80 +2293,89 @@ if __name__ == "__main__":
     constructor.add_h1_text(TEXT["MISSING PROGRAM QUALIFICATIONS"]["title"])
     constructor.add_horizontal_line()
     constructor.add_normal_text(TEXT["MISSING PROGRAM QUALIFICATIONS"]["paragraph"])
-    constructor.add_image(ae.graph_program_qualifications(df, directory), 3.15, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM QUALIFICATIONS"]["title"]])
+    constructor.add_image(graphs["graph_program_qualifications"], 3.15, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM QUALIFICATIONS"]["title"]])
 
     # Missing Program Service Areas
     constructor.add_h1_text(TEXT["MISSING PROGRAM SERVICE AREA"]["title"])
     constructor.add_horizontal_line()
     constructor.add_normal_text(TEXT["MISSING PROGRAM SERVICE AREA"]["paragraph"])
-    constructor.add_image(ae.graph_program_service_areas(df, directory), 3.15, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM SERVICE AREAS"]["title"]])
+    constructor.add_image(graphs["graph_program_service_areas"], 3.15, pagenumber=constructor.appendix_page_numbers[TEXT["APPENDIX PROGRAM SERVICE AREAS"]["title"]])
 
     # Page Break
     constructor.add_appendix_cover()
 
-    # APPENDIX ORGANIZATION LIST
-    constructor.add_portrait_page()
-    constructor.add_appendix(ae.create_organization_table, TEXT["APPENDIX ORGANIZATION LIST"]["title"])
-
-    # APPENDIX LOCATION LIST
-    constructor.add_appendix(ae.create_location_table, TEXT["APPENDIX LOCATION LIST"]["title"])
-
-    # APPENDIX PROGRAM LIST
-    constructor.add_appendix(ae.create_program_table, TEXT["APPENDIX PROGRAM LIST"]["title"])
-
-    # APPENDIX PROGRAM PROFILE COMPLETION LIST
-    constructor.add_appendix(ae.create_program_profile_completion_table, TEXT["APPENDIX PROGRAM PROFILE COMPLETION LIST"]["title"])
-
-    # APPENDIX ORGANIZATION CONTACT INFORMATION
-    constructor.add_appendix(ae.create_organization_contact_information_table, TEXT["APPENDIX ORGANIZATION CONTACT INFORMATION"]["title"])
-
-    # APPENDIX LOCATION CONTACT INFORMATION
-    constructor.add_appendix(ae.create_location_contact_information_table, TEXT["APPENDIX LOCATION CONTACT INFORMATION"]["title"])
-    
-    # APPENDIX PROGRAM CONTACT INFORMATION
-    constructor.add_appendix(ae.create_program_contact_information_table, TEXT["APPENDIX PROGRAM CONTACT INFORMATION"]["title"])
-
-    # APPENDIX PROGRAM TYPE
-    constructor.add_appendix(ae.create_program_by_program_type_table, TEXT["APPENDIX PROGRAM TYPE"]["title"])
-
-    # APPENDIX PROGRAM AUDIENCE
-    constructor.add_appendix(ae.create_program_by_program_audience_table, TEXT["APPENDIX PROGRAM AUDIENCE"]["title"])
+    if parallel_sections:
+        # Appendix and Back Cover
+        constructor.add_appendix_fragments(processes)
+    else:
+        # Appendix
+        constructor.add_portrait_page()
+        for name, section in constructor.appendix_plan.items():
+            constructor.add_appendix(getattr(ae, name), section["title"])
 
-    # APPENDIX PROGRAM LANGUAGES SPOKEN
-    constructor.add_appendix(ae.create_program_by_program_languages_spoken_table, TEXT["APPENDIX PROGRAM LANGUAGES SPOKEN"]["title"])
-
-    # APPENDIX PROGRAM FEATURES
-    constructor.add_appendix(ae.create_program_by_program_features_table, TEXT["APPENDIX PROGRAM FEATURES"]["title"])
-
-    # APPENDIX PROGRAM ITEMS OFFERED
-    constructor.add_appendix(ae.create_program_by_program_items_offered_table, TEXT["APPENDIX PROGRAM ITEMS OFFERED"]["title"])
-
-    # APPENDIX PROGRAM DIETARY OPTIONS
-    constructor.add_appendix(ae.create_program_by_program_dietary_options_table, TEXT["APPENDIX PROGRAM DIETARY OPTIONS"]["title"])
-
-    # APPENDIX PROGRAM FILTERS AVAILABLE
-    # constructor.add_appendix(ae.create_recommended_program_filters_table, TEXT["APPENDIX PROGRAM FILTERS AVAILABLE"]["title"])
-
-    # APPENDIX LOCATION HOURS INFORMATION
-    constructor.add_appendix(ae.create_location_hours_table, TEXT["APPENDIX LOCATION HOURS INFORMATION"]["title"])
-
-    # APPENDIX PROGRAM HOURS INFORMATION
-    constructor.add_appendix(ae.create_program_hours_table, TEXT["APPENDIX PROGRAM HOURS INFORMATION"]["title"])
-
-    # APPENDIX PROGRAM QUALIFICATIONS
-    constructor.add_appendix(ae.create_program_by_program_qualifications_table, TEXT["APPENDIX PROGRAM QUALIFICATIONS"]["title"])
-
-    # APPENDIX PROGRAM SERVICE AREAS
-    constructor.add_appendix(ae.create_program_by_program_service_area_table, TEXT["APPENDIX PROGRAM SERVICE AREAS"]["title"])
-
-    # Back Cover
-    constructor.add_back_cover()
+        # Back Cover
+        constructor.add_back_cover()
 
     # Save PDF
     constructor.save_pdf()
 
+    # Release memoized tables and graphs
+    ae.clear_table_cache()
+    ae.wait_for_figures()
+    ae.clear_figures(directory)
+
     # Save State
     ae.save_state(TEXT, TEXT_SAVE_NAME.replace('resources/', ''), directory + "/resources")
     ae.save_state(WEIGHTS, WEIGHTS_SAVE_NAME.replace('resources/', ''), directory + "/resources")
     ae.save_state(RECOMMENDED_FILTERS, RECOMMENDED_FILTERS_SAVE_NAME.replace('resources/', ''), directory + "/resources")
     ae.save_state(PROFILE_COMPLETION_TIERS, PROFILE_COMPLETION_TIERS_SAVE_NAME.replace('resources/', ''), directory + "/resources")
+
+    # Save Profile
+    if profile:
+        sp.save_profile(directory + "/profile.json")
+    return directory + "/" + constructor.filename
+
+
+
+
+# MAIN
+if __name__ == "__main__":
+    # Define console parser
+    parser = argparse.ArgumentParser(description="Create data visualizations for a Pre-Validated file")
+    # Add file argument
+    parser.add_argument("file", action="store", help="The file to validate.")
+    # Add network name argument
+    parser.add_argument("network_name", action="store", help="To name the PDF and customize to the specific Network")
+    # Add latitude argument
+    parser.add_argument("latitude", action="store", help="The latitude of the center of the Network")
+    # Add longitude argument
+    parser.add_argument("longitude", action="store", help="The longitude of the center of the Network")
+    # Add longitude argument
+    parser.add_argument("city", action="store", help="The central city of the Network")
+    # Add engine argument
+    parser.add_argument('--engine', action='store', default='c', choices=['c', 'pyarrow'], help='The CSV parser engine')
+    # Add processes argument
+    parser.add_argument('--processes', action='store', type=int, help='The number of threads and processes to compute the tables and graphs with')
+    # Add map backend argument
+    parser.add_argument('--map-backend', action='store', default='plotly', choices=['plotly', 'pil'], help='The renderer of the location maps')
+    # Add profile argument
+    parser.add_argument('--profile', action='store_true', help='Save the time and memory of each stage as profile.json')
+    # Add no cache argument
+    parser.add_argument('--no-cache', action='store_true', help='Compute every table and graph, rather than reusing the unchanged ones of an earlier run')
+    # Add no images argument
+    parser.add_argument('--no-images', action='store_true', help='Embed the graphs in the report without saving them in the images folder')
+    # Add vector argument
+    parser.add_argument('--vector', action='store_true', help='Draw the graphs as vector images (SVG) rather than PNGs')
+    # Add parallel sections argument
+    parser.add_argument('--parallel-sections', action='store_true', help=f'Render the appendix sections on a pool of processes and merge them into the report; appendices under {PARALLEL_SECTIONS_MIN_PAGES} pages are rendered in one process')
+    # Add image dpi argument
+    parser.add_argument('--image-dpi', action='store', type=int, help='Downsample the raster images of the report to the given resolution, in dots per inch')
+    # Console arguments
+    args = parser.parse_args()
+    
+    # Generate report
+    generate_report(args.file, args.network_name, float(args.latitude), float(args.longitude), args.city, engine=args.engine, processes=args.processes, map_backend=args.map_backend, profile=args.profile, cache=not args.no_cache, save_images=not args.no_images, vector=args.vector, parallel_sections=args.parallel_sections, image_dpi=args.image_dpi)
+
+    # Prune artifact cache
+    if not args.no_cache:
+        ac.prune_artifacts()
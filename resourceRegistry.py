@@ -0,0 +1,275 @@
+"""
+Resource Registry.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to keep the start up of the Analytics Engine and pdfWizard short, so table-only runs never pay for the plotting libraries.
+This file defines lazy imports, which import a module (such as MatPlotLib's PyPlot, Plotly, PIL, or FPDF) the first time one of its attributes is used, rather than at import.
+The file also defines a registry of the resource files (such as `text.json` and `recommended_filters.csv`), reading each file once per process and sharing it between the modules that read it.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * Pandas                            * JSON                                  * Copy
+    * ImportLib                         * Threading
+
+Instructions:
+    1) Import the resource registry: `import resourceRegistry as rr`
+    2) Import a module lazily: `plt = rr.LazyImport("matplotlib.pyplot")`
+        a) (Optional) Import a single attribute of a module lazily: `FPDF = rr.LazyImport("fpdf", "FPDF")`
+    3) Read a resource file, shared by every module of the process: `RECOMMENDED_FILTERS = rr.get_resource("resources/recommended_filters.csv")`
+        a) (Optional) Read a private copy of a resource file, to be modified: `TEXT = rr.copy_resource("resources/text.json")`
+    4) Read an API key from `keys.py` when it is first needed: `rr.get_api_key("PK")`
+
+Desired Output:
+    * The imported module, or the contents of the resource file (a dictionary for JSON files, a DataFrame for CSV files).
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Resource Registry - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import pandas as pd                     # Pandas, used to read the CSV resource files as DataFrames.
+import json                             # JSON, used to read the JSON resource files as dictionaries.
+import copy                             # Copy, used to hand out private copies of the resource files.
+import importlib                        # ImportLib, used to import the lazily imported modules when first used.
+import threading                        # Threading, used to read each resource file once when it is first read on many threads.
+
+# MISC CONSTANTS
+API_KEY_MODULE = "keys"                                                                                         # The name of the API Key File, holding the MapBoxAPI keys (PK and SK).
+
+# CACHES
+RESOURCE_CACHE = {}                                                                                             # A dictionary, used to hold the contents of each resource file read; keyed on the path to the file.
+RESOURCE_CACHE_LOCK = threading.Lock()                                                                          # A lock, used to read each resource file once when it is first read on many threads.
+
+
+
+
+# LAZY IMPORT CLASS
+class LazyImport():
+    """
+    A class representing a module, or an attribute of a module, that is imported the first time it is used.
+
+    Attributes:
+        `module_name` (str): The name of the module, such as `matplotlib.pyplot`.
+        `attribute` (str): The name of the attribute of the module stood in for, or None to stand in for the module itself.
+
+    Methods:
+        `resolve`: Imports the module, returning the module or its attribute.
+        `__getattr__`: Returns an attribute of the module or attribute, importing the module first.
+        `__call__`: Calls the module attribute, importing the module first.
+    """
+
+    def __init__(self, module_name: str, attribute: str=None) -> None:
+        """
+        Initializes a new LazyImport instance, without importing the module.
+
+        Args:
+            `module_name` (str): The name of the module.
+            `attribute` (str) [kwargg]: The name of the attribute of the module to stand in for, defaulted to None (the module itself).
+
+        Returns:
+            None.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> plt = LazyImport("matplotlib.pyplot")
+            >>> FPDF = LazyImport("fpdf", "FPDF")
+        """
+        self.module_name = module_name
+        self.attribute = attribute
+        return
+
+    def resolve(self) -> any:
+        """
+        Imports the module, returning the module or its attribute.
+
+        Args:
+            None.
+
+        Returns:
+            `any`: The module, or the attribute of the module.
+
+        Preconditions:
+            None.
+
+        Raises:
+            `ModuleNotFoundError`: If the module is not installed.
+            `AttributeError`: If the module has no such attribute.
+
+        Example:
+            >>> LazyImport("matplotlib.pyplot").resolve()
+            <module 'matplotlib.pyplot' from '...'>
+
+        Additional Information:
+            - The module is imported once per process; later calls are served from `sys.modules`.
+        """
+        module = importlib.import_module(self.module_name)
+        return module if self.attribute is None else getattr(module, self.attribute)
+
+    def __getattr__(self, name: str) -> any:
+        """
+        Returns an attribute of the module (or of the module attribute), importing the module first.
+
+        Args:
+            `name` (str): The name of the attribute.
+
+        Returns:
+            `any`: The attribute.
+
+        Preconditions:
+            None.
+
+        Raises:
+            `AttributeError`: If there is no such attribute.
+
+        Example:
+            >>> plt.subplots()
+            (<Figure size 640x480 with 1 Axes>, <Axes: >)
+
+        Additional Information:
+            - Only called for the attributes not defined by LazyImport itself.
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args: any, **kwargs: any) -> any:
+        """
+        Calls the module attribute, importing the module first.
+
+        Args:
+            `*args` (any): The positional arguments of the call.
+            `**kwargs` (any): The keyword arguments of the call.
+
+        Returns:
+            `any`: The result of the call.
+
+        Preconditions:
+            - The LazyImport must stand in for a callable attribute, such as a class.
+
+        Raises:
+            `TypeError`: If the attribute is not callable.
+
+        Example:
+            >>> FPDF(orientation='P', unit='in', format='letter')
+            <fpdf.fpdf.FPDF object at ...>
+        """
+        return self.resolve()(*args, **kwargs)
+
+
+
+
+# HELPERS
+def load_resource(filepath: str) -> any:
+    """
+    Reads a resource file.
+
+    Args:
+        `filepath` (str): The path to the resource file (JSON or CSV).
+
+    Returns:
+        `any`: A dictionary for a JSON file, or a DataFrame for a CSV file.
+
+    Preconditions:
+        - The `filepath` must be a valid path to a JSON or CSV file.
+
+    Raises:
+        `FileNotFoundError`: If the file does not exist.
+        `ValueError`: If the file is neither a JSON nor a CSV file.
+
+    Example:
+        >>> load_resource("resources/weights.json")["Organization Name"]
+        1
+    """
+    if filepath.endswith(".json"):
+        with open(filepath) as file:
+            return json.load(file)
+    if filepath.endswith(".csv"):
+        return pd.read_csv(filepath)
+    raise ValueError(f"The resource file '{filepath}' is not a JSON or CSV file.")
+
+
+def get_resource(filepath: str) -> any:
+    """
+    Returns the contents of a resource file, reading it on first use and sharing it for the rest of the process.
+
+    Args:
+        `filepath` (str): The path to the resource file (JSON or CSV).
+
+    Returns:
+        `any`: A dictionary for a JSON file, or a DataFrame for a CSV file; the same object on every call.
+
+    Preconditions:
+        - The returned object is shared, and must not be modified; use `copy_resource` for a copy that can be.
+
+    Raises:
+        `FileNotFoundError`: If the file does not exist.
+        `ValueError`: If the file is neither a JSON nor a CSV file.
+
+    Example:
+        >>> get_resource("resources/recommended_filters.csv") is get_resource("resources/recommended_filters.csv")
+        True
+    """
+    if filepath not in RESOURCE_CACHE:
+        with RESOURCE_CACHE_LOCK:
+            if filepath not in RESOURCE_CACHE:
+                RESOURCE_CACHE[filepath] = load_resource(filepath)
+    return RESOURCE_CACHE[filepath]
+
+
+def copy_resource(filepath: str) -> any:
+    """
+    Returns a private copy of the contents of a resource file, reading the file only if no module has read it yet.
+
+    Args:
+        `filepath` (str): The path to the resource file (JSON or CSV).
+
+    Returns:
+        `any`: A deep copy of the dictionary or DataFrame, free to be modified.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `FileNotFoundError`: If the file does not exist.
+        `ValueError`: If the file is neither a JSON nor a CSV file.
+
+    Example:
+        >>> TEXT = copy_resource("resources/text.json")
+        >>> TEXT["NETWORK OVERVIEW"]["paragraph"] = "..."       # Other modules are unaffected
+    """
+    return copy.deepcopy(get_resource(filepath))
+
+
+def get_api_key(name: str) -> str:
+    """
+    Returns an API key from the API Key File, importing the file when a key is first needed.
+
+    Args:
+        `name` (str): The name of the key, `PK` or `SK`.
+
+    Returns:
+        `str`: The API key.
+
+    Preconditions:
+        - The API Key File (`keys.py`) must exist in the root directory (see `analyticsEngine.py`).
+
+    Raises:
+        `ModuleNotFoundError`: If the API Key File does not exist.
+        `AttributeError`: If the API Key File does not define the key.
+
+    Example:
+        >>> get_api_key("PK")
+        'pk.eyJ1Ijo...'
+
+    Additional Information:
+        - Reports drawn entirely from cached map tiles, and runs without maps, never read the API Key File.
+    """
+    return getattr(importlib.import_module(API_KEY_MODULE), name)
@@ -0,0 +1,236 @@
+"""
+Stage Profiler.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to measure the stages of a report, finding the functions that dominate the time and memory of a network.
+This file wraps the stages of a module or class (such as the create_*, graph_*, and calculate_* functions of the Analytics Engine) with an opt-in profiler.
+The profiler records the call count, wall time, CPU time, and peak RSS (resident memory) growth of each stage.
+The recorded profile is saved as a JSON file.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * Time                              * JSON                                  * Functools
+    * Sys
+
+Optional Package Imports:
+    * Resource (used to measure the peak RSS, only available on Unix)
+
+Instructions:
+    1) Import the profiler: `import stageProfiler as sp`
+    2) Wrap the stages of a module or class: `sp.enable_profiling(ae, ["create_", "graph_", "calculate_"])`
+    3) Generate the report as usual
+    4) Save the profile: `sp.save_profile(directory + "/profile.json")`
+    5) (Optional) Restore the unwrapped stages: `sp.disable_profiling()`
+
+Desired Output:
+    * A JSON file containing each stage of the report, ordered by wall time, with its call count, wall time, CPU time, and peak RSS growth.
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Stage Profiler - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import time                             # Time, used to measure the wall time and CPU time of each stage.
+import json                             # JSON, used to save the profile as a JSON file.
+import functools                        # Functools, used to wrap each stage while keeping its name and docstring.
+import sys                              # Sys, used to find the units of the peak RSS on the current platform.
+try:
+    import resource                     # Resource, used to measure the peak RSS of the process; only available on Unix.
+except ImportError:
+    resource = None
+
+# CACHES
+PROFILE = {}                                                                                                    # A dictionary, used to record the measurements of each stage; keyed on the name of the stage.
+ORIGINAL_STAGES = {}                                                                                            # A dictionary, used to restore the unwrapped stages; keyed on the namespace and name of each stage.
+
+
+
+
+# HELPERS
+def get_peak_rss() -> int:
+    """
+    Returns the peak RSS (resident memory) of the current process in kilobytes.
+
+    Args:
+        None.
+
+    Returns:
+        `int`: The peak RSS of the current process in kilobytes, or 0 if the platform cannot measure it.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> get_peak_rss()
+        184320
+
+    Additional Information:
+        - The peak RSS is only available on Unix, through the `resource` module.
+        - macOS reports the peak RSS in bytes and Linux in kilobytes, so the value is converted to kilobytes.
+    """
+    if resource is None:
+        return 0
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss // 1024 if sys.platform == "darwin" else peak_rss
+
+
+def profile_stage(function: callable, name: str) -> callable:
+    """
+    Wraps a stage, recording its measurements in `PROFILE` each time it is called.
+
+    Args:
+        `function` (callable): The stage to wrap.
+        `name` (str): The name of the stage in `PROFILE`.
+
+    Returns:
+        `callable`: The wrapped stage.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> create_location_table = profile_stage(create_location_table, "analyticsEngine.create_location_table")
+
+    Additional Information:
+        - The measurements of a stage include the stages it calls, so the times of nested stages overlap.
+        - The peak RSS growth is the growth of the process' peak RSS during the call; a stage that stays below an earlier peak records 0.
+        - The measurements are recorded even if the stage raises an error.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        peak_rss = get_peak_rss()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stage = PROFILE.setdefault(name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_rss_growth_kb": 0})
+            stage["calls"] += 1
+            stage["wall_seconds"] += time.perf_counter() - wall_start
+            stage["cpu_seconds"] += time.process_time() - cpu_start
+            stage["peak_rss_growth_kb"] += get_peak_rss() - peak_rss
+    return wrapper
+
+
+
+
+# PROFILER
+def enable_profiling(namespace: any, prefixes: list) -> None:
+    """
+    Wraps every stage of a module or class whose name starts with one of the prefixes.
+
+    Args:
+        `namespace` (any): The module or class containing the stages.
+        `prefixes` (list): A list of the prefixes of the stage names.
+
+    Returns:
+        None.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> enable_profiling(ae, ["create_", "graph_", "calculate_"])
+        >>> enable_profiling(pdfConstructor, ["add_", "save_"])
+
+    Additional Information:
+        - The stages are replaced on the namespace, so calls between stages (such as a graph building its table) are measured too.
+        - Stages that are already wrapped are not wrapped again.
+        - The stages are named `{namespace}.{stage}` in the profile.
+    """
+    for name, function in list(vars(namespace).items()):
+        key = (namespace, name)
+        if callable(function) and name.startswith(tuple(prefixes)) and key not in ORIGINAL_STAGES:
+            ORIGINAL_STAGES[key] = function
+            setattr(namespace, name, profile_stage(function, namespace.__name__ + "." + name))
+    return
+
+
+def disable_profiling() -> None:
+    """
+    Restores every stage wrapped by `enable_profiling`.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> disable_profiling()
+    """
+    for (namespace, name), function in ORIGINAL_STAGES.items():
+        setattr(namespace, name, function)
+    ORIGINAL_STAGES.clear()
+    return
+
+
+def clear_profile() -> None:
+    """
+    Clears the measurements recorded in `PROFILE`, keeping the stages wrapped.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+
+    Preconditions:
+        None.
+
+    Raises:
+        None.
+
+    Example:
+        >>> clear_profile()
+    """
+    PROFILE.clear()
+    return
+
+
+def save_profile(filepath: str) -> None:
+    """
+    Saves the measurements recorded in `PROFILE` as a JSON file.
+
+    Args:
+        `filepath` (str): The path to save the profile to (JSON).
+
+    Returns:
+        None.
+
+    Preconditions:
+        - The folder of the `filepath` must exist.
+
+    Raises:
+        None.
+
+    Example:
+        >>> save_profile("data_sample_dataset/profile.json")
+        # {"peak_rss_kb": 412344, "stages": [{"stage": "analyticsEngine.graph_profile_grade", "calls": 1, "wall_seconds": 1.2, ...}, ...]}
+
+    Additional Information:
+        - The stages are ordered by wall time, longest first.
+    """
+    stages = [{"stage": name, **stage} for name, stage in PROFILE.items()]
+    stages.sort(key=lambda stage: stage["wall_seconds"], reverse=True)
+    with open(filepath, "w") as file:
+        json.dump({"peak_rss_kb": get_peak_rss(), "stages": stages}, file, indent=4)
+    return
@@ -0,0 +1,339 @@
+"""
+Tile Cache.
+
+@author Arman Chinai
+@version 1.3.4
+
+The primary purpose of this file is to provide the map tiles drawn beneath the location maps of the Analytics Engine.
+This file defines a pluggable tile provider, which stores every tile it fetches in an on-disk cache keyed by the tile's zoom, column, and row (z/x/y).
+The file also defines a local, file-backed tile server, standing in for the remote tile server so the maps are rendered from the cache.
+Once a network's tiles are cached, the maps of the network are rendered without any network requests.
+
+---> OPERATIONAL INSTRUCTIONS <---
+
+Package Imports:
+    * OS                                * HTTP Server                           * Threading
+    * URLLib
+
+API Keys: (stored in keys.py)
+    * MapBoxAPI Public Key: https://docs.mapbox.com/help/getting-started/access-tokens/
+
+Instructions:
+    1) Import the tile cache: `import tileCache as tc`
+    2) Create a tile provider: `provider = tc.TileProvider("mapbox", tc.TILE_PROVIDERS["mapbox"], token=PK)`
+    3) Start a local tile server: `server = tc.get_tile_server(provider)`
+    4) Use `server.url_template` as the source of a raster map layer.
+    5) (Optional) Create an offline tile provider, which never fetches tiles: `provider = tc.TileProvider("mapbox", tc.TILE_PROVIDERS["mapbox"], offline=True)`
+
+Desired Output:
+    * A folder will be created with the name `resources/tiles/{provider name}`, containing each fetched tile saved as `{z}/{x}/{y}.png`.
+
+Still have questions? Send an email to `arman@vivery.org` with the subject line `Tile Cache - {question}`.
+"""
+
+
+# PACKAGE IMPORTS
+import os                               # OS, used to read and write the cached tiles.
+import urllib.request, urllib.error     # URLLib, used to fetch uncached tiles from the remote tile server.
+import http.server                      # HTTP Server, used to serve the cached tiles to the map renderer.
+import threading                        # Threading, used to run the local tile server alongside the report.
+
+# MISC CONSTANTS
+TILE_CACHE_DIRECTORY = "resources/tiles"                                                                        # Path to the tile cache, holding a folder of tiles for each tile provider.
+TILE_PROVIDERS = {
+    "mapbox": "https://api.mapbox.com/styles/v1/mapbox/streets-v12/tiles/256/{z}/{x}/{y}?access_token={token}",
+    "openstreetmap": "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+}                                                                                                               # A dictionary, used to map the name of each tile provider to the URL template of its tiles.
+TILE_TIMEOUT = 10                                                                                               # The number of seconds to wait for a remote tile before giving up.
+USER_AGENT = "ViveryBulkUploadImportSummary"                                                                    # The user agent sent with each remote tile request.
+
+# CACHES
+TILE_SERVERS = {}                                                                                               # A dictionary, used to reuse one running tile server per tile provider; keyed on the id of the tile provider.
+
+
+
+
+# TILE PROVIDER CLASS
+class TileProvider():
+    """
+    A class representing a source of map tiles, backed by an on-disk tile cache.
+
+    Attributes:
+        `name` (str): The name of the tile provider, used as the folder of its cached tiles.
+        `url_template` (str): The URL template of the remote tiles, containing the fields `{z}`, `{x}`, `{y}`, and optionally `{token}`.
+        `token` (str): The access token of the remote tile server, or a function returning it.
+        `cache_directory` (str): The path to the folder of the cached tiles of the tile provider.
+        `offline` (bool): True if the tile provider only reads cached tiles, else False.
+
+    Methods:
+        `tile_path`: Returns the path to the cached copy of a tile.
+        `get_tile`: Returns a tile, from the cache if possible, else from the remote tile server.
+    """
+
+    def __init__(self, name: str, url_template: str, token: str="", cache_directory: str=TILE_CACHE_DIRECTORY, offline: bool=False) -> None:
+        """
+        Initializes a new TileProvider instance.
+
+        Args:
+            `name` (str): The name of the tile provider.
+            `url_template` (str): The URL template of the remote tiles.
+            `token` (str) [kwargg]: The access token of the remote tile server, or a function returning it (called only when a tile is fetched), defaulted to an empty string.
+            `cache_directory` (str) [kwargg]: The path to the tile cache, defaulted to `TILE_CACHE_DIRECTORY`.
+            `offline` (bool) [kwargg]: True to only read cached tiles, defaulted to False.
+
+        Returns:
+            None.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> provider = TileProvider("mapbox", TILE_PROVIDERS["mapbox"], token=PK)
+        """
+        self.name = name
+        self.url_template = url_template
+        self.token = token
+        self.cache_directory = cache_directory + "/" + name
+        self.offline = offline
+        return
+
+    def tile_path(self, z: int, x: int, y: int) -> str:
+        """
+        Returns the path to the cached copy of a tile.
+
+        Args:
+            `z` (int): The zoom level of the tile.
+            `x` (int): The column of the tile.
+            `y` (int): The row of the tile.
+
+        Returns:
+            `str`: The path to the cached copy of the tile, whether or not it exists.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> provider.tile_path(11, 619, 757)
+            'resources/tiles/mapbox/11/619/757.png'
+        """
+        return f"{self.cache_directory}/{z}/{x}/{y}.png"
+
+    def get_tile(self, z: int, x: int, y: int) -> bytes:
+        """
+        Returns a tile, reading it from the tile cache if possible, else fetching it from the remote tile server and caching it.
+
+        Args:
+            `z` (int): The zoom level of the tile.
+            `x` (int): The column of the tile.
+            `y` (int): The row of the tile.
+
+        Returns:
+            `bytes`: The image of the tile (PNG).
+
+        Preconditions:
+            None.
+
+        Raises:
+            `FileNotFoundError`: If the tile is not cached and the tile provider is offline.
+            `OSError`: If the tile is not cached and cannot be fetched from the remote tile server.
+
+        Example:
+            >>> provider.get_tile(11, 619, 757)
+            b'\\x89PNG\\r\\n...'
+
+        Additional Information:
+            - A tile is never fetched twice, so repeat renders of the same network make no network requests.
+            - The tile is written to a temporary file and then moved into place, so concurrent reports never read a partially written tile.
+        """
+        filepath = self.tile_path(z, x, y)
+        if os.path.isfile(filepath):
+            with open(filepath, "rb") as file:
+                return file.read()
+        if self.offline:
+            raise FileNotFoundError(f"The tile '{z}/{x}/{y}' is not cached in '{self.cache_directory}' and the tile provider '{self.name}' is offline.")
+        request = urllib.request.Request(self.url_template.format(z=z, x=x, y=y, token=self.token() if callable(self.token) else self.token), headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(request, timeout=TILE_TIMEOUT) as response:
+            tile = response.read()
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        temporary_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_filepath, "wb") as file:
+            file.write(tile)
+        os.replace(temporary_filepath, filepath)
+        return tile
+
+
+
+
+# TILE SERVER CLASS
+class TileRequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    A class handling the tile requests of a local tile server, serving `/{z}/{x}/{y}.png` from the tile provider of the server.
+
+    Methods:
+        `do_GET`: Responds to a tile request with the tile, or a 404 error if the tile is unavailable.
+        `log_message`: Silences the request log of the local tile server.
+    """
+
+    def do_GET(self) -> None:
+        """
+        Responds to a tile request with the tile, or a 404 error if the tile is unavailable.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Preconditions:
+            - The server of the request handler must be a `TileServer`.
+
+        Raises:
+            None.
+
+        Example:
+            >>> # GET http://127.0.0.1:{port}/11/619/757.png
+        """
+        try:
+            z, x, y = [int(value) for value in self.path.split("?")[0].removesuffix(".png").strip("/").split("/")]
+            tile = self.server.provider.get_tile(z, x, y)
+        except (ValueError, OSError):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(tile)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(tile)
+        return
+
+    def log_message(self, format: str, *args: any) -> None:
+        """
+        Silences the request log of the local tile server.
+        """
+        return
+
+
+class TileServer(http.server.ThreadingHTTPServer):
+    """
+    A class representing a local, file-backed tile server, standing in for the remote tile server of a tile provider.
+
+    Attributes:
+        `provider` (TileProvider): The tile provider serving the tiles.
+        `url_template` (str): The URL template of the tiles of the local tile server.
+
+    Methods:
+        `start`: Starts the local tile server in a background thread.
+        `stop`: Stops the local tile server.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, provider: TileProvider, port: int=0) -> None:
+        """
+        Initializes a new TileServer instance, bound to the loopback address.
+
+        Args:
+            `provider` (TileProvider): The tile provider serving the tiles.
+            `port` (int) [kwargg]: The port of the local tile server, defaulted to 0 (any free port).
+
+        Returns:
+            None.
+
+        Preconditions:
+            None.
+
+        Raises:
+            `OSError`: If the port is unavailable.
+
+        Example:
+            >>> server = TileServer(provider)
+        """
+        super().__init__(("127.0.0.1", port), TileRequestHandler)
+        self.provider = provider
+        self.url_template = f"http://127.0.0.1:{self.server_address[1]}/{{z}}/{{x}}/{{y}}.png"
+        return
+
+    def start(self) -> None:
+        """
+        Starts the local tile server in a background thread.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Preconditions:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            >>> server.start()
+        """
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return
+
+    def stop(self) -> None:
+        """
+        Stops the local tile server and releases its port.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Preconditions:
+            - The local tile server must be started.
+
+        Raises:
+            None.
+
+        Example:
+            >>> server.stop()
+        """
+        self.shutdown()
+        self.server_close()
+        return
+
+
+
+
+# HELPERS
+def get_tile_server(provider: TileProvider) -> TileServer:
+    """
+    Returns a running local tile server for a tile provider, starting one if none is running.
+
+    Args:
+        `provider` (TileProvider): The tile provider serving the tiles.
+
+    Returns:
+        `TileServer`: A running local tile server, serving the tiles of the tile provider.
+
+    Preconditions:
+        None.
+
+    Raises:
+        `OSError`: If the local tile server cannot be started.
+
+    Example:
+        >>> get_tile_server(provider).url_template
+        'http://127.0.0.1:53124/{z}/{x}/{y}.png'
+
+    Additional Information:
+        - The local tile server is reused by every map of the process, and stops when the process exits.
+    """
+    if id(provider) not in TILE_SERVERS:
+        server = TileServer(provider)
+        server.start()
+        TILE_SERVERS[id(provider)] = server
+    return TILE_SERVERS[id(provider)]